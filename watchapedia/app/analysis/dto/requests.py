@@ -3,8 +3,14 @@ from watchapedia.common.errors import InvalidFieldFormatError
 from typing import Annotated
 from pydantic.functional_validators import AfterValidator
 from fastapi import Query
+from watchapedia.app.analysis.models import ENTITY_TYPES
 
 def validate_analysis_query(search_q: str = Query(...)) -> str:
     if search_q not in ["rating", "preference"]:
         raise InvalidFieldFormatError("search query")
     return search_q
+
+def validate_entity_type(entity_type: str) -> str:
+    if entity_type not in ENTITY_TYPES:
+        raise InvalidFieldFormatError("entity type")
+    return entity_type
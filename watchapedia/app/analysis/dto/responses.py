@@ -1,5 +1,6 @@
 from pydantic import BaseModel
 from collections import OrderedDict
+from datetime import datetime
 
 class UserRatingResponse(BaseModel):
     id: int
@@ -11,6 +12,12 @@ class UserRatingResponse(BaseModel):
     rating_message: str | None
     viewing_time: int | None
     viewing_message: str | None
+    # 전체 유저 중 평균 별점/시청 시간이 이 유저 이상인 비율(%). 주기적으로 갱신되는 스냅샷 기준
+    rating_avg_top_percent: float | None = None
+    viewing_time_top_percent: float | None = None
+    # 마지막 갱신 시각 (리뷰 변경 시 바로 반영되므로 대기 중인 변경 없음)
+    updated_at: datetime | None = None
+    pending_update: bool = False
 
 class UserPreferenceResponse(BaseModel):
     id: int
@@ -19,3 +26,14 @@ class UserPreferenceResponse(BaseModel):
     director_dict: OrderedDict[str, tuple[float, int]] | None
     country_dict: OrderedDict[str, tuple[float, int]] | None
     genre_dict: OrderedDict[str, tuple[float, int]] | None
+    # 선호도 점수의 마지막 재계산 시각과, 아직 반영되지 않은 리뷰 변경이 대기 중인지 여부
+    updated_at: datetime | None = None
+    pending_update: bool = False
+
+
+class PreferenceFanResponse(BaseModel):
+    user_id: int
+    username: str
+    profile_url: str | None
+    score: float
+    movie_cnt: int
@@ -1,4 +1,5 @@
-from sqlalchemy import Integer, ForeignKey, Float, String, JSON
+from datetime import datetime
+from sqlalchemy import Integer, ForeignKey, Float, String, JSON, DateTime, PrimaryKeyConstraint, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from watchapedia.database.common import Base
@@ -9,12 +10,16 @@ class UserRating(Base):
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     user_id: Mapped[int] = mapped_column(Integer, ForeignKey('user.id'), nullable=False, unique=True)
     rating_num: Mapped[int] = mapped_column(Integer, nullable=False)
+    rating_sum: Mapped[float] = mapped_column(Float, nullable=False, default=0.0) # 별점이 있는 리뷰의 별점 합
     rating_avg: Mapped[float] = mapped_column(Float, nullable=True)
     rating_dist: Mapped[dict[float, int]] = mapped_column(JSON, nullable=True)
     rating_mode: Mapped[float] = mapped_column(Float, nullable=True)
     rating_message: Mapped[str] = mapped_column(String(100), nullable=True)
-    viewing_time: Mapped[int] = mapped_column(Integer, nullable=True)
+    viewing_time: Mapped[int] = mapped_column(Integer, nullable=True) # 시간 단위
+    viewing_minutes: Mapped[int] = mapped_column(Integer, nullable=False, default=0) # 리뷰한 영화의 상영 시간 합
     viewing_message: Mapped[str] = mapped_column(String(100), nullable=True)
+    # 마지막으로 갱신된 시각 (리뷰 작성/수정/삭제 시 증감분으로 갱신)
+    updated_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
 
     user: Mapped["User"] = relationship("User", back_populates="user_rating", uselist=False)
 
@@ -24,9 +29,55 @@ class UserPreference(Base):
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     user_id: Mapped[int] = mapped_column(Integer, ForeignKey('user.id'), nullable=False, unique=True)
-    actor_dict: Mapped[dict[int, tuple[float, int]]] = mapped_column(JSON, nullable=True)
-    director_dict: Mapped[dict[int, tuple[float, int]]] = mapped_column(JSON, nullable=True)
-    country_dict: Mapped[dict[int, tuple[float, int]]] = mapped_column(JSON, nullable=True)
-    genre_dict: Mapped[dict[int, tuple[float, int]]] = mapped_column(JSON, nullable=True)
+    # 선호도 점수(UserPreferenceEntry)를 마지막으로 다시 계산한 시각
+    updated_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
 
     user: Mapped["User"] = relationship("User", back_populates="user_preference", uselist=False)
+
+
+# 선호도를 계산하는 대상 종류 (배우, 감독은 participant_id, 장르는 genre_id, 국가는 country_id)
+ENTITY_TYPES = ("actor", "director", "genre", "country")
+
+
+class UserEntityStats(Base):
+    """
+    유저가 리뷰한 영화들의 배우/감독/장르/국가별 누적 집계. 리뷰 작성/수정/삭제 시 증감분만 반영합니다.
+
+    선호도 점수(UserPreferenceEntry)는 이 값과 유저 전체 평균 별점(UserRating)으로 계산합니다.
+    """
+    __tablename__ = 'user_entity_stats'
+
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey('user.id', ondelete='CASCADE'), nullable=False)
+    entity_type: Mapped[str] = mapped_column(String(20), nullable=False)
+    entity_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    rating_sum: Mapped[float] = mapped_column(Float, nullable=False, default=0.0) # 별점이 있는 리뷰의 별점 합
+    rating_cnt: Mapped[int] = mapped_column(Integer, nullable=False, default=0) # 별점이 있는 리뷰 수
+    movie_cnt: Mapped[int] = mapped_column(Integer, nullable=False, default=0) # 리뷰한 영화 수
+
+    __table_args__ = (
+        PrimaryKeyConstraint('user_id', 'entity_type', 'entity_id'),
+    )
+
+
+class UserPreferenceEntry(Base):
+    """
+    유저의 배우/감독/장르/국가별 선호도 점수. 재계산 큐(analysis/worker.py)에서 유저 단위로 다시 씁니다.
+
+    (user_id, entity_type, score) 인덱스로 유저의 상위 N개를, (entity_type, entity_id, score) 인덱스로
+    특정 인물/장르/국가를 가장 선호하는 유저 목록을 range scan으로 조회합니다.
+    """
+    __tablename__ = 'user_preference_entry'
+
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey('user.id', ondelete='CASCADE'), nullable=False)
+    entity_type: Mapped[str] = mapped_column(String(20), nullable=False)
+    entity_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    score: Mapped[float] = mapped_column(Float, nullable=False)
+    movie_cnt: Mapped[int] = mapped_column(Integer, nullable=False) # 리뷰한 영화 수
+
+    user: Mapped["User"] = relationship("User")
+
+    __table_args__ = (
+        PrimaryKeyConstraint('user_id', 'entity_type', 'entity_id'),
+        Index('ix_user_preference_entry_user_score', 'user_id', 'entity_type', 'score', 'entity_id'),
+        Index('ix_user_preference_entry_entity_score', 'entity_type', 'entity_id', 'score', 'user_id'),
+    )
@@ -0,0 +1,75 @@
+"""
+취향분석의 "상위 N%"를 계산하기 위한 전체 유저 시청 시간/평균 별점 스냅샷.
+
+백그라운드 작업이 주기적으로 user_rating의 값을 정렬된 배열로 읽어두고,
+요청에서는 이분 탐색(O(log n))으로 해당 값 이상인 유저의 비율을 계산합니다.
+스냅샷은 워커 프로세스마다 따로 유지되며 최대 갱신 주기만큼 늦게 반영됩니다.
+"""
+import asyncio
+import logging
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from watchapedia.database.connection import session_scope
+from watchapedia.app.analysis.repository import UserRatingRepository
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class PercentileSnapshot:
+    viewing_minutes: list[int] = field(default_factory=list)
+    rating_avgs: list[float] = field(default_factory=list)
+    refreshed_at: datetime | None = None
+
+    def viewing_minutes_top_percent(self, value: int | None) -> float | None:
+        return _top_percent(self.viewing_minutes, value)
+
+    def rating_avg_top_percent(self, value: float | None) -> float | None:
+        return _top_percent(self.rating_avgs, value)
+
+
+def _top_percent(sorted_values: list, value) -> float | None:
+    # value 이상인 유저의 비율 (본인 포함)
+    if value is None or not sorted_values:
+        return None
+    higher_or_equal = len(sorted_values) - bisect_left(sorted_values, value)
+    return round(max(higher_or_equal, 1) / len(sorted_values) * 100, 2)
+
+
+# 요청에서는 읽기만 하고, 갱신은 객체를 통째로 바꿔서 반영
+_snapshot = PercentileSnapshot()
+
+
+def get_percentile_snapshot() -> PercentileSnapshot:
+    return _snapshot
+
+
+def refresh_percentile_snapshot() -> PercentileSnapshot:
+    global _snapshot
+    with session_scope() as session:
+        user_rating_repository = UserRatingRepository(session)
+        _snapshot = PercentileSnapshot(
+            viewing_minutes=user_rating_repository.get_sorted_viewing_minutes(),
+            rating_avgs=user_rating_repository.get_sorted_rating_avgs(),
+            refreshed_at=datetime.now()
+        )
+    return _snapshot
+
+
+async def _refresh() -> None:
+    try:
+        await asyncio.to_thread(refresh_percentile_snapshot)
+    except Exception:
+        # 이전 스냅샷을 그대로 사용하고 다음 주기에 다시 시도
+        logger.exception("Failed to refresh percentile snapshot")
+
+
+async def run_percentile_refresher(interval: float) -> None:
+    """
+    시작 시 한 번, 이후 interval초마다 스냅샷을 다시 읽는 백그라운드 작업.
+    """
+    while True:
+        await _refresh()
+        await asyncio.sleep(interval)
@@ -0,0 +1,63 @@
+"""
+리뷰 작성/수정/삭제 후의 선호도 점수(UserPreferenceEntry) 재계산 큐.
+
+요청에서는 user_id만 기록하고 응답합니다. 트랜잭션이 커밋된 뒤에만 큐에 들어가며,
+백그라운드 작업(analysis/worker.py)이 주기적으로 큐를 비우면서 유저마다 한 번씩만 다시 계산합니다.
+그 사이 같은 유저의 리뷰 변경이 여러 번 있었다면 한 번의 재계산으로 합쳐집니다.
+
+큐는 워커 프로세스마다 따로 있으므로 pending 여부는 해당 프로세스가 받은 변경만 반영하고,
+프로세스가 비정상 종료되면 대기 중이던 재계산은 유실됩니다. (해당 유저의 다음 리뷰 변경 때 다시 계산됨)
+"""
+import threading
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+_SESSION_UPDATES_KEY = "analysis_updates"
+
+
+class AnalysisQueue:
+    """
+    재계산이 필요한 유저 id를 모아두는 프로세스 내 큐.
+    """
+    def __init__(self) -> None:
+        self._pending: set[int] = set()
+        # drain 이후 재계산이 커밋되기 전까지의 유저 (이 동안에도 pending으로 보고)
+        self._in_progress: set[int] = set()
+        self._lock = threading.Lock()
+
+    def add(self, user_id: int) -> None:
+        with self._lock:
+            self._pending.add(user_id)
+
+    def is_pending(self, user_id: int) -> bool:
+        with self._lock:
+            return user_id in self._pending or user_id in self._in_progress
+
+    def drain(self) -> set[int]:
+        with self._lock:
+            pending, self._pending = self._pending, set()
+            self._in_progress.update(pending)
+        return pending
+
+    def done(self, user_id: int) -> None:
+        with self._lock:
+            self._in_progress.discard(user_id)
+
+
+analysis_queue = AnalysisQueue()
+
+
+def enqueue_analysis_update(session: Session, user_id: int) -> None:
+    # 커밋된 경우에만 큐에 들어가도록 세션에 보관 (롤백되면 버려짐)
+    session.info.setdefault(_SESSION_UPDATES_KEY, set()).add(user_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _move_updates_to_queue(session: Session) -> None:
+    for user_id in session.info.pop(_SESSION_UPDATES_KEY, ()):
+        analysis_queue.add(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_updates(session: Session) -> None:
+    session.info.pop(_SESSION_UPDATES_KEY, None)
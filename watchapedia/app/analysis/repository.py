@@ -1,40 +1,39 @@
-from sqlalchemy.orm import Session
-from sqlalchemy import func, select, cast, Float, or_
+import math
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm.attributes import flag_modified
+from sqlalchemy import Float, Table, case, delete, func, insert, literal, or_, select, union_all
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from fastapi import Depends
 
 from watchapedia.database.connection import get_db_session
-from typing import Annotated
-from watchapedia.app.analysis.models import UserRating, UserPreference
+from typing import Annotated, Collection, Sequence
+from watchapedia.app.analysis.models import UserRating, UserPreference, UserEntityStats, UserPreferenceEntry
 from watchapedia.app.review.models import Review
 from watchapedia.app.movie.models import Movie,MovieParticipant
-from watchapedia.app.participant.models import Participant
-from watchapedia.app.genre.models import Genre, MovieGenre
-from watchapedia.app.country.models import Country, MovieCountry
-import math
-import sys
+from watchapedia.app.genre.models import MovieGenre
+from watchapedia.app.country.models import MovieCountry
+from watchapedia.common.pagination import Pagination
+from datetime import datetime
+
+_ACTOR_ROLE = or_(
+    MovieParticipant.role.like("%주연%"),
+    MovieParticipant.role.like("%조연%"),
+    MovieParticipant.role.like("%단역%")
+)
+# entity_type: (entity id 컬럼, 연결 테이블의 movie_id 컬럼, 추가 조건)
+_ENTITY_SOURCES = {
+    "actor": (MovieParticipant.participant_id, MovieParticipant.movie_id, _ACTOR_ROLE),
+    "director": (MovieParticipant.participant_id, MovieParticipant.movie_id, MovieParticipant.role.like("%감독%")),
+    "genre": (MovieGenre.genre_id, MovieGenre.movie_id, None),
+    "country": (MovieCountry.country_id, MovieCountry.movie_id, None),
+}
 
 
 class UserPreferenceRepository():
     def __init__(self, session: Annotated[Session, Depends(get_db_session)]) -> None:
         self.session = session
 
-    def update_preference(
-            self,
-            user_preference: UserPreference,
-            actor_dict: dict[int, tuple[float, int]],
-            director_dict: dict[int, tuple[float, int]],
-            country_dict: dict[int, tuple[float, int]],
-            genre_dict: dict[int, tuple[float, int]]
-            ) -> UserPreference:
-        user_preference.actor_dict = actor_dict
-        user_preference.director_dict = director_dict
-        user_preference.country_dict = country_dict
-        user_preference.genre_dict = genre_dict
-
-        self.session.flush()
-
-        return user_preference
-
     def get_user_preference_by_user_id(
             self,
             user_id: int
@@ -42,246 +41,203 @@ class UserPreferenceRepository():
         get_preference_query = select(UserPreference).where(UserPreference.user_id == user_id)
         return self.session.scalar(get_preference_query)
 
-
-    def update_user_preference_actor(
-        self,
-        user_id: int,
-        movie_id: int,
-        user_rating: UserRating,
-        review_list: list[Review]
-        ) -> tuple[dict, dict, dict, dict]:
-        # 0. 전체 평가한 영화 수 계산(공통값)
-        rating_avg_tot = user_rating.rating_avg
-        rating_num_tot = user_rating.rating_num
-
-        # 1. actor_list : 영화에 출연한 배우들 id
-            # review/service 함수로 review_id로 review 얻고(service에서) 이를 통해 movie_id 얻기
-        actor_list = [
-                actor_id for (actor_id,) in 
-                self.session.query(Participant.id)
-                .join(MovieParticipant)
-                .filter(MovieParticipant.movie_id == movie_id)
-                .filter(or_(
-                MovieParticipant.role.like("%주연%"),
-                MovieParticipant.role.like("%조연%"),
-                MovieParticipant.role.like("%단역%")
-                ))
-                .all()] #OK
-
-        director_list = [
-                director_id for (director_id,) in
-                self.session.query(Participant.id)
-                .join(MovieParticipant)
-                .filter(MovieParticipant.movie_id == movie_id)
-                .filter(MovieParticipant.role == "감독")
-                .all()]
-
-        genre_list = [
-                genre_id for (genre_id,) in
-                self.session.query(Genre.id)
-                .join(MovieGenre)
-                .filter(MovieGenre.movie_id == movie_id)
-                .all()] 
-
-        country_list = [
-                country_id for (country_id,) in
-                self.session.query(Country.id)
-                .join(MovieCountry)
-                .filter(MovieCountry.movie_id == movie_id)
-                .all()] 
-
-        # 2. 배우들 하나씩 rating_avg_act / 평가한 배우 영화 수 계산
-        rating_act_dict = dict() #{actor_id: (movie_count, rating_avg) 
-        rating_dir_dict = dict()
-        rating_gen_dict = dict()
-        rating_coun_dict = dict()
-
-        review_movie_ids = [review.movie_id for review in review_list] # 리뷰한 영화 id 목록 OK
-
-        for participant_id in actor_list: # 배우별
-            # 배우로서 출연한 영화목록
-            result = (
-                self.session.query(
-                    func.count(func.distinct(MovieParticipant.movie_id)),  # 출연한 영화 개수
-                    func.avg(Review.rating)  # 평균 평점
+    def get_movie_entities(
+            self,
+            movie_id: int
+            ) -> list[tuple[str, int]]:
+        # 영화의 (entity_type, entity_id) 목록을 한 번의 쿼리로 조회
+        queries = []
+        for entity_type, (entity_column, movie_id_column, condition) in _ENTITY_SOURCES.items():
+            query = select(literal(entity_type), entity_column).where(movie_id_column == movie_id)
+            if condition is not None:
+                query = query.where(condition)
+            queries.append(query)
+        query = union_all(*queries)
+        return [(entity_type, entity_id) for entity_type, entity_id in self.session.execute(query)]
+
+    def update_entity_stats(
+            self,
+            user_id: int,
+            movie_id: int,
+            old_rating: float | None = None,
+            new_rating: float | None = None,
+            movie_cnt_delta: int = 0
+            ) -> None:
+        """
+        리뷰 하나의 변경분(이전 별점 -> 새 별점, 리뷰한 영화 수 증감)만 영화의 배우/감독/장르/국가 집계에 반영합니다.
+        """
+        rating_sum_delta = (new_rating if _is_rated(new_rating) else 0) - (old_rating if _is_rated(old_rating) else 0)
+        rating_cnt_delta = int(_is_rated(new_rating)) - int(_is_rated(old_rating))
+        if not (rating_sum_delta or rating_cnt_delta or movie_cnt_delta):
+            return
+
+        entities = self.get_movie_entities(movie_id)
+        if not entities:
+            return
+        rows = [
+            {
+                "user_id": user_id,
+                "entity_type": entity_type,
+                "entity_id": entity_id,
+                "rating_sum": rating_sum_delta,
+                "rating_cnt": rating_cnt_delta,
+                "movie_cnt": movie_cnt_delta,
+            }
+            for entity_type, entity_id in entities
+        ]
+        # 없으면 INSERT, 있으면 col = col + delta (동시 요청에도 증감이 유실되지 않음)
+        self.session.execute(_upsert_add_statement(self.session, UserEntityStats.__table__), rows)
+
+        if movie_cnt_delta < 0:
+            # 더 이상 리뷰한 영화가 없는 entity는 삭제
+            self.session.execute(
+                delete(UserEntityStats).where(
+                    (UserEntityStats.user_id == user_id)
+                    & (UserEntityStats.movie_cnt <= 0)
                 )
-                .join(MovieParticipant, Review.movie_id == MovieParticipant.movie_id)
-                .filter(MovieParticipant.participant_id == participant_id)
-                .filter(Review.user_id == user_id)
-                .filter(or_(
-                MovieParticipant.role.like("%주연%"),
-                MovieParticipant.role.like("%조연%"),
-                MovieParticipant.role.like("%단역%")
-                ))
-                .filter(MovieParticipant.movie_id.in_(review_movie_ids))  # 리뷰에 있는 영화만 선택
-                .one()  # 단일 결과 반환
             )
-            movie_count_actor = result[0]
-            rating_actor = result[1]
-            rating_act_dict[participant_id] = (movie_count_actor, rating_actor)
-
-        for participant_id in director_list:
-            result = (
-                self.session.query(
-                    func.count(func.distinct(MovieParticipant.movie_id)),
-                    func.avg(Review.rating)
+
+    def rebuild_entity_stats(
+            self,
+            user_id: int
+            ) -> None:
+        """
+        유저의 리뷰 전체로 UserEntityStats를 다시 만듭니다. (증감 반영이 어긋났을 때 복구용)
+        """
+        self.session.execute(delete(UserEntityStats).where(UserEntityStats.user_id == user_id))
+        for entity_type, (entity_column, movie_id_column, condition) in _ENTITY_SOURCES.items():
+            query = (
+                select(
+                    Review.user_id,
+                    literal(entity_type),
+                    entity_column,
+                    func.coalesce(func.sum(case((Review.rating > 0, Review.rating))), 0),
+                    func.count(case((Review.rating > 0, 1))),
+                    func.count(),
                 )
-                .join(MovieParticipant, Review.movie_id == MovieParticipant.movie_id)
-                .filter(MovieParticipant.participant_id == participant_id)
-                .filter(Review.user_id == user_id)
-                .filter(MovieParticipant.role.like("%감독%"))
-                .filter(MovieParticipant.movie_id.in_(review_movie_ids))
-                .one()
+                .select_from(Review)
+                .join(movie_id_column.class_, movie_id_column == Review.movie_id)
+                .where(Review.user_id == user_id)
+                .group_by(Review.user_id, entity_column)
             )
-            movie_count_director = result[0]
-            rating_director = result[1]
-            rating_dir_dict[participant_id] = (movie_count_director, rating_director)
-
-        for genre_id in genre_list: 
-            result = (
-                self.session.query(
-                    func.count(func.distinct(MovieGenre.movie_id)),
-                    func.avg(Review.rating) 
+            if condition is not None:
+                query = query.where(condition)
+            self.session.execute(
+                insert(UserEntityStats).from_select(
+                    ["user_id", "entity_type", "entity_id", "rating_sum", "rating_cnt", "movie_cnt"], query
                 )
-                .join(MovieGenre, Review.movie_id == MovieGenre.movie_id)
-                .filter(MovieGenre.genre_id == genre_id)
-                .filter(Review.user_id == user_id)
-                .filter(MovieGenre.movie_id.in_(review_movie_ids))
-                .one()  
             )
-            movie_count_genre = result[0]
-            rating_genre = result[1]
-            rating_gen_dict[genre_id] = (movie_count_genre, rating_genre)
-
-        for country_id in country_list:
-            result = (
-                self.session.query(
-                    func.count(func.distinct(MovieCountry.movie_id)),
-                    func.avg(Review.rating)
-                )
-                .join(MovieCountry, Review.movie_id == MovieCountry.movie_id)
-                .filter(MovieCountry.country_id == country_id)
-                .filter(Review.user_id == user_id)
-                .filter(MovieCountry.movie_id.in_(review_movie_ids))
-                .one()
+
+    def refresh_preference_entries(
+            self,
+            user_id: int,
+            rating_avg_tot: float | None,
+            rating_num_tot: int
+            ) -> None:
+        """
+        UserEntityStats와 유저 전체 평균 별점으로 선호도 점수를 계산해 유저의 UserPreferenceEntry를 다시 씁니다.
+        """
+        stats_query = select(UserEntityStats).where(
+            (UserEntityStats.user_id == user_id)
+            & (UserEntityStats.movie_cnt > 0)
+        )
+        rows = []
+        for stats in self.session.scalars(stats_query):
+            rating = stats.rating_sum / stats.rating_cnt if stats.rating_cnt > 0 else None
+            rows.append({
+                "user_id": user_id,
+                "entity_type": stats.entity_type,
+                "entity_id": stats.entity_id,
+                "score": _preference_score(stats.movie_cnt, rating, rating_avg_tot, rating_num_tot),
+                "movie_cnt": stats.movie_cnt,
+            })
+
+        self.session.execute(delete(UserPreferenceEntry).where(UserPreferenceEntry.user_id == user_id))
+        if rows:
+            self.session.execute(insert(UserPreferenceEntry), rows)
+
+        user_preference = self.get_user_preference_by_user_id(user_id)
+        if user_preference is not None:
+            user_preference.updated_at = datetime.now()
+        self.session.flush()
+
+    def get_preference_entries(
+            self,
+            user_id: int,
+            entity_type: str,
+            limit: int = 10
+            ) -> Sequence[UserPreferenceEntry]:
+        # ix_user_preference_entry_user_score 인덱스 역순 range scan
+        get_entries_query = (
+            select(UserPreferenceEntry)
+            .where(
+                (UserPreferenceEntry.user_id == user_id)
+                & (UserPreferenceEntry.entity_type == entity_type)
             )
-            movie_count_country = result[0]
-            rating_country = result[1]
-            rating_coun_dict[country_id] = (movie_count_country, rating_country)
-
-
-        # 3. 배우 별 점수 계산 -> 점수 top 10 배우들과 중복없이 set으로 합친후 정렬 -> 상위 10개만 잘라 반환.
-        actor_dict_pre = self.get_user_preference_by_user_id(user_id).actor_dict
-        director_dict_pre = self.get_user_preference_by_user_id(user_id).director_dict
-        genre_dict_pre = self.get_user_preference_by_user_id(user_id).genre_dict
-        country_dict_pre = self.get_user_preference_by_user_id(user_id).country_dict
-
-            # 공식 일단은 간단히
-        if rating_act_dict == None:
-            actor_dict_cur = None
-        else:
-            actor_dict_cur = dict()
-            for pid, (movie_count_actor, rating_actor) in rating_act_dict.items():
-                if movie_count_actor == 0:
-                    pass
-                else:
-                    if rating_actor == 0:
-                        # 해당 영화 리뷰는 있지만, 평점이 없는 경우.
-                        actor_dict_cur[pid] = (50+50*(movie_count_actor/(movie_count_actor+10)), movie_count_actor)
-                    else:
-                        actor_dict_cur[pid] = (max(0, min(100,50+(rating_actor-rating_avg_tot)*100*(movie_count_actor/math.log(rating_num_tot+2))**0.5+50*(movie_count_actor/(movie_count_actor+10)))), movie_count_actor)       
-            #actor_dict_cur = {pid: (max(0, min(100,50+(rating_actor-rating_avg_tot)*100*(movie_count_actor/math.log(rating_num_tot+2))**0.5+50*(movie_count_actor/(movie_count_actor+10)))), movie_count_actor) for pid, (movie_count_actor, rating_actor) in rating_act_dict.items()}
-        if rating_dir_dict == None:
-            director_dict_cur = None
-        else:
-            director_dict_cur = dict()
-            for pid, (movie_count_director, rating_director) in rating_dir_dict.items():
-                if movie_count_director == 0:
-                    pass
-                else:
-                    if rating_director == 0:
-                        director_dict_cur[pid] = (50+50*(movie_count_director/(movie_count_director+10)), movie_count_director)
-                    else:
-                        director_dict_cur[pid] = (max(0, min(100,50+(rating_director-rating_avg_tot)*100*(movie_count_director/math.log(rating_num_tot+2))**0.5+50*(movie_count_director/(movie_count_director+10)))), movie_count_director)
-            #director_dict_cur = {pid: (max(0, min(100,50+(rating_director-rating_avg_tot)*100*(movie_count_director/math.log(rating_num_tot+2))**0.5+50*(movie_count_director/(movie_count_director+10)))), movie_count_director) for pid, (movie_count_director, rating_director) in rating_dir_dict.items()}
-        if rating_gen_dict == None:
-            genre_dict_cur = None
-        else:
-            genre_dict_cur = dict()
-            for pid, (movie_count_genre, rating_genre) in rating_gen_dict.items():
-                if movie_count_genre == 0:
-                    pass
-                else:
-                    if rating_genre == 0:
-                        genre_dict_cur[pid] = (50+50*(movie_count_genre/(movie_count_genre+10)), movie_count_genre)
-                    else:
-                        genre_dict_cur[pid] = (max(0, min(100,50+(rating_genre-rating_avg_tot)*100*(movie_count_genre/math.log(rating_num_tot+2))**0.5+50*(movie_count_genre/(movie_count_genre+10)))), movie_count_genre)
-            #genre_dict_cur = {pid: (max(0, min(100,50+(rating_genre-rating_avg_tot)*100*(movie_count_genre/math.log(rating_num_tot+2))**0.5+50*(movie_count_genre/(movie_count_genre+10)))), movie_count_genre) for pid, (movie_count_genre, rating_genre) in rating_gen_dict.items()}
-        if rating_coun_dict == None:
-            country_dict_cur = None
-        else:
-            country_dict_cur = dict()
-            for pid, (movie_count_country, rating_country) in rating_coun_dict.items():
-                if movie_count_country == 0:
-                    pass
-                else:
-                    if rating_country == 0:
-                        country_dict_cur[pid] = (50+50*(movie_count_country/(movie_count_country+10)), movie_count_country)
-                    else:
-                        country_dict_cur[pid] = (max(0, min(100,50+(rating_country-rating_avg_tot)*100*(movie_count_country/math.log(rating_num_tot+2))**0.5+50*(movie_count_country/(movie_count_country+10)))), movie_count_country)
-            #country_dict_cur = {pid: (max(0, min(100,50+(rating_country-rating_avg_tot)*100*(movie_count_country/math.log(rating_num_tot+2))**0.5+50*(movie_count_country/(movie_count_country+10)))), movie_count_country) for pid, (movie_count_country, rating_country) in rating_coun_dict.items()}
-
-        if actor_dict_pre:
-            actor_dict_pre = {int(k): v for k, v in actor_dict_pre.items()} #json 직렬화에 의한 key str 변환 보정.
-            if len(actor_dict_cur) == 0:
-                merged_actor_dict = actor_dict_pre
-            else:
-                merged_actor_dict = {**actor_dict_pre, **actor_dict_cur}  # actor_dict_cur이 우선 적용됨
-        else: # 처음 추가하는거라 none인 상태
-            merged_actor_dict = actor_dict_cur
-        if director_dict_pre:
-            director_dict_pre = {int(k): v for k, v in director_dict_pre.items()}
-            if len(director_dict_cur) == 0:
-                merged_director_dict = director_dict_pre
-            else:
-                merged_director_dict = {**director_dict_pre, **director_dict_cur}
-        else:
-            merged_director_dict = director_dict_cur
-        if genre_dict_pre:
-            genre_dict_pre = {int(k): v for k, v in genre_dict_pre.items()}
-            if len(genre_dict_cur) == 0:
-                merged_genre_dict = genre_dict_pre
-            else:
-                merged_genre_dict = {**genre_dict_pre, **genre_dict_cur}
-        else:
-            merged_genre_dict = genre_dict_cur
-        if country_dict_pre:
-            country_dict_pre = {int(k): v for k, v in country_dict_pre.items()}
-            if len(country_dict_cur) == 0:
-                merged_country_dict = country_dict_pre
-            else:
-                merged_country_dict = {**country_dict_pre, **country_dict_cur}
-        else:
-            merged_country_dict = country_dict_cur
-
-        if merged_actor_dict == None:
-            actor_dict_update = None
-        else:
-            actor_dict_update = dict(sorted(merged_actor_dict.items(), key=lambda item: item[1][0], reverse=True))
-        if merged_director_dict == None:
-            director_dict_update = None
-        else:
-            director_dict_update = dict(sorted(merged_director_dict.items(), key=lambda item: item[1][0], reverse=True))
-        if merged_genre_dict == None:
-            genre_dict_update = None
-        else:
-            genre_dict_update = dict(sorted(merged_genre_dict.items(), key=lambda item: item[1][0], reverse=True))
-        if merged_country_dict == None:
-            country_dict_update = None
-        else:
-            country_dict_update = dict(sorted(merged_country_dict.items(), key=lambda item: item[1][0], reverse=True))
-
-        return (actor_dict_update, director_dict_update, genre_dict_update, country_dict_update)
+            .order_by(UserPreferenceEntry.score.desc(), UserPreferenceEntry.entity_id.desc())
+            .limit(limit)
+        )
+        return self.session.scalars(get_entries_query).all()
+
+    def get_top_fans(
+            self,
+            entity_type: str,
+            entity_id: int,
+            pagination: Pagination
+            ) -> list[UserPreferenceEntry]:
+        # ix_user_preference_entry_entity_score 인덱스 역순 range scan, 유저는 같은 쿼리에서 JOIN
+        get_fans_query = (
+            select(UserPreferenceEntry)
+            .options(joinedload(UserPreferenceEntry.user))
+            .where(
+                (UserPreferenceEntry.entity_type == entity_type)
+                & (UserPreferenceEntry.entity_id == entity_id)
+            )
+        )
+        return pagination.fetch(
+            self.session, get_fans_query, UserPreferenceEntry.score, UserPreferenceEntry.user_id, descending=True
+        )
+
+
+def _is_rated(rating: float | None) -> bool:
+    return rating is not None and rating > 0
+
+
+def _rating_dist_key(rating: float) -> str:
+    # 0.5 단위 구간
+    return f"{round(rating * 2) / 2:.1f}"
+
+
+def _empty_rating_dist() -> dict[str, int]:
+    return {_rating_dist_key(i / 2): 0 for i in range(1, 11)}
+
+
+def _preference_score(
+        movie_count: int,
+        rating: float | None,
+        rating_avg_tot: float | None,
+        rating_num_tot: int
+        ) -> float:
+    # 공식 일단은 간단히
+    if not rating or rating_avg_tot is None:
+        # 해당 영화 리뷰는 있지만, 평점이 없는 경우.
+        return 50+50*(movie_count/(movie_count+10))
+    return max(0, min(100, 50+(rating-rating_avg_tot)*100*(movie_count/math.log(rating_num_tot+2))**0.5+50*(movie_count/(movie_count+10))))
+
+
+def _upsert_add_statement(session: Session, table: Table):
+    # PK가 겹치면 값 컬럼에 새 값을 더하는 INSERT 문 (MySQL: ON DUPLICATE KEY UPDATE, SQLite: ON CONFLICT)
+    value_columns = [column.name for column in table.columns if not column.primary_key]
+    if session.get_bind(clause=table.insert()).dialect.name == "mysql":
+        stmt = mysql_insert(table)
+        return stmt.on_duplicate_key_update(
+            {name: table.c[name] + stmt.inserted[name] for name in value_columns}
+        )
+    stmt = sqlite_insert(table)
+    return stmt.on_conflict_do_update(
+        index_elements=[column.name for column in table.primary_key],
+        set_={name: table.c[name] + stmt.excluded[name] for name in value_columns}
+    )
 
 class UserRatingRepository():
     def __init__(self, session: Annotated[Session, Depends(get_db_session)]) -> None:
@@ -307,26 +263,74 @@ class UserRatingRepository():
     def update_rating(
             self, 
             user_rating: UserRating, 
-            rating_num: int, 
             rating_avg: float, 
-            rating_dist: dict[float, int], 
             rating_mode: float,
             rating_message: str,
             viewing_time: int,
             viewing_message: str
             ) -> UserRating:
-        user_rating.rating_num = rating_num
         user_rating.rating_avg = rating_avg
-        user_rating.rating_dist = rating_dist
         user_rating.rating_mode = rating_mode
         user_rating.rating_message = rating_message
         user_rating.viewing_time = viewing_time
         user_rating.viewing_message = viewing_message
+        user_rating.updated_at = datetime.now()
 
         self.session.flush()
 
         return user_rating
 
+    def set_rating_stats(
+            self,
+            user_rating: UserRating,
+            rating_num: int,
+            rating_sum: float,
+            rating_dist: dict[str, int],
+            viewing_minutes: int
+            ) -> None:
+        user_rating.rating_num = rating_num
+        user_rating.rating_sum = rating_sum
+        user_rating.rating_dist = rating_dist
+        user_rating.viewing_minutes = viewing_minutes
+
+    def update_rating_stats(
+            self,
+            user_id: int,
+            old_rating: float | None = None,
+            new_rating: float | None = None,
+            viewing_minutes_delta: int = 0
+            ) -> UserRating:
+        """
+        리뷰 하나의 변경분(이전 별점 -> 새 별점, 시청 시간 증감)만 별점 수/합/분포와 시청 시간에 반영합니다.
+        """
+        user_rating = self._get_user_rating_for_update(user_id)
+        dist = _empty_rating_dist()
+        dist.update(user_rating.rating_dist or {})
+        if _is_rated(old_rating):
+            user_rating.rating_num -= 1
+            user_rating.rating_sum -= old_rating
+            key = _rating_dist_key(old_rating)
+            dist[key] = max(dist.get(key, 0) - 1, 0)
+        if _is_rated(new_rating):
+            user_rating.rating_num += 1
+            user_rating.rating_sum += new_rating
+            key = _rating_dist_key(new_rating)
+            dist[key] = dist.get(key, 0) + 1
+        user_rating.rating_dist = dist
+        flag_modified(user_rating, "rating_dist")
+        user_rating.viewing_minutes += viewing_minutes_delta
+        return user_rating
+
+    def _get_user_rating_for_update(self, user_id: int) -> UserRating:
+        # 같은 유저의 동시 리뷰 작성 시 증감이 유실되지 않도록 row lock
+        get_rating_query = (
+            select(UserRating)
+            .where(UserRating.user_id == user_id)
+            .with_for_update()
+            .execution_options(populate_existing=True)
+        )
+        return self.session.scalar(get_rating_query)
+
     def get_user_rating_by_user_id(
             self,
             user_id: int
@@ -334,7 +338,66 @@ class UserRatingRepository():
         get_rating_query = select(UserRating).where(UserRating.user_id == user_id)
         return self.session.scalar(get_rating_query)
 
-    def get_user_viewing_time(
+    def get_sorted_viewing_minutes(self) -> list[int]:
+        # 리뷰한 영화가 있는 유저만
+        get_minutes_query = (
+            select(UserRating.viewing_minutes)
+            .where(UserRating.viewing_minutes > 0)
+            .order_by(UserRating.viewing_minutes)
+        )
+        return list(self.session.scalars(get_minutes_query))
+
+    def get_sorted_rating_avgs(self) -> list[float]:
+        get_avgs_query = (
+            select(UserRating.rating_avg)
+            .where(UserRating.rating_avg.isnot(None))
+            .order_by(UserRating.rating_avg)
+        )
+        return list(self.session.scalars(get_avgs_query))
+
+    def get_user_ratings_for_update(
+            self,
+            user_ids: Collection[int]
+            ) -> Sequence[UserRating]:
+        get_ratings_query = (
+            select(UserRating)
+            .where(UserRating.user_id.in_(user_ids))
+            .with_for_update()
+            .execution_options(populate_existing=True)
+        )
+        return self.session.scalars(get_ratings_query).all()
+
+    def get_rating_stats_by_user_ids(
+            self,
+            user_ids: Collection[int]
+            ) -> dict[int, tuple[int, float, dict[str, int], int]]:
+        """
+        리뷰 전체에서 유저별 (별점 수, 별점 합, 별점 분포, 시청 시간(분))을 계산합니다. 유저 목록 전체에 대해 GROUP BY 두 번으로 조회합니다.
+        """
+        stats = {user_id: [0, 0.0, _empty_rating_dist(), 0] for user_id in user_ids}
+        dist_query = (
+            select(Review.user_id, Review.rating, func.count())
+            .where(Review.user_id.in_(user_ids), Review.rating > 0)
+            .group_by(Review.user_id, Review.rating)
+        )
+        for user_id, rating, count in self.session.execute(dist_query):
+            user_stats = stats[user_id]
+            user_stats[0] += count
+            user_stats[1] += rating * count
+            key = _rating_dist_key(rating)
+            user_stats[2][key] = user_stats[2].get(key, 0) + count
+
+        viewing_query = (
+            select(Review.user_id, func.sum(Movie.running_time))
+            .join(Movie, Review.movie_id == Movie.id)
+            .where(Review.user_id.in_(user_ids))
+            .group_by(Review.user_id)
+        )
+        for user_id, minutes in self.session.execute(viewing_query):
+            stats[user_id][3] = minutes or 0
+        return {user_id: tuple(user_stats) for user_id, user_stats in stats.items()}
+
+    def get_user_viewing_minutes(
             self,
             user_id: int
             ) -> int:
@@ -345,12 +408,7 @@ class UserRatingRepository():
             .filter(Review.user_id == user_id)  # 특정 유저가 작성한 리뷰만 선택
             .scalar()  # 단일 값 반환
         )
-
-        if total_running_time == None:
-            return 0
-        else:
-            total_running_hour = total_running_time // 60
-            return total_running_hour
+        return total_running_time or 0
 
 
     def get_user_rating_metrices(
@@ -360,7 +418,8 @@ class UserRatingRepository():
 
         query = self.session.query(
             func.count(Review.id).label("count"),
-            func.avg(Review.rating).cast(Float).label("average")
+            func.avg(Review.rating).cast(Float).label("average"),
+            func.sum(Review.rating).cast(Float).label("sum")
         ).filter(Review.user_id == user_id, Review.rating.isnot(None), Review.rating !=0)
 
         result = query.first()
@@ -368,7 +427,8 @@ class UserRatingRepository():
 
         return {
                 "rating_num": result.count,
-                "rating_avg": result.average
+                "rating_avg": result.average,
+                "rating_sum": result.sum or 0.0
                 }
 
     def get_user_rating_dist(
@@ -383,7 +443,8 @@ class UserRatingRepository():
                 .all()
                 )
 
-        rating_counts = {round(i/2, 1): 0 for i in range(1, 11)}
+        rating_counts = _empty_rating_dist()
         for row in distribution:
-            rating_counts[row.rating] = row.count
+            key = _rating_dist_key(row.rating)
+            rating_counts[key] = rating_counts.get(key, 0) + row.count
         return rating_counts
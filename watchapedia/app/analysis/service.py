@@ -1,9 +1,13 @@
+import math
 from typing import Annotated
 from fastapi import Depends
-from watchapedia.app.analysis.models import UserRating, UserPreference
+from watchapedia.app.analysis.models import UserRating, UserPreference, UserPreferenceEntry, ENTITY_TYPES
 from watchapedia.app.analysis.repository import UserRatingRepository
-from watchapedia.app.analysis.dto.responses import UserRatingResponse
+from watchapedia.app.analysis.dto.responses import UserRatingResponse, UserPreferenceResponse, PreferenceFanResponse
 from watchapedia.app.analysis.repository import UserPreferenceRepository
+from watchapedia.app.analysis.queue import analysis_queue
+from watchapedia.app.analysis.percentile import get_percentile_snapshot
+from watchapedia.common.pagination import Pagination
 from watchapedia.app.review.repository import ReviewRepository
 
 from collections import OrderedDict  
@@ -36,62 +40,69 @@ class UserPreferenceService():
             genre_dict: OrderedDict | None,
             country_dict: OrderedDict | None
             ) -> tuple[OrderedDict]:
+        # id -> 이름은 종류별로 한 번에 조회 (배우와 감독은 participant 조회 한 번으로 합침)
+        participant_names = self.participant_repository.get_participant_names(
+            [*(actor_dict or ()), *(director_dict or ())]
+        )
+        genre_names = self.genre_repository.get_genre_names(genre_dict or ())
+        country_names = self.country_repository.get_country_names(country_dict or ())
+        return (
+            _transform_dict(actor_dict, participant_names),
+            _transform_dict(director_dict, participant_names),
+            _transform_dict(genre_dict, genre_names),
+            _transform_dict(country_dict, country_names)
+        )
 
-        actor_dict_transform = OrderedDict()
-        director_dict_transform = OrderedDict()
-        genre_dict_transform = OrderedDict()
-        country_dict_transform = OrderedDict()
-        if actor_dict == None or len(actor_dict) == 0:
-            actor_dict_transform = None
-        else:
-            for actor_id, value in actor_dict.items():
-                actor = self.participant_repository.get_participant_by_id(actor_id)
-                actor_dict_transform[actor.name] = value
-        if director_dict == None or len(director_dict)==0:
-
-            director_dict_transform = None
-        else:
-            for director_id, value in director_dict.items():
-                director = self.participant_repository.get_participant_by_id(director_id)
-                director_dict_transform[director.name] = value
+    def get_preference_dict(self,
+            user_id: int,
+            entity_type: str,
+            limit: int = 10
+            ) -> OrderedDict[int, tuple[float, int]]:
+        # 점수 상위 limit개를 {entity_id: (점수, 리뷰한 영화 수)}로 반환
+        entries = self.user_preference_repository.get_preference_entries(user_id, entity_type, limit)
+        return OrderedDict((entry.entity_id, (entry.score, entry.movie_cnt)) for entry in entries)
 
-        if genre_dict == None or len(genre_dict)==0:
-            genre_dict_transform = None
-        else:
-            for genre_id, value in genre_dict.items():
-                genre = self.genre_repository.get_genre_by_id(genre_id)
-                genre_dict_transform[genre.name] = value
+    def get_user_preference(self,
+            user_id: int
+            ) -> UserPreferenceResponse:
+        user_preference = self.user_preference_repository.get_user_preference_by_user_id(user_id)
+        actor_dict, director_dict, genre_dict, country_dict = (
+            self.get_preference_dict(user_id, entity_type) for entity_type in ENTITY_TYPES
+        )
+        actor_dict_transform, director_dict_transform, genre_dict_transform, country_dict_transform = self.get_transform_dict(actor_dict, director_dict, genre_dict, country_dict)
 
-        if country_dict == None or len(country_dict)==0:
-            country_dict_transform = None
-        else:
-            for country_id, value in country_dict.items():
-                country = self.country_repository.get_country_by_id(country_id)
-                country_dict_transform[country.name] =value
-        return (actor_dict_transform, director_dict_transform, genre_dict_transform, country_dict_transform)
-    
-    def update_preference(self,
-            user_id,
-            review_id,
-            delete=False,
-            movie_id=None) -> None:
-        if delete == False: # review create, update
-            recent_review = self.review_repository.get_review_by_review_id(review_id) #OK
-            movie_id = recent_review.movie_id #OK
-        review_list = self.review_repository.get_reviews_by_user_id(user_id)
-        user_rating = self.user_rating_repository.get_user_rating_by_user_id(user_id)
+        return UserPreferenceResponse(
+                id=user_preference.id,
+                user_id=user_id,
+                actor_dict=actor_dict_transform,
+                director_dict=director_dict_transform,
+                country_dict=country_dict_transform,
+                genre_dict=genre_dict_transform,
+                updated_at=user_preference.updated_at,
+                pending_update=analysis_queue.is_pending(user_id))
 
-
-        user_preference = self.user_preference_repository.get_user_preference_by_user_id(user_id)
-        actor_dict, director_dict, genre_dict, country_dict = self.user_preference_repository.update_user_preference_actor(user_id, movie_id, user_rating, review_list)
-        self.user_preference_repository.update_preference(user_preference, actor_dict, director_dict, country_dict, genre_dict) # UserPreferece 반환(우선은 None처리)
-        #self.user_preference_repository.update_preference(user_preference, test)
+    def get_top_fans(self,
+            entity_type: str,
+            entity_id: int,
+            pagination: Pagination
+            ) -> list[PreferenceFanResponse]:
+        entries = self.user_preference_repository.get_top_fans(entity_type, entity_id, pagination)
+        return [self._process_fan_response(entry) for entry in entries]
 
     def get_user_preference_by_user_id(self,
             user_id
             ) -> UserPreference:
         return self.user_preference_repository.get_user_preference_by_user_id(user_id)
 
+    def _process_fan_response(self, entry: UserPreferenceEntry) -> PreferenceFanResponse:
+        return PreferenceFanResponse(
+                user_id=entry.user_id,
+                username=entry.user.username,
+                profile_url=entry.user.profile_url,
+                score=entry.score,
+                movie_cnt=entry.movie_cnt
+                )
+
 class UserRatingService():
     def __init__(self,
             user_rating_repository: Annotated[UserRatingRepository, Depends()]
@@ -108,27 +119,67 @@ class UserRatingService():
             self,
             user_id: int
             ) -> None:
+        # 리뷰 전체로 다시 계산 (증감 반영이 어긋났을 때 복구용)
         user_rating = self.user_rating_repository.get_user_rating_by_user_id(user_id)
-        # user_rating - user 연결 logic 어딘가에 구현 필요
-        # 혹은 get_user_by_user_id 이용해서 구현해야 함.
         user_rating_metrices = self.user_rating_repository.get_user_rating_metrices(user_id)
         user_rating_dist = self.user_rating_repository.get_user_rating_dist(user_id)
-        user_viewing_time = self.user_rating_repository.get_user_viewing_time(user_id)
+        user_viewing_minutes = self.user_rating_repository.get_user_viewing_minutes(user_id)
 
-        rating_num = user_rating_metrices["rating_num"]
-        rating_avg = user_rating_metrices["rating_avg"]
-        rating_message = self.get_user_rating_message(rating_avg)
-        rating_dist_dict = user_rating_dist
-        viewing_message = self.get_user_viewing_message(user_viewing_time)
+        self.user_rating_repository.set_rating_stats(
+            user_rating,
+            rating_num=user_rating_metrices["rating_num"],
+            rating_sum=user_rating_metrices["rating_sum"],
+            rating_dist=user_rating_dist,
+            viewing_minutes=user_viewing_minutes
+        )
+        update_rating = self._update_rating_summary(user_rating)
 
-        if rating_dist_dict:
-            rating_mode = max(rating_dist_dict, key=rating_dist_dict.get)
-        else:
-            rating_mode = None
+        return self._process_user_rating_response(user_id=user_id, user_rating=update_rating)
 
-        update_rating = self.user_rating_repository.update_rating(user_rating, rating_num, rating_avg, rating_dist_dict, rating_mode, rating_message, user_viewing_time, viewing_message)
+    def apply_review_change(
+            self,
+            user_id: int,
+            old_rating: float | None = None,
+            new_rating: float | None = None,
+            viewing_minutes_delta: int = 0
+            ) -> None:
+        """
+        리뷰 작성/수정/삭제 시 해당 리뷰의 변경분만 별점 통계와 시청 시간에 반영합니다.
+        """
+        user_rating = self.user_rating_repository.update_rating_stats(
+            user_id, old_rating, new_rating, viewing_minutes_delta
+        )
+        self._update_rating_summary(user_rating)
 
-        return self._process_user_rating_response(user_id=user_id, user_rating=update_rating)
+    def reconcile_rating_stats(
+            self,
+            user_ids: list[int],
+            dry_run: bool = False
+            ) -> int:
+        """
+        증감분으로 유지한 별점 통계를 리뷰 전체에서 계산한 값과 비교해 어긋난 유저를 바로잡고, 그 수를 반환합니다.
+        통계가 맞더라도 평균/최빈값/메시지 같은 요약 값이 현재 계산 방식과 다르면 함께 다시 계산합니다.
+        """
+        expected_stats = self.user_rating_repository.get_rating_stats_by_user_ids(user_ids)
+        fixed = 0
+        for user_rating in self.user_rating_repository.get_user_ratings_for_update(user_ids):
+            rating_num, rating_sum, rating_dist, viewing_minutes = expected_stats[user_rating.user_id]
+            stats_matched = (
+                user_rating.rating_num == rating_num
+                and math.isclose(user_rating.rating_sum, rating_sum, abs_tol=1e-6)
+                and _nonzero_counts(user_rating.rating_dist) == _nonzero_counts(rating_dist)
+                and user_rating.viewing_minutes == viewing_minutes
+            )
+            if stats_matched and not self._is_rating_summary_outdated(user_rating):
+                continue
+            fixed += 1
+            if not dry_run:
+                if not stats_matched:
+                    self.user_rating_repository.set_rating_stats(
+                        user_rating, rating_num, rating_sum, rating_dist, viewing_minutes
+                    )
+                self._update_rating_summary(user_rating)
+        return fixed
 
     def get_user_rating_by_user_id(
             self,
@@ -136,6 +187,13 @@ class UserRatingService():
             ) -> UserRating:
         return self.user_rating_repository.get_user_rating_by_user_id(user_id)
 
+    def get_user_rating(
+            self,
+            user_id: int
+            ) -> UserRatingResponse:
+        user_rating = self.user_rating_repository.get_user_rating_by_user_id(user_id)
+        return self._process_user_rating_response(user_id=user_id, user_rating=user_rating)
+
     def get_user_rating_message(
             self,
             rating_avg: float
@@ -183,13 +241,14 @@ class UserRatingService():
             self,
             viewing_time: int
             ) -> str | None:
-
+        # 메시지는 user_rating에 저장되므로 "상위 N%" 같은 순위는 넣지 않음
+        # (실제 순위는 응답의 viewing_time_top_percent로 스냅샷에서 계산)
         if viewing_time < 100:
             return "평가하는거 나름 되게 재밌는데 어서 더 평가를..."
         elif viewing_time < 200:
             return "영화 본 시간으로 아직 평균에 못 미쳐요ㅠ"
         elif viewing_time < 300:
-            return "상위 30%만큼 영화를 보셨어요. 그래도 상위권!"
+            return "영화 본 시간 200시간 돌파! 이제 어엿한 영화 관객이에요."
         elif viewing_time < 400:
             return "이제 자기만의 영화보는 관점이 생기셨을 거예요."
         elif viewing_time < 500:
@@ -197,15 +256,15 @@ class UserRatingService():
         elif viewing_time < 600:
             return "인생의 3주는 순수하게 영화 본 시간. 대단합니다."
         elif viewing_time < 750:
-            return "일주일에 두 편씩 1년이면 상위 5% 매니아예요."
+            return "일주일에 두 편씩 1년이면 이 정도, 영화 매니아예요."
         elif viewing_time < 800:
             return "단언컨대 이 정도면 어디 가서 영화로 꿀리진 않을겁니다."
         elif viewing_time < 950:
-            return "상위 5% 진입! 공식적인 영화인입니다."
+            return "영화 본 시간 800시간 돌파! 공식적인 영화인입니다."
         elif viewing_time < 1100:
             return "대..대단합니다. 순수 영화 본 시간 1000시간 돌파!"
         elif viewing_time < 1200:
-            return "영화 본 시간으로 상위 3%! 왓챠가 보증하는 영화 내공인!"
+            return "왓챠가 보증하는 영화 내공인!"
         elif viewing_time < 1350:
             return "살면서 순수하게 영화 본 시간 50일 돌파! 상상이 되세요?"
         elif viewing_time < 1500:
@@ -213,9 +272,9 @@ class UserRatingService():
         elif viewing_time < 1600:
             return "영화를 공부하는 영화학도가 보통 이 정도 본답니다."
         elif viewing_time < 1700:
-            return "상위 0.1%의 고지가 저 앞에 보여요."
+            return "'1등급 영화 내공인'의 고지가 저 앞에 보여요."
         elif viewing_time < 1950:
-            return "상위 0.1%의 왓챠 보증 '1등급 영화 내공인'"
+            return "왓챠 보증 '1등급 영화 내공인'"
         elif viewing_time < 2400:
             return "영화 1000작을 넘게 본 영화 '아마추어 영화인'"
         elif viewing_time < 2700:
@@ -223,9 +282,9 @@ class UserRatingService():
         elif viewing_time < 3000:
             return "영화 감독을 꿈꿀지 모를 '영화 프로페셔널'"
         elif viewing_time < 3500:
-            return "3000시간을 영화 본 '상위 0.03%의 매니아'"
+            return "3000시간을 영화 본 '진정한 매니아'"
         elif viewing_time < 4000:
-            return "상위 0.01%에 꼽히는 '베테랑 사회인'"
+            return "영화 보는 시간도 손꼽히는 '베테랑 사회인'"
         elif viewing_time < 5000:
             return "국내에 몇 안되는 '영화 Expert'"
         elif viewing_time < 6529:
@@ -235,7 +294,41 @@ class UserRatingService():
         else:
             return "평가하는거 나름 되게 재밌는데 어서 더 평가를..."
 
+    def _rating_summary(self, user_rating: UserRating) -> tuple[float | None, float | None, str | None, int, str | None]:
+        # 별점 수/합/분포와 시청 시간(분)으로 평균, 최빈값, 시청 시간(시간), 메시지를 계산
+        if user_rating.rating_num > 0:
+            rating_avg = user_rating.rating_sum / user_rating.rating_num
+        else:
+            rating_avg = None
+        rating_mode = _rating_mode(user_rating.rating_dist)
+        viewing_time = user_rating.viewing_minutes // 60
+        return (
+            rating_avg,
+            rating_mode,
+            self.get_user_rating_message(rating_avg),
+            viewing_time,
+            self.get_user_viewing_message(viewing_time)
+        )
+
+    def _update_rating_summary(self, user_rating: UserRating) -> UserRating:
+        return self.user_rating_repository.update_rating(user_rating, *self._rating_summary(user_rating))
+
+    def _is_rating_summary_outdated(self, user_rating: UserRating) -> bool:
+        # 메시지 문구가 바뀐 경우처럼 통계는 그대로인데 저장된 요약 값만 달라진 경우
+        rating_avg, rating_mode, rating_message, viewing_time, viewing_message = self._rating_summary(user_rating)
+        if (rating_avg is None) != (user_rating.rating_avg is None):
+            return True
+        if rating_avg is not None and not math.isclose(user_rating.rating_avg, rating_avg, abs_tol=1e-4):
+            return True
+        return (
+            user_rating.rating_mode != rating_mode
+            or user_rating.rating_message != rating_message
+            or user_rating.viewing_time != viewing_time
+            or user_rating.viewing_message != viewing_message
+        )
+
     def _process_user_rating_response(self, user_id: int, user_rating: UserRating) -> UserRatingResponse:
+        snapshot = get_percentile_snapshot()
         return UserRatingResponse(
                 id=user_rating.id,
                 user_id=user_rating.user_id,
@@ -245,5 +338,30 @@ class UserRatingService():
                 rating_mode=user_rating.rating_mode,
                 rating_message=user_rating.rating_message,
                 viewing_time=user_rating.viewing_time,
-                viewing_message=user_rating.viewing_message
+                viewing_message=user_rating.viewing_message,
+                rating_avg_top_percent=snapshot.rating_avg_top_percent(user_rating.rating_avg),
+                viewing_time_top_percent=snapshot.viewing_minutes_top_percent(user_rating.viewing_minutes),
+                updated_at=user_rating.updated_at
                 )
+
+
+def _nonzero_counts(rating_dist: dict[str, int] | None) -> dict[str, int]:
+    return {rating: count for rating, count in (rating_dist or {}).items() if count}
+
+
+def _rating_mode(rating_dist: dict[str, int] | None) -> float | None:
+    # 가장 많이 준 별점. 같으면 낮은 별점
+    counts = [(count, -float(rating)) for rating, count in (rating_dist or {}).items() if count > 0]
+    if not counts:
+        return None
+    return -max(counts)[1]
+
+
+def _transform_dict(
+        entity_dict: OrderedDict | None,
+        names: dict[int, str]
+        ) -> OrderedDict | None:
+    # {entity_id: 값} -> {이름: 값}, 순서 유지. 비어 있으면 None
+    if not entity_dict:
+        return None
+    return OrderedDict((names[entity_id], value) for entity_id, value in entity_dict.items() if entity_id in names)
@@ -0,0 +1,51 @@
+"""
+취향분석 재계산 큐(analysis/queue.py)를 비우는 백그라운드 작업.
+"""
+import asyncio
+import logging
+from sqlalchemy.orm import Session
+
+from watchapedia.database.connection import session_scope
+from watchapedia.database.routing import use_primary
+from watchapedia.app.analysis.queue import analysis_queue
+from watchapedia.app.analysis.repository import UserRatingRepository, UserPreferenceRepository
+
+logger = logging.getLogger(__name__)
+
+
+def recompute_user_analysis(session: Session, user_id: int) -> None:
+    # 별점 통계(UserRating)와 선호도 집계(UserEntityStats)는 리뷰 변경 시 증감분으로 바로 반영되므로
+    # 새 전체 평균 별점으로 선호도 점수(UserPreferenceEntry)만 다시 씀
+    user_rating = UserRatingRepository(session).get_user_rating_by_user_id(user_id)
+    UserPreferenceRepository(session).refresh_preference_entries(user_id, user_rating.rating_avg, user_rating.rating_num)
+
+
+def process_pending_updates() -> int:
+    """
+    큐에 모인 유저를 한 명씩 별도 트랜잭션으로 다시 계산하고, 계산한 유저 수를 반환합니다.
+    """
+    pending = analysis_queue.drain()
+    for user_id in pending:
+        try:
+            with session_scope() as session:
+                # 방금 커밋된 리뷰를 읽어야 하므로 replica 복제 지연을 피함
+                use_primary(session)
+                recompute_user_analysis(session, user_id)
+        except Exception:
+            # 재시도하지 않음. 해당 유저의 다음 리뷰 변경 때 다시 계산됨
+            logger.exception("Failed to recompute analysis for user %s", user_id)
+        finally:
+            analysis_queue.done(user_id)
+    return len(pending)
+
+
+async def run_analysis_worker(interval: float) -> None:
+    """
+    interval초마다 큐를 비우는 백그라운드 작업. 취소되면 남은 재계산을 마지막으로 처리합니다.
+    """
+    try:
+        while True:
+            await asyncio.sleep(interval)
+            await asyncio.to_thread(process_pending_updates)
+    finally:
+        await asyncio.to_thread(process_pending_updates)
@@ -2,3 +2,14 @@ from pydantic import BaseModel
 
 class CalendarResponse(BaseModel):
     movie_dict: dict[str, list[int]] | None
+
+class CalendarMonthlyStats(BaseModel):
+    count: int
+    minutes: int
+
+class CalendarStatsResponse(BaseModel):
+    year: int
+    total_count: int
+    total_minutes: int
+    daily: dict[str, int]
+    monthly: dict[int, CalendarMonthlyStats]
@@ -1,12 +1,16 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import select, and_, func
-from datetime import datetime, timedelta
+from sqlalchemy import select, func
 from collections import defaultdict
-from watchapedia.app.review.models import Review
+from watchapedia.app.review.models import ReviewView
+from watchapedia.app.movie.models import Movie
 from watchapedia.database.connection import get_db_session
-from typing import Annotated
+from watchapedia.common.cache import TTLCache, invalidate_on_commit
+from typing import Annotated, Iterable
 from fastapi import Depends
-from datetime import date, datetime
+from datetime import date
+
+# (user_id, year)별 날짜별 시청 수/시간 집계. 시청일이 바뀌면 해당 연도만 비움
+calendar_stats_cache = TTLCache(ttl=600)
 
 class CalendarRepository:
     def __init__(self, session: Annotated[Session, Depends(get_db_session)]) -> None:
@@ -18,27 +22,41 @@ class CalendarRepository:
         calendar_q1: date, 
         calendar_q2: date
     ) -> dict[str, list[int]]:
-        
-        start_date = calendar_q1.strftime("%Y-%m-%d")
-        end_date = calendar_q2.strftime("%Y-%m-%d")
-
+        # (user_id, view_date, movie_id) 인덱스 range scan 한 번으로 조회
         query = select(
-            Review.view_date,  
-            Review.movie_id
+            ReviewView.view_date,
+            ReviewView.movie_id
         ).where(
-            Review.user_id == user_id
-        )
-
-        result = self.session.execute(query).all()
+            (ReviewView.user_id == user_id)
+            & (ReviewView.view_date.between(calendar_q1, calendar_q2))
+        ).order_by(ReviewView.view_date, ReviewView.movie_id)
 
         movie_by_date = defaultdict(list)
-    
-        for row in result:
-            view_date_dict, movie_id = row  
-        
-            if isinstance(view_date_dict, dict):  
-                for date_str in view_date_dict.keys():  
-                    if start_date <= date_str <= end_date:  
-                        movie_by_date[date_str].append(movie_id)
+        for view_date, movie_id in self.session.execute(query):
+            movie_by_date[view_date.strftime("%Y-%m-%d")].append(movie_id)
 
         return dict(movie_by_date)
+
+    def get_daily_stats(self, user_id: int, year: int) -> tuple[tuple[date, int, int], ...]:
+        # 해당 연도의 (날짜, 본 영화 수, 본 시간(분)) 목록. GROUP BY 한 번으로 집계
+        daily_stats = calendar_stats_cache.get((user_id, year))
+        if daily_stats is None:
+            query = select(
+                ReviewView.view_date,
+                func.count(),
+                func.coalesce(func.sum(Movie.running_time), 0)
+            ).join(
+                Movie, Movie.id == ReviewView.movie_id
+            ).where(
+                (ReviewView.user_id == user_id)
+                & (ReviewView.view_date.between(date(year, 1, 1), date(year, 12, 31)))
+            ).group_by(ReviewView.view_date).order_by(ReviewView.view_date)
+
+            daily_stats = tuple(
+                (view_date, count, int(minutes)) for view_date, count, minutes in self.session.execute(query)
+            )
+            calendar_stats_cache.set((user_id, year), daily_stats)
+        return daily_stats
+
+    def invalidate_daily_stats(self, user_id: int, years: Iterable[int]) -> None:
+        invalidate_on_commit(self.session, calendar_stats_cache, *{(user_id, year) for year in years})
@@ -1,6 +1,7 @@
 from typing import Annotated
 from fastapi import Depends
 from watchapedia.app.calendar.repository import CalendarRepository
+from watchapedia.app.calendar.dto.responses import CalendarStatsResponse, CalendarMonthlyStats
 
 class CalendarService():
     def __init__(self,
@@ -16,3 +17,25 @@ class CalendarService():
             calendar_q2: str
             ) -> dict[str, list[int]]:
         return self.calendar_repository.get_movie_id_by_date(user_id, calendar_q1, calendar_q2)
+
+    def get_calendar_stats(
+            self,
+            user_id: int,
+            year: int
+            ) -> CalendarStatsResponse:
+        daily_stats = self.calendar_repository.get_daily_stats(user_id, year)
+
+        daily = dict()
+        monthly = {month: CalendarMonthlyStats(count=0, minutes=0) for month in range(1, 13)}
+        for view_date, count, minutes in daily_stats:
+            daily[view_date.strftime("%Y-%m-%d")] = count
+            monthly[view_date.month].count += count
+            monthly[view_date.month].minutes += minutes
+
+        return CalendarStatsResponse(
+                year=year,
+                total_count=sum(stats.count for stats in monthly.values()),
+                total_minutes=sum(stats.minutes for stats in monthly.values()),
+                daily=daily,
+                monthly=monthly
+                )
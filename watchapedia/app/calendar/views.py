@@ -2,7 +2,7 @@ from typing import Annotated
 from fastapi import APIRouter, Depends, Query
 
 from watchapedia.app.calendar.service import CalendarService
-from watchapedia.app.calendar.dto.responses import CalendarResponse
+from watchapedia.app.calendar.dto.responses import CalendarResponse, CalendarStatsResponse
 from watchapedia.app.calendar.dto.requests import validate_calendar_query
 
 calendar_router = APIRouter()
@@ -22,3 +22,11 @@ def calendar(
     return CalendarResponse(
             movie_dict=movie_dict
             )
+
+@calendar_router.get("/{user_id}/stats", status_code=200, summary="연간 시청 통계", description="연도의 날짜별 본 영화 수(히트맵)와 월별 본 영화 수, 시청 시간(분) 반환")
+def calendar_stats(
+        user_id: int,
+        calendar_service: Annotated[CalendarService, Depends()],
+        year: Annotated[int, Query(..., ge=1, le=9999, description="조회 연도 (YYYY)")]
+        ) -> CalendarStatsResponse:
+    return calendar_service.get_calendar_stats(user_id, year)
@@ -1,4 +1,4 @@
-from sqlalchemy import Integer, String, Float, ForeignKey, Boolean
+from sqlalchemy import Integer, String, Float, ForeignKey, Boolean, UniqueConstraint
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from datetime import datetime
 from watchapedia.database.common import Base
@@ -51,3 +51,7 @@ class UserLikesCollection(Base):
         Integer, ForeignKey("collection.id", ondelete="CASCADE"), nullable=False
     )
 
+    __table_args__ = (
+        UniqueConstraint('user_id', 'collection_id', name='uq_user_likes_collection'),
+    )
+
@@ -1,10 +1,12 @@
-from sqlalchemy import select
+from sqlalchemy import select, or_
 from sqlalchemy.orm import Session
 from fastapi import Depends
 from watchapedia.database.connection import get_db_session
+from watchapedia.database.counters import toggle_like
 from typing import Annotated, Sequence
 from watchapedia.app.movie.models import Movie
 from watchapedia.app.collection.models import Collection, UserLikesCollection, MovieCollection
+from watchapedia.common.pagination import Pagination
 from datetime import datetime
 
 class CollectionRepository():
@@ -56,50 +58,33 @@ class CollectionRepository():
         self.session.flush()
 
     def like_collection(self, user_id: int, collection: Collection) -> Collection:
-        get_like_query = select(UserLikesCollection).filter(
-            (UserLikesCollection.user_id == user_id)
-            & (UserLikesCollection.collection_id == collection.id)
-        )
-        user_likes_collection = self.session.scalar(get_like_query)
-
-        if user_likes_collection is None:
-            user_likes_collection = UserLikesCollection(
-                user_id=user_id,
-                collection_id=collection.id
-            )
-            self.session.add(user_likes_collection)
-            collection.likes_count += 1
-        else:
-            self.session.delete(user_likes_collection)
-            collection.likes_count -= 1
-        self.session.flush()
+        toggle_like(self.session, collection, UserLikesCollection, user_id, "collection_id")
         return collection
     
     def get_like_collection_list(self, user_id: int) -> list[Collection]:
         get_like_collection_query = select(Collection).join(UserLikesCollection, Collection.id == UserLikesCollection.collection_id).filter(UserLikesCollection.user_id == user_id)
         return self.session.execute(get_like_collection_query).scalars().all()
 
-    def get_collections_by_user_id(self, user_id: int) -> Sequence[Collection]:
+    def get_collections_by_user_id(self, user_id: int, pagination: Pagination | None = None) -> Sequence[Collection]:
         collections_list_query = select(Collection).where(Collection.user_id == user_id)
-        return self.session.scalars(collections_list_query).all()
+        return (pagination or Pagination()).fetch(self.session, collections_list_query, Collection.id)
 
     def get_collection_by_collection_id(self, collection_id: int) -> Collection | None:
         get_collection_query = select(Collection).filter(Collection.id == collection_id)
         return self.session.scalar(get_collection_query)
     
-    def get_collections_by_movie_title(self, title: str) -> list[Collection] | None:
-        get_collection_query = (
-                select(Collection)
-                .join(MovieCollection, Collection.id == MovieCollection.collection_id)
+    # title으로 복수의 collection get. 부분집합 허용. 담긴 영화 제목이 일치하는 collection도 포함
+    def search_collection_list(self, title: str, pagination: Pagination | None = None) -> list[Collection] | None:
+        movie_title_query = (
+                select(MovieCollection.collection_id)
                 .join(Movie, Movie.id == MovieCollection.movie_id)
                 .where(Movie.title.ilike(f"%{title}%"))
-                .distinct()
                 )
-        return self.session.execute(get_collection_query).scalars().all()
-
-    # title으로 복수의 collection get. 부분집합 허용.
-    def search_collection_list(self, title: str) -> list[Collection] | None:
-        get_collection_query = select(Collection).filter(Collection.title.ilike(f"%{title}%"))
+        get_collection_query = select(Collection).filter(
+            or_(Collection.title.ilike(f"%{title}%"), Collection.id.in_(movie_title_query))
+        ).order_by(Collection.id)
+        if pagination is not None:
+            get_collection_query = pagination.slice(get_collection_query)
         return self.session.execute(get_collection_query).scalars().all()
 
     def get_movie_by_movie_id(self, movie_id: int) -> Movie | None:
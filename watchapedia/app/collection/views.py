@@ -9,6 +9,7 @@ from watchapedia.app.user.models import User
 from watchapedia.app.collection.service import CollectionService
 from watchapedia.app.collection.dto.requests import CollectionCreateRequest, CollectionUpdateRequest
 from watchapedia.app.collection.dto.responses import CollectionResponse
+from watchapedia.common.pagination import Pagination, get_pagination
 
 collection_router = APIRouter()
 
@@ -72,10 +73,9 @@ def like_collection(
 def get_collections_by_user(
     user: Annotated[User, Depends(login_with_header)],
     collection_service: Annotated[CollectionService, Depends()],
-    begin: int | None = None,
-    end: int | None = None,
+    pagination: Annotated[Pagination, Depends(get_pagination)],
 ) -> list[CollectionResponse]:
-    return collection_service.get_user_collections(user, begin, end)
+    return collection_service.get_user_collections(user, pagination)
 
 @collection_router.delete("/{collection_id}",
                         status_code=204,
@@ -96,13 +96,12 @@ def search_collection_list(
     user_id: int,
     collection_service: Annotated[CollectionService, Depends()],
     user_service: Annotated[UserService, Depends()],
-    begin: int | None = None,
-    end: int | None = None,
+    pagination: Annotated[Pagination, Depends(get_pagination)],
 ):
     user = user_service.get_user_by_user_id(user_id)
     if user is None:
         raise UserNotFoundError()
-    return collection_service.get_user_collections(user, begin, end)
+    return collection_service.get_user_collections(user, pagination)
 
 @collection_router.get("/like/{collection_id}",
                         status_code=200,
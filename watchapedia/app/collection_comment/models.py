@@ -1,4 +1,4 @@
-from sqlalchemy import Integer, String, ForeignKey
+from sqlalchemy import Integer, String, ForeignKey, UniqueConstraint
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from datetime import datetime
 from watchapedia.database.common import Base
@@ -36,3 +36,7 @@ class UserLikesCollectionComment(Base):
     collection_comment_id: Mapped[int] = mapped_column(
         Integer, ForeignKey("collection_comment.id", ondelete="CASCADE"), nullable=False
     )
+
+    __table_args__ = (
+        UniqueConstraint('user_id', 'collection_comment_id', name='uq_user_likes_collection_comment'),
+    )
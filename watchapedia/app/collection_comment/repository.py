@@ -2,10 +2,12 @@ from sqlalchemy import select
 from sqlalchemy.orm import Session
 from fastapi import Depends
 from watchapedia.database.connection import get_db_session
+from watchapedia.database.counters import toggle_like
 from typing import Annotated, Sequence
 from datetime import datetime
 from watchapedia.app.collection_comment.models import CollectionComment, UserLikesCollectionComment
 from watchapedia.app.comment.errors import CommentNotFoundError
+from watchapedia.common.pagination import Pagination
 
 class CollectionCommentRepository():
     def __init__(self, session: Annotated[Session, Depends(get_db_session)]) -> None:
@@ -40,9 +42,9 @@ class CollectionCommentRepository():
 
         return comment
 
-    def get_comments(self, collection_id: int) -> Sequence[CollectionComment]:
+    def get_comments(self, collection_id: int, pagination: Pagination | None = None) -> Sequence[CollectionComment]:
         comments_list_query = select(CollectionComment).where(CollectionComment.collection_id == collection_id)
-        return self.session.scalars(comments_list_query).all()
+        return (pagination or Pagination()).fetch(self.session, comments_list_query, CollectionComment.id)
 
     def get_comment_by_comment_id(self, comment_id: int) -> CollectionComment:
         comment = self.session.get(CollectionComment, comment_id)
@@ -52,28 +54,7 @@ class CollectionCommentRepository():
         return comment
 
     def like_comment(self, user_id: int, comment: CollectionComment) -> CollectionComment:
-        get_like_query = select(UserLikesCollectionComment).filter(
-            (UserLikesCollectionComment.user_id == user_id)
-            & (UserLikesCollectionComment.collection_comment_id == comment.id)
-        )
-        user_likes_comment = self.session.scalar(get_like_query)
-
-        if user_likes_comment is None :
-            user_likes_comment = UserLikesCollectionComment(
-                user_id=user_id,
-                collection_comment_id=comment.id,
-            )
-            self.session.add(user_likes_comment)
-
-            comment.likes_count += 1
-
-        else :
-            self.session.delete(user_likes_comment)
-
-            comment.likes_count -= 1
-            
-        self.session.flush()
-
+        toggle_like(self.session, comment, UserLikesCollectionComment, user_id, "collection_comment_id")
         return comment
     
     def delete_comment_by_id(self, comment: CollectionComment) -> None:
@@ -7,6 +7,7 @@ from watchapedia.app.collection_comment.dto.requests import CollectionCommentReq
 from watchapedia.app.collection_comment.dto.responses import CollectionCommentResponse
 from watchapedia.app.collection_comment.models import CollectionComment
 from watchapedia.app.collection_comment.service import CollectionCommentService
+from watchapedia.common.pagination import Pagination, get_pagination
 
 collection_comment_router = APIRouter()
 
@@ -47,10 +48,9 @@ def update_comment(
 def get_comments(
     collection_id: int,
     collection_comment_service: Annotated[CollectionCommentService, Depends()],
-    begin: int | None = None,
-    end: int | None = None,
+    pagination: Annotated[Pagination, Depends(get_pagination)],
 ) -> list[CollectionCommentResponse]:
-    return collection_comment_service.list_comments(collection_id, begin, end)
+    return collection_comment_service.list_comments(collection_id, pagination)
 
 @collection_comment_router.get('/{comment_id}',
                 status_code=200,
@@ -1,4 +1,4 @@
-from sqlalchemy import Integer, String, ForeignKey, Float
+from sqlalchemy import Integer, String, ForeignKey, Float, Index, UniqueConstraint
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from datetime import datetime
 from watchapedia.database.common import Base
@@ -22,6 +22,10 @@ class Comment(Base):
     )
     review: Mapped["Review"] = relationship("Review", back_populates="comments")
 
+    __table_args__ = (
+        Index('ix_comment_review_id', 'review_id'),
+    )
+
 class UserLikesComment(Base):
     __tablename__ = 'user_likes_comment'
 
@@ -32,3 +36,7 @@ class UserLikesComment(Base):
     comment_id: Mapped[int] = mapped_column(
         Integer, ForeignKey("comment.id", ondelete="CASCADE"), nullable=False
     )
+
+    __table_args__ = (
+        UniqueConstraint('user_id', 'comment_id', name='uq_user_likes_comment'),
+    )
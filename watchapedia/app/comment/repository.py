@@ -2,11 +2,13 @@ from sqlalchemy import select, func
 from sqlalchemy.orm import Session
 from fastapi import Depends
 from watchapedia.database.connection import get_db_session
-from typing import Annotated, Sequence
+from watchapedia.database.counters import toggle_like
+from typing import Annotated, Collection, Sequence
 from datetime import datetime
 from watchapedia.app.comment.models import Comment, UserLikesComment
 from watchapedia.app.review.models import Review
 from watchapedia.app.comment.errors import CommentNotFoundError
+from watchapedia.common.pagination import Pagination
 
 class CommentRepository():
     def __init__(self, session: Annotated[Session, Depends(get_db_session)]) -> None:
@@ -39,13 +41,18 @@ class CommentRepository():
 
         return comment
 
-    def get_comments_by_review_id(self, review_id: int) -> Sequence[Comment]:
+    def get_comments_by_review_id(
+        self, review_id: int, pagination: Pagination | None = None, exclude_user_ids: Collection[int] = ()
+    ) -> Sequence[Comment]:
         comments_list_query = select(Comment).where(Comment.review_id == review_id)
-        return self.session.scalars(comments_list_query).all()
+        if exclude_user_ids:
+            # 차단한 유저의 코멘트는 pagination 전에 제외
+            comments_list_query = comments_list_query.where(Comment.user_id.not_in(exclude_user_ids))
+        return (pagination or Pagination()).fetch(self.session, comments_list_query, Comment.id)
 
-    def get_comments_by_user_id(self, user_id: int) -> Sequence[Comment]:
+    def get_comments_by_user_id(self, user_id: int, pagination: Pagination | None = None) -> Sequence[Comment]:
         comments_list_query = select(Comment).where(Comment.user_id == user_id)
-        return self.session.scalars(comments_list_query).all()
+        return (pagination or Pagination()).fetch(self.session, comments_list_query, Comment.id)
 
     def get_comment_by_comment_id(self, comment_id: int) -> Comment:
         comment = self.session.get(Comment, comment_id)
@@ -67,28 +74,7 @@ class CommentRepository():
             return True
 
     def like_comment(self, user_id: int, comment: Comment) -> Comment:
-        get_like_query = select(UserLikesComment).filter(
-            (UserLikesComment.user_id == user_id)
-            & (UserLikesComment.comment_id == comment.id)
-        )
-        user_likes_comment = self.session.scalar(get_like_query)
-
-        if user_likes_comment is None :
-            user_likes_comment = UserLikesComment(
-                user_id=user_id,
-                comment_id=comment.id,
-            )
-            self.session.add(user_likes_comment)
-
-            comment.likes_count += 1
-
-        else :
-            self.session.delete(user_likes_comment)
-
-            comment.likes_count -= 1
-            
-        self.session.flush()
-
+        toggle_like(self.session, comment, UserLikesComment, user_id, "comment_id")
         return comment
 
     def delete_comment_by_id(self, comment: Comment) -> None:
@@ -98,3 +84,14 @@ class CommentRepository():
     def get_comments_count_by_review_id(self, review_id: int) -> int:
         comments_count_query = select(func.count()).where(Comment.review_id == review_id)
         return self.session.scalar(comments_count_query)
+
+    def get_comments_counts_by_review_ids(self, review_ids: list[int]) -> dict[int, int]:
+        # 코멘트가 없는 리뷰는 결과에 포함되지 않음
+        if not review_ids:
+            return {}
+        comments_count_query = (
+            select(Comment.review_id, func.count())
+            .where(Comment.review_id.in_(review_ids))
+            .group_by(Comment.review_id)
+        )
+        return dict(self.session.execute(comments_count_query).all())
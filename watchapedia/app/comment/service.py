@@ -1,7 +1,9 @@
 from typing import Annotated
 from fastapi import Depends
-from watchapedia.common.errors import PermissionDeniedError, InvalidRangeError
+from watchapedia.common.errors import PermissionDeniedError
+from watchapedia.common.pagination import Pagination
 from watchapedia.app.review.repository import ReviewRepository
+from watchapedia.app.user.repository import UserRepository
 from watchapedia.app.review.errors import ReviewNotFoundError
 from watchapedia.app.comment.dto.responses import CommentResponse
 from watchapedia.app.comment.repository import CommentRepository
@@ -12,10 +14,12 @@ from datetime import datetime
 class CommentService:
     def __init__(self,
     review_repository: Annotated[ReviewRepository, Depends()],
-    comment_repository: Annotated[CommentRepository, Depends()]
+    comment_repository: Annotated[CommentRepository, Depends()],
+    user_repository: Annotated[UserRepository, Depends()]
     ) -> None:
         self.review_repository = review_repository
         self.comment_repository = comment_repository
+        self.user_repository = user_repository
 
     def create_comment(self, user_id: int, review_id: int, content: str) -> CommentResponse:
         review = self.review_repository.get_review_by_review_id(review_id)
@@ -40,25 +44,26 @@ class CommentService:
         comment = self.comment_repository.get_comment_by_comment_id(comment_id)
         return self._process_comment_response(-1, comment)
 
-    def review_comments(self, review_id: int, begin: int | None, end: int | None) -> list[CommentResponse]:
+    def review_comments(self, review_id: int, pagination: Pagination) -> list[CommentResponse]:
         review = self.review_repository.get_review_by_review_id(review_id)
         if review is None :
             raise ReviewNotFoundError()
 
-        comments = self.comment_repository.get_comments_by_review_id(review_id)
-        return self._process_range([self._process_comment_response(-1, comment) for comment in comments], begin, end)
+        comments = self.comment_repository.get_comments_by_review_id(review_id, pagination)
+        return [self._process_comment_response(-1, comment) for comment in comments]
 
-    def review_user_comments(self, user_id: int, review_id: int, begin: int | None, end: int | None) -> list[CommentResponse]:
+    def review_user_comments(self, user_id: int, review_id: int, pagination: Pagination) -> list[CommentResponse]:
         review = self.review_repository.get_review_by_review_id(review_id)
         if review is None :
             raise ReviewNotFoundError()
 
-        comments = self.comment_repository.get_comments_by_review_id(review_id)
-        return self._process_range([self._process_comment_response(user_id, comment) for comment in comments], begin, end)
+        blocked_user_ids = self.user_repository.get_blocked_user_ids(user_id)
+        comments = self.comment_repository.get_comments_by_review_id(review_id, pagination, blocked_user_ids)
+        return [self._process_comment_response(user_id, comment) for comment in comments]
 
-    def user_comments(self, user_id: int, begin: int | None, end: int | None) -> list[CommentResponse]:
-        comments = self.comment_repository.get_comments_by_user_id(user_id)
-        return self._process_range([self._process_comment_response(user_id, comment) for comment in comments], begin, end)
+    def user_comments(self, user_id: int, pagination: Pagination) -> list[CommentResponse]:
+        comments = self.comment_repository.get_comments_by_user_id(user_id, pagination)
+        return [self._process_comment_response(user_id, comment) for comment in comments]
 
 
     def like_comment(self, user_id: int, comment_id: int) -> CommentResponse :
@@ -77,17 +82,6 @@ class CommentService:
             raise PermissionDeniedError()
         self.comment_repository.delete_comment_by_id(comment)
 
-    
-    def _process_range(self, response_list, begin: int | None, end: int | None) -> list[CommentResponse]:
-        if begin is None :
-            begin = 0
-        if end is None or end > len(response_list) :
-            end = len(response_list)
-        if begin > len(response_list) :
-            begin = len(response_list)
-        if begin < 0 or begin > end :
-            raise InvalidRangeError()
-        return response_list[begin : end]
 
     def _process_comment_response(self, user_id: int, comment: Comment) -> CommentResponse:
         return CommentResponse(
@@ -9,6 +9,7 @@ from watchapedia.app.comment.dto.responses import CommentResponse
 from watchapedia.app.comment.models import Comment
 from watchapedia.app.comment.service import CommentService
 from watchapedia.app.comment.errors import *
+from watchapedia.common.pagination import Pagination, get_pagination
 
 comment_router = APIRouter()
 
@@ -51,10 +52,9 @@ def update_comment(
 def get_comments(
     user: Annotated[User, Depends(login_with_header)],
     comment_service: Annotated[CommentService, Depends()],
-    begin: int | None = None,
-    end: int | None = None,
+    pagination: Annotated[Pagination, Depends(get_pagination)],
 ):
-    return comment_service.user_comments(user.id, begin, end)
+    return comment_service.user_comments(user.id, pagination)
 
 @comment_router.get('/user/{user_id}',
                 status_code=200, 
@@ -65,10 +65,9 @@ def get_comments(
 def get_comments_by_user(
     user_id: int,
     comment_service: Annotated[CommentService, Depends()],
-    begin: int | None = None,
-    end: int | None = None,
+    pagination: Annotated[Pagination, Depends(get_pagination)],
 ):
-    return comment_service.user_comments(user_id, begin, end)
+    return comment_service.user_comments(user_id, pagination)
 
 @comment_router.get('/review/{review_id}',
                 status_code=200, 
@@ -79,10 +78,9 @@ def get_comments_by_user(
 def get_comments_by_review(
     review_id: int,
     comment_service: Annotated[CommentService, Depends()],
-    begin: int | None = None,
-    end: int | None = None,
+    pagination: Annotated[Pagination, Depends(get_pagination)],
 ):
-    return comment_service.review_comments(review_id, begin, end)
+    return comment_service.review_comments(review_id, pagination)
 
 @comment_router.get('/list/{review_id}',
                 status_code=200, 
@@ -94,10 +92,9 @@ def get_comments_by_review_and_user(
     user: Annotated[User, Depends(login_with_header)],
     review_id: int,
     comment_service: Annotated[CommentService, Depends()],
-    begin: int | None = None,
-    end: int | None = None,
+    pagination: Annotated[Pagination, Depends(get_pagination)],
 ):
-    return comment_service.review_user_comments(user.id, review_id, begin, end)
+    return comment_service.review_user_comments(user.id, review_id, pagination)
 
 @comment_router.get('/{comment_id}',
                 status_code=200, 
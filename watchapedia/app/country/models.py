@@ -1,4 +1,4 @@
-from sqlalchemy import Integer, String, ForeignKey
+from sqlalchemy import Integer, String, ForeignKey, Index
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from watchapedia.database.common import Base
 from typing import TYPE_CHECKING
@@ -18,3 +18,7 @@ class Country(Base):
     name: Mapped[str] = mapped_column(String(50), nullable=False)
 
     movies: Mapped[list["Movie"]] = relationship(secondary="movie_country", back_populates="countries")
+
+    __table_args__ = (
+        Index('ix_country_name', 'name'),
+    )
@@ -1,12 +1,18 @@
-from sqlalchemy import select
+from sqlalchemy import select, insert
 from sqlalchemy.orm import Session
 from fastapi import Depends
 from watchapedia.database.connection import get_db_session
-from typing import Annotated
+from watchapedia.database.common import collation_key
+from typing import Annotated, Iterable
+from collections import defaultdict
+from watchapedia.common.cache import TTLCache
 from watchapedia.app.country.models import Country
 from watchapedia.app.movie.models import Movie
 from watchapedia.app.country.errors import CountryAlreadyExistsError
 
+# 전체 country id -> 이름 (테이블이 작아 한 번에 전부 읽어둠). 없는 id가 조회되면 다시 읽음
+country_names_cache = TTLCache(ttl=3600, maxsize=1)
+
 class CountryRepository():
     def __init__(self, session: Annotated[Session, Depends(get_db_session)]) -> None:
         self.session = session
@@ -27,6 +33,38 @@ class CountryRepository():
         country.movies.append(movie)
         self.session.flush()
     
+    def get_or_add_country_ids_by_names(self, names: set[str]) -> dict[str, int]:
+        """
+        이름 목록에 해당하는 country id를 한 번에 조회하고, 없는 것은 일괄 추가합니다.
+        """
+        if not names:
+            return {}
+        country_ids = self._get_country_ids_by_names(names)
+        # DB collation에서 같은 값으로 취급되는 이름은 한 번만 추가
+        new_names = {}
+        for name in sorted(names - country_ids.keys()):
+            new_names.setdefault(collation_key(name), name)
+        if new_names:
+            self.session.execute(insert(Country), [{"name": name} for name in new_names.values()])
+            # 대소문자만 다른 이름은 먼저 추가된 country로 연결
+            new_country_ids = self._get_country_ids_by_names(set(new_names.values()))
+            for name in names - country_ids.keys():
+                country_ids[name] = new_country_ids[new_names[collation_key(name)]]
+        return country_ids
+
+    def _get_country_ids_by_names(self, names: set[str]) -> dict[str, int]:
+        names_by_collation = defaultdict(list)
+        for name in names:
+            names_by_collation[collation_key(name)].append(name)
+
+        # 이름은 DB collation과 같이 대소문자/악센트를 무시하고 비교
+        get_country_query = select(Country.id, Country.name).filter(Country.name.in_(names)).order_by(Country.id)
+        country_ids = {}
+        for country_id, name in self.session.execute(get_country_query):
+            for requested_name in names_by_collation.pop(collation_key(name), []):
+                country_ids[requested_name] = country_id
+        return country_ids
+
     def get_country_by_country_name(self, name: str) -> Country | None:
         get_country_query = select(Country).filter(Country.name == name)
         return self.session.scalar(get_country_query)
@@ -34,3 +72,11 @@ class CountryRepository():
     def get_country_by_id(self, country_id: int) -> Country | None:
         get_country_query = select(Country).filter(Country.id == country_id)
         return self.session.scalar(get_country_query)
+
+    def get_country_names(self, country_ids: Iterable[int]) -> dict[int, str]:
+        country_ids = set(country_ids)
+        names = country_names_cache.get("all")
+        if names is None or not country_ids <= names.keys():
+            names = dict(self.session.execute(select(Country.id, Country.name)).all())
+            country_names_cache.set("all", names)
+        return {country_id: names[country_id] for country_id in country_ids if country_id in names}
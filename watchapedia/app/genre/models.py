@@ -1,4 +1,4 @@
-from sqlalchemy import Integer, String, ForeignKey
+from sqlalchemy import Integer, String, ForeignKey, Index
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from watchapedia.database.common import Base
 from typing import TYPE_CHECKING
@@ -18,3 +18,7 @@ class Genre(Base):
     name: Mapped[str] = mapped_column(String(50), nullable=False)
 
     movies: Mapped[list["Movie"]] = relationship(secondary="movie_genre", back_populates="genres")
+
+    __table_args__ = (
+        Index('ix_genre_name', 'name'),
+    )
@@ -1,12 +1,18 @@
-from sqlalchemy import select, or_, func
+from sqlalchemy import select, or_, func, insert
 from sqlalchemy.orm import Session
 from fastapi import Depends
 from watchapedia.database.connection import get_db_session
-from typing import Annotated
+from watchapedia.database.common import collation_key
+from typing import Annotated, Iterable
+from collections import defaultdict
+from watchapedia.common.cache import TTLCache
 from watchapedia.app.genre.models import Genre
 from watchapedia.app.movie.models import Movie
 from watchapedia.app.genre.errors import GenreAlreadyExistsError
 
+# 전체 genre id -> 이름 (테이블이 작아 한 번에 전부 읽어둠). 없는 id가 조회되면 다시 읽음
+genre_names_cache = TTLCache(ttl=3600, maxsize=1)
+
 class GenreRepository():
     def __init__(self, session: Annotated[Session, Depends(get_db_session)]) -> None:
         self.session = session
@@ -27,6 +33,38 @@ class GenreRepository():
         genre.movies.append(movie)
         self.session.flush()
     
+    def get_or_add_genre_ids_by_names(self, names: set[str]) -> dict[str, int]:
+        """
+        이름 목록에 해당하는 genre id를 한 번에 조회하고, 없는 것은 일괄 추가합니다.
+        """
+        if not names:
+            return {}
+        genre_ids = self._get_genre_ids_by_names(names)
+        # DB collation에서 같은 값으로 취급되는 이름은 한 번만 추가
+        new_names = {}
+        for name in sorted(names - genre_ids.keys()):
+            new_names.setdefault(collation_key(name), name)
+        if new_names:
+            self.session.execute(insert(Genre), [{"name": name} for name in new_names.values()])
+            # 대소문자만 다른 이름은 먼저 추가된 genre로 연결
+            new_genre_ids = self._get_genre_ids_by_names(set(new_names.values()))
+            for name in names - genre_ids.keys():
+                genre_ids[name] = new_genre_ids[new_names[collation_key(name)]]
+        return genre_ids
+
+    def _get_genre_ids_by_names(self, names: set[str]) -> dict[str, int]:
+        names_by_collation = defaultdict(list)
+        for name in names:
+            names_by_collation[collation_key(name)].append(name)
+
+        # 이름은 DB collation과 같이 대소문자/악센트를 무시하고 비교
+        get_genre_query = select(Genre.id, Genre.name).filter(Genre.name.in_(names)).order_by(Genre.id)
+        genre_ids = {}
+        for genre_id, name in self.session.execute(get_genre_query):
+            for requested_name in names_by_collation.pop(collation_key(name), []):
+                genre_ids[requested_name] = genre_id
+        return genre_ids
+
     def get_genre_by_genre_name(self, name: str) -> Genre | None:
         get_genre_query = select(Genre).filter(Genre.name == name)
         return self.session.scalar(get_genre_query)
@@ -47,3 +85,10 @@ class GenreRepository():
         get_genre_query = select(Genre).filter(Genre.id == genre_id)
         return self.session.scalar(get_genre_query)
 
+    def get_genre_names(self, genre_ids: Iterable[int]) -> dict[int, str]:
+        genre_ids = set(genre_ids)
+        names = genre_names_cache.get("all")
+        if names is None or not genre_ids <= names.keys():
+            names = dict(self.session.execute(select(Genre.id, Genre.name)).all())
+            genre_names_cache.set("all", names)
+        return {genre_id: names[genre_id] for genre_id in genre_ids if genre_id in names}
@@ -1,4 +1,5 @@
 from pydantic import BaseModel
+from typing import Literal
 from watchapedia.app.movie.models import Movie
 
 class ParticipantsDataResponse(BaseModel):
@@ -22,4 +23,10 @@ class MovieDataResponse(BaseModel):
     poster_url: str | None
     backdrop_url: str | None
     participants: list[ParticipantsDataResponse]
-    reviews_count: int
\ No newline at end of file
+    reviews_count: int
+
+class MovieIngestResultResponse(BaseModel):
+    index: int
+    title: str
+    status: Literal["created", "chart_updated", "already_exists"]
+    movie_id: int
@@ -1,4 +1,4 @@
-from sqlalchemy import Integer, String, Float, ForeignKey, DateTime
+from sqlalchemy import Integer, String, Float, ForeignKey, DateTime, Index, JSON
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from datetime import datetime
 from watchapedia.database.common import Base
@@ -30,7 +30,26 @@ class Chart(Base):
     
     movie_id: Mapped[int] = mapped_column(Integer, ForeignKey("movie.id"), nullable=False)
     movie: Mapped["Movie"] = relationship("Movie", back_populates="charts")
+
+    __table_args__ = (
+        Index('ix_chart_platform_movie_id', 'platform', 'movie_id'),
+    )
     
+class MovieStats(Base):
+    """
+    영화별 리뷰 집계. 리뷰 작성/수정/삭제 시 증감분만 반영합니다.
+    """
+    __tablename__ = "movie_stats"
+
+    movie_id: Mapped[int] = mapped_column(Integer, ForeignKey("movie.id", ondelete="CASCADE"), primary_key=True)
+    rating_sum: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    rating_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    review_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0) # content가 있는 리뷰 수
+    rating_dist: Mapped[dict[str, int]] = mapped_column(JSON, nullable=False, default=dict) # {"0.5": 개수, ..., "5.0": 개수}
+    last_review_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+
+    movie: Mapped["Movie"] = relationship("Movie", back_populates="stats")
+
 class Movie(Base):
     __tablename__ = "movie"
 
@@ -54,3 +73,9 @@ class Movie(Base):
     movie_participants: Mapped[list[MovieParticipant]] = relationship("MovieParticipant", back_populates="movie")
     
     charts: Mapped[list["Chart"]] = relationship("Chart", back_populates="movie")
+
+    stats: Mapped["MovieStats | None"] = relationship("MovieStats", back_populates="movie", uselist=False)
+
+    __table_args__ = (
+        Index('ix_movie_title_year_running_time', 'title', 'year', 'running_time'),
+    )
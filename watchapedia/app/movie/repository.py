@@ -1,14 +1,88 @@
-from sqlalchemy import Sequence, func, select
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import Select, Sequence, func, select, insert, update
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.orm.attributes import flag_modified
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import Depends
-from watchapedia.app.country.models import Country
-from watchapedia.app.genre.models import Genre
-from watchapedia.database.connection import get_db_session
+from watchapedia.app.country.models import Country, MovieCountry
+from watchapedia.app.genre.models import Genre, MovieGenre
+from watchapedia.database.connection import get_db_session, get_async_db_session
+from watchapedia.database.common import collation_key
 from typing import Annotated
 from datetime import datetime
-from watchapedia.app.movie.models import Movie, MovieParticipant, Chart
+from collections import defaultdict
+from watchapedia.app.movie.models import Movie, MovieParticipant, Chart, MovieStats
 from watchapedia.app.review.models import Review
 from watchapedia.app.participant.models import Participant
+from watchapedia.common.pagination import Pagination
+
+def build_search_movie_id_query(
+    title: str | None = None,
+    chart_type: str | None = None,
+    min_rating: float | None = None,
+    max_rating: float | None = None,
+    genres: list[str] | None = None,
+    countries: list[str] | None = None,
+    participant_id: int | None = None
+) -> Select:
+    """
+    조건에 맞는 영화 id를 조회하는 쿼리. 첫 번째 컬럼이 movie id 입니다.
+    """
+    type_dict = {"box_office": 30, "watcha_buying": 30, "watcha10": 10, "netflix": 10}
+    stmt = select(Movie.id)
+    group_by = False
+
+    if title:
+        stmt = stmt.where(Movie.title.ilike(f"%{title}%"))  # 대소문자 구분X, 부분 일치 지원
+
+    if chart_type:
+        stmt = stmt.join(Chart).where(Chart.platform == chart_type)
+
+    if min_rating:
+        stmt = stmt.where(Movie.average_rating >= min_rating)
+    if max_rating:
+        stmt = stmt.where(Movie.average_rating <= max_rating)
+
+    if genres:
+        stmt = stmt.join(Movie.genres).filter(Genre.name.in_(genres))  # 해당 장르 중 하나라도 포함된 영화만 찾음
+        stmt = stmt.group_by(Movie.id).having(func.count(Genre.id) == len(genres))
+        group_by = True
+    
+    if countries:
+        stmt = stmt.join(Movie.countries).filter(Country.name.in_(countries))  # 해당 장르 중 하나라도 포함된 영화만 찾음
+        stmt = stmt.group_by(Movie.id).having(func.count(Country.id) == len(countries))
+        group_by = True
+
+    if participant_id:
+        stmt = stmt.join(Movie.movie_participants).where(MovieParticipant.participant_id == participant_id)
+
+    
+    # 최신 순으로 정렬 - 역순으로
+    if chart_type:
+        # DISTINCT/GROUP BY와 함께 정렬하려면 정렬 컬럼도 SELECT 목록에 있어야 함
+        stmt = stmt.add_columns(Chart.updated_at, Chart.rank)
+        if group_by:
+            stmt = stmt.group_by(Chart.updated_at, Chart.rank)
+        stmt = stmt.order_by(Chart.updated_at.desc(), Chart.rank.desc())
+    else:
+        # OFFSET/LIMIT으로 잘라도 페이지가 겹치거나 빠지지 않도록 유일한 key로 정렬
+        stmt = stmt.order_by(Movie.id)
+
+    # 반환 개수 제한
+    limit = type_dict.get(chart_type, None)
+    if limit:
+        stmt = stmt.limit(limit)
+        
+    # 중복 제거
+    return stmt.distinct()
+
+def movie_detail_options() -> tuple:
+    # 응답에 필요한 관계를 관계별 IN 쿼리 한 번씩으로 로딩 (페이지 크기와 무관하게 쿼리 수 고정)
+    return (
+        selectinload(Movie.genres),
+        selectinload(Movie.countries),
+        selectinload(Movie.movie_participants).selectinload(MovieParticipant.participant),
+        selectinload(Movie.stats)
+    )
 
 class MovieRepository():
     def __init__(self, session: Annotated[Session, Depends(get_db_session)]) -> None:
@@ -37,6 +111,7 @@ class MovieRepository():
             poster_url=poster_url,
             backdrop_url=backdrop_url
         )
+        movie.stats = MovieStats(rating_sum=0.0, rating_count=0, review_count=0, rating_dist={})
         self.session.add(movie)
         self.session.flush()
         return movie
@@ -92,51 +167,39 @@ class MovieRepository():
         genres: list[str] | None = None,
         countries: list[str] | None = None,
         participant_id: int | None = None
-    ) -> Sequence[Movie]:
-        type_dict = {"box_office": 30, "watcha_buying": 30, "watcha10": 10, "netflix": 10}
-        stmt = select(Movie).options(
-            joinedload(Movie.genres),
-            joinedload(Movie.countries),
-            joinedload(Movie.movie_participants).joinedload(MovieParticipant.participant)
-        )   # eager loading
-
-        if title:
-            stmt = stmt.where(Movie.title.ilike(f"%{title}%"))  # 대소문자 구분X, 부분 일치 지원
-
-        if chart_type:
-            stmt = stmt.join(Chart).where(Chart.platform == chart_type)
-
-        if min_rating:
-            stmt = stmt.where(Movie.average_rating >= min_rating)
-        if max_rating:
-            stmt = stmt.where(Movie.average_rating <= max_rating)
-
-        if genres:
-            stmt = stmt.join(Movie.genres).filter(Genre.name.in_(genres))  # 해당 장르 중 하나라도 포함된 영화만 찾음
-            stmt = stmt.group_by(Movie.id).having(func.count(Genre.id) == len(genres))
-        
-        if countries:
-            stmt = stmt.join(Movie.countries).filter(Country.name.in_(countries))  # 해당 장르 중 하나라도 포함된 영화만 찾음
-            stmt = stmt.group_by(Movie.id).having(func.count(Country.id) == len(countries))
-
-        if participant_id:
-            stmt = stmt.join(Movie.movie_participants).where(MovieParticipant.participant_id == participant_id)
+    ) -> list[Movie]:
+        movie_ids = self.search_movie_ids(
+            title, chart_type, min_rating, max_rating, genres, countries, participant_id
+        )
+        return self.get_movies_by_ids(movie_ids)
 
-        
-        # 최신 순으로 정렬 - 역순으로
-        if chart_type:
-            stmt = stmt.order_by(Chart.updated_at.desc(), Chart.rank.desc())
-    
-        # 반환 개수 제한
-        limit = type_dict.get(chart_type, None)
-        if limit:
-            stmt = stmt.limit(limit)
-            
-        # 중복 제거
-        stmt = stmt.distinct()
+    def search_movie_ids(
+        self,
+        title: str | None = None,
+        chart_type: str | None = None,
+        min_rating: float | None = None,
+        max_rating: float | None = None,
+        genres: list[str] | None = None,
+        countries: list[str] | None = None,
+        participant_id: int | None = None,
+        pagination: Pagination | None = None
+    ) -> list[int]:
+        stmt = build_search_movie_id_query(
+            title, chart_type, min_rating, max_rating, genres, countries, participant_id
+        )
+        if pagination is not None:
+            stmt = pagination.slice(stmt)
+        return [row[0] for row in self.session.execute(stmt)]
 
-        movies = self.session.scalars(stmt).unique()
-        return movies
+    def get_movies_by_ids(self, movie_ids: list[int]) -> list[Movie]:
+        """
+        id 목록의 영화를 관계와 함께 한 번에 조회하여 id 순서대로 반환합니다.
+        """
+        if not movie_ids:
+            return []
+        get_movies_query = select(Movie).filter(Movie.id.in_(movie_ids)).options(*movie_detail_options())
+        movies = {movie.id: movie for movie in self.session.scalars(get_movies_query)}
+        return [movies[movie_id] for movie_id in movie_ids if movie_id in movies]
     
     def get_chart_rank_by_chart_type(self, chart_type: str, movie: Movie) -> Chart | None:
         get_chart_query = select(Chart).filter((Chart.platform == chart_type) & (Chart.movie_id == movie.id))
@@ -160,19 +223,186 @@ class MovieRepository():
         get_movie_query = select(Movie).filter(Movie.id==movie_id)
         return self.session.scalar(get_movie_query)
 
-    def update_average_rating(self, movie: Movie) -> None:
-        reviews = movie.reviews
-        total_rating = 0.0
-        rating_num = 0
+    def get_movie_ids_by_keys(self, keys: set[tuple[str, int, int | None]]) -> dict[tuple[str, int, int | None], int]:
+        """
+        (title, year, running_time) 목록에 해당하는 영화 id를 한 번에 조회합니다.
+        제목은 DB collation과 같이 대소문자/악센트를 무시하고 비교합니다.
+        """
+        if not keys:
+            return {}
+        keys_by_collation = defaultdict(list)
+        for title, year, running_time in keys:
+            keys_by_collation[(collation_key(title), year, running_time)].append((title, year, running_time))
+
+        # 제목으로 한 번에 조회한 뒤 year, running_time(NULL 포함)은 메모리에서 비교
+        get_movie_query = select(Movie.id, Movie.title, Movie.year, Movie.running_time).filter(
+            Movie.title.in_({title for title, _, _ in keys})
+        ).order_by(Movie.id)
+        movie_ids = {}
+        for movie_id, title, year, running_time in self.session.execute(get_movie_query):
+            # 같은 key의 영화가 여러 개면 id가 가장 작은 영화
+            for key in keys_by_collation.pop((collation_key(title), year, running_time), []):
+                movie_ids[key] = movie_id
+        return movie_ids
+
+    def bulk_add_movies(self, movies: list[dict]) -> None:
+        if movies:
+            self.session.execute(insert(Movie), movies)
+
+    def bulk_add_movie_stats(self, movie_ids: list[int]) -> None:
+        if movie_ids:
+            self.session.execute(
+                insert(MovieStats),
+                [
+                    {"movie_id": movie_id, "rating_sum": 0.0, "rating_count": 0, "review_count": 0, "rating_dist": {}}
+                    for movie_id in movie_ids
+                ]
+            )
+
+    def bulk_add_movie_relations(
+        self,
+        movie_genres: set[tuple[int, int]],
+        movie_countries: set[tuple[int, int]],
+        movie_participants: dict[tuple[int, int], str]
+    ) -> None:
+        if movie_genres:
+            self.session.execute(
+                insert(MovieGenre), [{"movie_id": movie_id, "genre_id": genre_id} for movie_id, genre_id in movie_genres]
+            )
+        if movie_countries:
+            self.session.execute(
+                insert(MovieCountry), [{"movie_id": movie_id, "country_id": country_id} for movie_id, country_id in movie_countries]
+            )
+        if movie_participants:
+            self.session.execute(
+                insert(MovieParticipant),
+                [
+                    {"movie_id": movie_id, "participant_id": participant_id, "role": role}
+                    for (movie_id, participant_id), role in movie_participants.items()
+                ]
+            )
+
+    def bulk_upsert_charts(self, charts: dict[tuple[str, int], int]) -> None:
+        """
+        {(chart_type, movie_id): rank} 를 받아 기존 차트는 순위를 갱신하고, 없는 차트는 추가합니다.
+        """
+        if not charts:
+            return
+        now = datetime.now()
+        get_chart_query = select(Chart.id, Chart.platform, Chart.movie_id).filter(
+            Chart.platform.in_({chart_type for chart_type, _ in charts})
+            & Chart.movie_id.in_({movie_id for _, movie_id in charts})
+        )
+        chart_ids = {(platform, movie_id): chart_id for chart_id, platform, movie_id in self.session.execute(get_chart_query)}
+
+        updated_charts = [
+            {"id": chart_ids[key], "rank": rank, "updated_at": now} for key, rank in charts.items() if key in chart_ids
+        ]
+        new_charts = [
+            {"platform": chart_type, "movie_id": movie_id, "rank": rank, "updated_at": now}
+            for (chart_type, movie_id), rank in charts.items() if (chart_type, movie_id) not in chart_ids
+        ]
+        if updated_charts:
+            self.session.execute(update(Chart), updated_charts)
+        if new_charts:
+            self.session.execute(insert(Chart), new_charts)
 
-        for review in reviews :
-            if review.rating is not None and review.rating > 0:
-                total_rating += review.rating
-                rating_num += 1
+    def update_movie_stats(
+        self,
+        movie: Movie,
+        old_rating: float | None = None,
+        new_rating: float | None = None,
+        review_count_delta: int = 0,
+        reviewed_at: datetime | None = None
+    ) -> None:
+        """
+        리뷰 하나의 변경분(이전 별점 -> 새 별점, 텍스트 리뷰 수 증감)만 영화 통계에 반영하고 평균 별점을 갱신합니다.
+        """
+        stats = self._get_movie_stats_for_update(movie.id)
+        dist = stats.rating_dist
+        if _is_rated(old_rating):
+            stats.rating_sum -= old_rating
+            stats.rating_count -= 1
+            key = _rating_dist_key(old_rating)
+            dist[key] = dist.get(key, 0) - 1
+            if dist[key] <= 0:
+                del dist[key]
+        if _is_rated(new_rating):
+            stats.rating_sum += new_rating
+            stats.rating_count += 1
+            key = _rating_dist_key(new_rating)
+            dist[key] = dist.get(key, 0) + 1
+        flag_modified(stats, "rating_dist")
 
-        if rating_num >= 1 :
-            movie.average_rating = round(total_rating / rating_num, 1)
+        stats.review_count += review_count_delta
+        if reviewed_at is not None and (stats.last_review_at is None or stats.last_review_at < reviewed_at):
+            stats.last_review_at = reviewed_at
+
+        if stats.rating_count >= 1 :
+            movie.average_rating = round(stats.rating_sum / stats.rating_count, 1)
         else :
             movie.average_rating = None
 
         self.session.flush()
+
+    def _get_movie_stats_for_update(self, movie_id: int) -> MovieStats:
+        # 통계 row가 없으면 먼저 만든 뒤 row lock. 동시에 처음 리뷰가 달려도 INSERT IGNORE라 PK 충돌이 나지 않음
+        self.session.execute(
+            insert(MovieStats)
+            .values(movie_id=movie_id, rating_sum=0.0, rating_count=0, review_count=0, rating_dist={})
+            .prefix_with("IGNORE", dialect="mysql")
+            .prefix_with("OR IGNORE", dialect="sqlite")
+        )
+        # 같은 영화에 대한 동시 리뷰 작성 시 증감이 유실되지 않도록 row lock
+        get_stats_query = (
+            select(MovieStats)
+            .filter(MovieStats.movie_id == movie_id)
+            .with_for_update()
+            .execution_options(populate_existing=True)
+        )
+        return self.session.scalars(get_stats_query).one()
+
+def _is_rated(rating: float | None) -> bool:
+    return rating is not None and rating > 0
+
+def _rating_dist_key(rating: float) -> str:
+    # 0.5 단위 구간
+    return f"{round(rating * 2) / 2:.1f}"
+
+class AsyncMovieRepository():
+    """
+    async 라우트용 조회 전용 repository. lazy loading을 쓸 수 없으므로 응답에 필요한 관계를 미리 로딩합니다.
+    """
+    def __init__(self, session: Annotated[AsyncSession, Depends(get_async_db_session)]) -> None:
+        self.session = session
+
+    async def get_movie_by_movie_id(self, movie_id: int) -> Movie | None:
+        get_movie_query = select(Movie).filter(Movie.id==movie_id).options(*movie_detail_options())
+        return await self.session.scalar(get_movie_query)
+
+    async def movie_exists(self, movie_id: int) -> bool:
+        # 관계를 로딩하지 않고 존재 여부만 확인
+        return await self.session.scalar(select(Movie.id).filter(Movie.id == movie_id)) is not None
+
+    async def search_movie_list(
+        self,
+        title: str | None = None,
+        chart_type: str | None = None,
+        min_rating: float | None = None,
+        max_rating: float | None = None,
+        genres: list[str] | None = None,
+        countries: list[str] | None = None,
+        participant_id: int | None = None
+    ) -> list[Movie]:
+        stmt = build_search_movie_id_query(
+            title, chart_type, min_rating, max_rating, genres, countries, participant_id
+        )
+        movie_ids = [row[0] for row in await self.session.execute(stmt)]
+        return await self.get_movies_by_ids(movie_ids)
+
+    async def get_movies_by_ids(self, movie_ids: list[int]) -> list[Movie]:
+        if not movie_ids:
+            return []
+        get_movies_query = select(Movie).filter(Movie.id.in_(movie_ids)).options(*movie_detail_options())
+        movies = {movie.id: movie for movie in await self.session.scalars(get_movies_query)}
+        return [movies[movie_id] for movie_id in movie_ids if movie_id in movies]
@@ -1,15 +1,49 @@
 from typing import Annotated
-from watchapedia.app.movie.repository import MovieRepository
+from watchapedia.app.movie.repository import MovieRepository, AsyncMovieRepository
 from watchapedia.app.genre.repository import GenreRepository
 from watchapedia.app.country.repository import CountryRepository
 from watchapedia.app.participant.repository import ParticipantRepository
 from watchapedia.app.review.repository import ReviewRepository
 from fastapi import Depends
+from watchapedia.database.connection import session_scope
+from watchapedia.database.common import collation_key
+from watchapedia.common.pagination import Pagination
 from watchapedia.app.movie.errors import MovieAlreadyExistsError, MovieNotFoundError, InvalidFormatError
 from watchapedia.app.movie.models import Movie
 from watchapedia.app.movie.dto.requests import AddParticipantsRequest, AddMovieListRequest
-from watchapedia.app.movie.dto.responses import MovieDataResponse, ParticipantsDataResponse
-from watchapedia.app.review.models import Review
+from watchapedia.app.movie.dto.responses import MovieDataResponse, ParticipantsDataResponse, MovieIngestResultResponse
+
+def build_movie_response(movie: Movie) -> MovieDataResponse:
+    stats = movie.stats
+    return MovieDataResponse(
+        id=movie.id,
+        title=movie.title,
+        original_title=movie.original_title,
+        year=movie.year,
+        genres=[
+            genre.name for genre in movie.genres    
+        ],
+        countries=[
+            country.name for country in movie.countries
+        ],
+        synopsis=movie.synopsis,
+        average_rating=movie.average_rating,
+        ratings_count=stats.rating_count if stats else 0,
+        running_time=movie.running_time,
+        grade=movie.grade,
+        poster_url=movie.poster_url,
+        backdrop_url=movie.backdrop_url,
+        participants=[
+            ParticipantsDataResponse(
+                id=participant.participant_id,
+                name=participant.participant.name,
+                role=participant.role,
+                profile_url=participant.participant.profile_url
+            )
+            for participant in movie.movie_participants
+        ],
+        reviews_count=stats.review_count if stats else 0,
+    )
 
 class MovieService():
     def __init__(self, 
@@ -144,62 +178,182 @@ class MovieService():
             participant_id=participant_id
         )
         return [ self._process_movie_response(movie) for movie in movies ]
+
+    def search_movie_id_list(
+        self,
+        title: str | None = None,
+        chart_type: str | None = None,
+        min_rating: float | None = None,
+        max_rating: float | None = None,
+        genres: list[str] | None = None,
+        countries: list[str] | None = None,
+        participant_id: int | None = None,
+        pagination: Pagination | None = None
+    ) -> list[int]:
+        # 응답 객체 없이 id만 필요한 경우 (검색, 추천)
+        return self.movie_repository.search_movie_ids(
+            title, chart_type, min_rating, max_rating, genres, countries, participant_id, pagination
+        )
+
+    def get_movie_list_by_ids(self, movie_ids: list[int]) -> list[MovieDataResponse]:
+        """
+        id 목록의 영화 응답을 고정된 수의 쿼리로 만듭니다. 존재하지 않는 id는 제외됩니다.
+        """
+        movies = self.movie_repository.get_movies_by_ids(movie_ids)
+        return [ self._process_movie_response(movie) for movie in movies ]
         
-    def add_movie_list(self, movie_list_request: list[AddMovieListRequest]) -> list[MovieDataResponse]:
-        movie_response_list = []
+    def add_movie_list(self, movie_list_request: list[AddMovieListRequest]) -> list[MovieIngestResultResponse]:
+        """
+        여러 영화를 한 번에 추가합니다. 장르/국가/인물은 배치 전체에 대해 한 번씩만 조회하고,
+        새 row는 일괄 insert 합니다. 이미 존재하는 영화가 있어도 중단하지 않고 항목별 결과를 반환합니다.
+        """
+        keys = {self._movie_key(movie_request) for movie_request in movie_list_request}
+        movie_ids = self.movie_repository.get_movie_ids_by_keys(keys)
+
+        # 배치 안에서 중복된 영화는 처음 나온 것만 추가. 제목은 DB collation처럼 대소문자/악센트를 무시
+        new_movies: dict[tuple[str, int, int | None], AddMovieListRequest] = {}
+        new_movie_keys: dict[tuple[str, int, int | None], tuple[str, int, int | None]] = {}
         for movie_request in movie_list_request:
-            movie_response = self.add_movie(
-                movie_request.title,
-                movie_request.original_title,
-                movie_request.year,
-                movie_request.synopsis,
-                movie_request.running_time,
-                movie_request.grade,
-                movie_request.poster_url,
-                movie_request.backdrop_url,
-                movie_request.genres,
-                movie_request.countries,
-                movie_request.participants,
-                movie_request.chart_type,
-                movie_request.rank,
+            key = self._movie_key(movie_request)
+            if key not in movie_ids and self._collation_movie_key(key) not in new_movie_keys:
+                new_movie_keys[self._collation_movie_key(key)] = key
+                new_movies[key] = movie_request
+
+        if new_movies:
+            movie_ids.update(self._bulk_add_movies(new_movies))
+            # 대소문자만 다른 제목은 먼저 추가된 영화로 연결
+            for key in keys - movie_ids.keys():
+                movie_ids[key] = movie_ids[new_movie_keys[self._collation_movie_key(key)]]
+
+        charts: dict[tuple[str, int], int] = {}
+        results = []
+        for index, movie_request in enumerate(movie_list_request):
+            key = self._movie_key(movie_request)
+            movie_id = movie_ids[key]
+            has_chart = movie_request.chart_type and movie_request.rank
+            if has_chart:
+                charts[(movie_request.chart_type, movie_id)] = movie_request.rank
+
+            if new_movies.get(key) is movie_request:
+                status = "created"
+            elif has_chart:
+                status = "chart_updated"
+            else:
+                status = "already_exists"
+            results.append(
+                MovieIngestResultResponse(index=index, title=movie_request.title, status=status, movie_id=movie_id)
             )
-            movie_response_list.append(movie_response)
-        return movie_response_list
+
+        # chart crawling의 경우, 차트 추가 및 업데이트
+        self.movie_repository.bulk_upsert_charts(charts)
+        return results
+
+    def _bulk_add_movies(
+        self, new_movies: dict[tuple[str, int, int | None], AddMovieListRequest]
+    ) -> dict[tuple[str, int, int | None], int]:
+        self.movie_repository.bulk_add_movies([
+            {
+                "title": movie_request.title,
+                "original_title": movie_request.original_title,
+                "year": movie_request.year,
+                "synopsis": movie_request.synopsis or "등록된 소개글이 없습니다.",
+                "average_rating": None,
+                "running_time": movie_request.running_time,
+                "grade": movie_request.grade,
+                "poster_url": movie_request.poster_url,
+                "backdrop_url": movie_request.backdrop_url,
+            }
+            for movie_request in new_movies.values()
+        ])
+        movie_ids = self.movie_repository.get_movie_ids_by_keys(set(new_movies))
+        self.movie_repository.bulk_add_movie_stats(list(movie_ids.values()))
+
+        genre_ids = self.genre_repository.get_or_add_genre_ids_by_names(
+            {genre for movie_request in new_movies.values() for genre in movie_request.genres}
+        )
+        country_ids = self.country_repository.get_or_add_country_ids_by_names(
+            {country for movie_request in new_movies.values() for country in movie_request.countries}
+        )
+        participant_ids = self.participant_repository.get_or_add_participant_ids(
+            {
+                (participant.name, participant.profile_url)
+                for movie_request in new_movies.values() for participant in movie_request.participants
+            }
+        )
+
+        movie_genres = set()
+        movie_countries = set()
+        movie_participants = {}
+        for key, movie_request in new_movies.items():
+            movie_id = movie_ids[key]
+            movie_genres.update((movie_id, genre_ids[genre]) for genre in movie_request.genres)
+            movie_countries.update((movie_id, country_ids[country]) for country in movie_request.countries)
+            for participant in movie_request.participants:
+                # MovieParticipant가 중복되는 경우 처음 역할만 저장
+                movie_participants.setdefault(
+                    (movie_id, participant_ids[(participant.name, participant.profile_url)]), participant.role
+                )
+        self.movie_repository.bulk_add_movie_relations(movie_genres, movie_countries, movie_participants)
+        return movie_ids
+
+    def _movie_key(self, movie_request: AddMovieListRequest) -> tuple[str, int, int | None]:
+        # 동명의 영화가 다수 존재하므로 get_movie와 같은 조합으로 구분
+        return (movie_request.title, movie_request.year, movie_request.running_time)
+
+    def _collation_movie_key(self, key: tuple[str, int, int | None]) -> tuple[str, int, int | None]:
+        title, year, running_time = key
+        return (collation_key(title), year, running_time)
     
     def _process_movie_response(self, movie: Movie) -> MovieDataResponse:
-        return MovieDataResponse(
-            id=movie.id,
-            title=movie.title,
-            original_title=movie.original_title,
-            year=movie.year,
-            genres=[
-                genre.name for genre in movie.genres    
-            ],
-            countries=[
-                country.name for country in movie.countries
-            ],
-            synopsis=movie.synopsis,
-            average_rating=movie.average_rating,
-            ratings_count=self._count_ratings(movie.reviews),
-            running_time=movie.running_time,
-            grade=movie.grade,
-            poster_url=movie.poster_url,
-            backdrop_url=movie.backdrop_url,
-            participants=[
-                ParticipantsDataResponse(
-                    id=participant.participant_id,
-                    name=participant.participant.name,
-                    role=participant.role,
-                    profile_url=participant.participant.profile_url
-                )
-                for participant in movie.movie_participants
-            ],
-            reviews_count=self.review_repository.get_reviews_count_by_movie_id(movie.id),
-        )
+        return build_movie_response(movie)
     
-    def _count_ratings(self, reviews: list[Review]) -> int:
-        rating_num = 0
-        for review in reviews:
-            if review.rating is not None and review.rating != 0:
-                rating_num += 1
-        return rating_num
+
+def ingest_movie_chunk(movie_list_request: list[AddMovieListRequest]) -> list[MovieIngestResultResponse]:
+    """
+    요청 세션과 별개로, 청크 하나를 하나의 트랜잭션으로 추가하고 커밋합니다. (스트리밍 import용)
+    """
+    with session_scope() as session:
+        movie_service = MovieService(
+            MovieRepository(session),
+            GenreRepository(session),
+            CountryRepository(session),
+            ParticipantRepository(session),
+            ReviewRepository(session)
+        )
+        return movie_service.add_movie_list(movie_list_request)
+
+class AsyncMovieService():
+    """
+    조회 전용 async 서비스. 쓰기 작업은 MovieService(동기)를 사용합니다.
+    """
+    def __init__(self,
+        movie_repository: Annotated[AsyncMovieRepository, Depends()]
+    ) -> None:
+        self.movie_repository = movie_repository
+
+    async def search_movie(self, movie_id: int) -> MovieDataResponse:
+        movie = await self.movie_repository.get_movie_by_movie_id(movie_id)
+        if movie is None:
+            raise MovieNotFoundError()
+        return build_movie_response(movie)
+
+    async def search_movie_list(
+        self,
+        title: str | None = None,
+        chart_type: str | None = None,
+        min_rating: float | None = None,
+        max_rating: float | None = None,
+        genres: list[str] | None = None,
+        countries: list[str] | None = None,
+        participant_id: int | None = None
+    ) -> list[MovieDataResponse]:
+        movies = await self.movie_repository.search_movie_list(
+            title=title,
+            chart_type=chart_type,
+            min_rating=min_rating,
+            max_rating=max_rating,
+            genres=genres,
+            countries=countries,
+            participant_id=participant_id
+        )
+        return [ build_movie_response(movie) for movie in movies ]
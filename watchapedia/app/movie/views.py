@@ -1,10 +1,16 @@
-from fastapi import APIRouter, Depends, Query
-from typing import Annotated, List, Optional
+import json
+from collections import Counter
+from typing import Annotated, AsyncIterator, List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
+from sqlalchemy.exc import SQLAlchemyError
 from watchapedia.app.movie.errors import InvalidFormatError
-from watchapedia.app.movie.service import MovieService
+from watchapedia.app.movie.service import MovieService, AsyncMovieService, ingest_movie_chunk
 from watchapedia.app.movie.crawling import MovieChartCrawler
 from watchapedia.app.movie.dto.requests import AddMovieRequest, UpdateMovieRequest, AddMovieListRequest
-from watchapedia.app.movie.dto.responses import MovieDataResponse
+from watchapedia.app.movie.dto.responses import MovieDataResponse, MovieIngestResultResponse
 
 movie_router = APIRouter()
 
@@ -34,24 +40,88 @@ def add_movie(
 @movie_router.post("/list",
                 status_code=201,
                 summary="영화 리스트 추가",
-                description="[유저영역 아님] 여러 영화 정보를 받아 DB에 영화들을을 추가하고 성공 시 저장된 정보를 반환합니다. (EC2에서 크롤링이 작동하지 않아 만든 메서드입니다.)")
+                description="[유저영역 아님] 여러 영화 정보를 받아 DB에 영화들을 일괄 추가하고, 항목별 결과(created/chart_updated/already_exists)와 영화 id를 반환합니다. 이미 존재하는 영화가 있어도 나머지는 계속 추가됩니다. (EC2에서 크롤링이 작동하지 않아 만든 메서드입니다.)")
 def add_movie_list(
     add_movie_list_request: list[AddMovieListRequest],
     movie_service: Annotated[MovieService, Depends()]
-) -> list[MovieDataResponse]:
+) -> list[MovieIngestResultResponse]:
     return movie_service.add_movie_list(
         add_movie_list_request
     )
 
+@movie_router.post("/stream",
+                status_code=200,
+                summary="영화 스트리밍 import",
+                description="[유저영역 아님] 한 줄에 영화 하나씩(NDJSON, AddMovieListRequest 형식) 받아 chunk_size 개씩 검증/추가하고 청크마다 커밋합니다. 진행 상황을 NDJSON으로 스트리밍하며, 형식이 잘못된 줄은 건너뛰고 오류로 보고합니다.",
+                response_class=StreamingResponse)
+async def stream_movie_list(
+    request: Request,
+    chunk_size: Annotated[int, Query(ge=1, le=2000)] = 500
+) -> StreamingResponse:
+    return _DuplexStreamingResponse(_ingest_movie_stream(request, chunk_size), media_type="application/x-ndjson")
+
+class _DuplexStreamingResponse(StreamingResponse):
+    # 요청 본문을 읽는 동안 응답을 보내므로, 연결 종료 감지 태스크가 본문 메시지를 가로채지 않도록 스트리밍만 수행
+    async def __call__(self, scope, receive, send) -> None:
+        await self.stream_response(send)
+
+async def _iter_lines(request: Request) -> AsyncIterator[bytes]:
+    buffer = b""
+    async for data in request.stream():
+        buffer += data
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            yield line
+    yield buffer
+
+async def _ingest_movie_stream(request: Request, chunk_size: int) -> AsyncIterator[str]:
+    totals = Counter()
+    chunk: list[AddMovieListRequest] = []
+    chunk_index = 0
+
+    async def flush_chunk() -> str:
+        nonlocal chunk, chunk_index
+        chunk_index += 1
+        try:
+            # DB 작업은 블로킹이므로 스레드풀에서 실행
+            results = await run_in_threadpool(ingest_movie_chunk, chunk)
+            counts = Counter(result.status for result in results)
+            progress = {"chunk": chunk_index, "size": len(chunk), **counts}
+        except SQLAlchemyError as e:
+            counts = Counter(failed=len(chunk))
+            progress = {"chunk": chunk_index, "size": len(chunk), "error": str(e.__cause__ or e)}
+        totals.update(counts)
+        chunk = []
+        return json.dumps(progress, ensure_ascii=False) + "\n"
+
+    line_number = 0
+    async for line in _iter_lines(request):
+        line_number += 1
+        if not line.strip():
+            continue
+        try:
+            chunk.append(AddMovieListRequest.model_validate_json(line))
+        except (ValidationError, HTTPException) as e:
+            totals["invalid"] += 1
+            detail = e.detail if isinstance(e, HTTPException) else e.errors(include_url=False, include_input=False)
+            yield json.dumps({"line": line_number, "error": detail}, ensure_ascii=False, default=str) + "\n"
+            continue
+        if len(chunk) >= chunk_size:
+            yield await flush_chunk()
+
+    if chunk:
+        yield await flush_chunk()
+    yield json.dumps({"done": True, "lines": line_number, **totals}, ensure_ascii=False) + "\n"
+
 @movie_router.get("/{movie_id}",
                 status_code=200,
                 summary="영화 조회",
                 description="영화 id로 DB를 조회하여 성공 시 영화 정보를 반환합니다.")
-def get_movie(
+async def get_movie(
     movie_id: int,
-    movie_service: Annotated[MovieService, Depends()]
+    movie_service: Annotated[AsyncMovieService, Depends()]
 ) -> MovieDataResponse:
-    return movie_service.search_movie(movie_id)
+    return await movie_service.search_movie(movie_id)
 
 @movie_router.patch("/{movie_id}",
                 status_code=200,
@@ -93,8 +163,8 @@ def update_movie(
                 status_code=200,
                 summary="영화 리스트 조회",
                 description="주어진 조건에 따른 영화 리스트를 반환합니다. 가능한 조건은 [제목/차트이름/최소별점/최대별점/장르/국가] 입니다. 장르와 국가는 여러 개 입력할 수 있습니다. 차트 영화 정보는 낮은 순위부터 제공합니다.")
-def search_movie_list(
-    movie_service: Annotated[MovieService, Depends()],
+async def search_movie_list(
+    movie_service: Annotated[AsyncMovieService, Depends()],
     title: str | None = None,
     chart_type: str | None = None,
     min_rating: float | None = None,  
@@ -103,4 +173,4 @@ def search_movie_list(
     countries: list[str] | None = Query(None),
     participant_id: int | None = None
 ) -> list[MovieDataResponse]:
-    return movie_service.search_movie_list(title, chart_type, min_rating, max_rating, genres, countries, participant_id)
\ No newline at end of file
+    return await movie_service.search_movie_list(title, chart_type, min_rating, max_rating, genres, countries, participant_id)
\ No newline at end of file
@@ -1,4 +1,4 @@
-from sqlalchemy import Integer, String, ForeignKey
+from sqlalchemy import Integer, String, ForeignKey, Index, UniqueConstraint
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from watchapedia.database.common import Base
 from typing import TYPE_CHECKING
@@ -16,6 +16,10 @@ class Participant(Base):
 
     movie_participants: Mapped[list["MovieParticipant"]] = relationship("MovieParticipant", back_populates="participant")
 
+    __table_args__ = (
+        Index('ix_participant_name_profile_url', 'name', 'profile_url'),
+    )
+
 class UserLikesParticipant(Base):
     __tablename__ = 'user_likes_participant'
 
@@ -25,4 +29,8 @@ class UserLikesParticipant(Base):
     )
     participant_id: Mapped[int] = mapped_column(
         Integer, ForeignKey("participant.id", ondelete='CASCADE'), nullable=False
+    )
+
+    __table_args__ = (
+        UniqueConstraint('user_id', 'participant_id', name='uq_user_likes_participant'),
     )
\ No newline at end of file
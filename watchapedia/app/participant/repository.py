@@ -1,11 +1,19 @@
-from sqlalchemy import select, distinct
+from sqlalchemy import select, distinct, insert, or_
 from sqlalchemy.orm import Session
 from fastapi import Depends
 from watchapedia.database.connection import get_db_session
+from watchapedia.database.common import collation_key
+from watchapedia.database.counters import toggle_like
 from watchapedia.app.participant.models import Participant, UserLikesParticipant
 from watchapedia.app.movie.models import Movie, MovieParticipant
 from watchapedia.app.participant.errors import ParticipantAlreadyExistsError
-from typing import Annotated
+from watchapedia.common.pagination import Pagination
+from watchapedia.common.cache import LRUCache, invalidate_on_commit
+from typing import Annotated, Iterable
+from collections import defaultdict
+
+# participant id -> 이름. 취향분석 응답에서 id를 이름으로 바꿀 때 사용하고, 이름이 바뀌면 해당 id만 비움
+participant_names_cache = LRUCache(ttl=3600, maxsize=50000)
 
 class ParticipantRepository():
     def __init__(self, session: Annotated[Session, Depends(get_db_session)]) -> None:
@@ -35,6 +43,48 @@ class ParticipantRepository():
             self.session.add(movie_participant)
             self.session.flush()
     
+    def get_or_add_participant_ids(self, keys: set[tuple[str, str | None]]) -> dict[tuple[str, str | None], int]:
+        """
+        (name, profile_url) 목록에 해당하는 participant id를 한 번에 조회하고, 없는 것은 일괄 추가합니다.
+        """
+        if not keys:
+            return {}
+        participant_ids = self._get_participant_ids(keys)
+        # DB collation에서 같은 값으로 취급되는 key는 한 번만 추가
+        new_participants = {}
+        for name, profile_url in keys - participant_ids.keys():
+            new_participants.setdefault((collation_key(name), collation_key(profile_url)), (name, profile_url))
+        if new_participants:
+            self.session.execute(
+                insert(Participant),
+                [
+                    {"name": name, "profile_url": profile_url, "likes_count": 0}
+                    for name, profile_url in new_participants.values()
+                ]
+            )
+            # 대소문자만 다른 key는 먼저 추가된 participant로 연결
+            new_participant_ids = self._get_participant_ids(set(new_participants.values()))
+            for name, profile_url in keys - participant_ids.keys():
+                participant_ids[(name, profile_url)] = new_participant_ids[
+                    new_participants[(collation_key(name), collation_key(profile_url))]
+                ]
+        return participant_ids
+
+    def _get_participant_ids(self, keys: set[tuple[str, str | None]]) -> dict[tuple[str, str | None], int]:
+        keys_by_collation = defaultdict(list)
+        for name, profile_url in keys:
+            keys_by_collation[(collation_key(name), collation_key(profile_url))].append((name, profile_url))
+
+        # 이름으로 한 번에 조회한 뒤 profile_url(NULL 포함)은 메모리에서 대소문자/악센트를 무시하고 비교
+        get_participant_query = select(Participant.id, Participant.name, Participant.profile_url).filter(
+            Participant.name.in_({name for name, _ in keys})
+        ).order_by(Participant.id)
+        participant_ids = {}
+        for participant_id, name, profile_url in self.session.execute(get_participant_query):
+            for key in keys_by_collation.pop((collation_key(name), collation_key(profile_url)), []):
+                participant_ids[key] = participant_id
+        return participant_ids
+
     def get_participant(self, name: str, profile_url: str | None) -> Participant | None:
         get_participant_query =  select(Participant).filter(
             (Participant.profile_url == profile_url) 
@@ -43,14 +93,38 @@ class ParticipantRepository():
         return self.session.scalar(get_participant_query)
 
     # name으로 복수의 participant get. 부분집합 허용.
-    def search_participant_list(self, name: str) -> list[Participant] | None:
+    def search_participant_list(self, name: str, pagination: Pagination | None = None) -> list[Participant] | None:
         get_participant_query = select(Participant).filter(Participant.name.ilike(f"%{name}%"))
+        if pagination is not None:
+            get_participant_query = pagination.slice(get_participant_query.order_by(Participant.id))
         return self.session.execute(get_participant_query).scalars().all()
 
     def get_participant_by_id(self, participant_id: int) -> Participant | None:
         get_participant_query = select(Participant).filter(Participant.id == participant_id)
         return self.session.scalar(get_participant_query)
     
+    def get_participant_names(self, participant_ids: Iterable[int]) -> dict[int, str]:
+        """
+        participant id -> 이름을 반환합니다. 캐시에 없는 id만 IN 쿼리 한 번으로 조회합니다.
+        """
+        names = {}
+        missing_ids = set()
+        for participant_id in participant_ids:
+            name = participant_names_cache.get(participant_id)
+            if name is None:
+                missing_ids.add(participant_id)
+            else:
+                names[participant_id] = name
+        if missing_ids:
+            get_names_query = select(Participant.id, Participant.name).filter(Participant.id.in_(missing_ids))
+            for participant_id, name in self.session.execute(get_names_query):
+                participant_names_cache.set(participant_id, name)
+                names[participant_id] = name
+        return names
+
+    def invalidate_participant_name(self, participant_id: int) -> None:
+        invalidate_on_commit(self.session, participant_names_cache, participant_id)
+
     def get_movie_participant(self, movie_id: int, participant_id: int) -> MovieParticipant | None:
         get_movie_participant_query = select(MovieParticipant).filter(
             (MovieParticipant.movie_id == movie_id)
@@ -62,6 +136,7 @@ class ParticipantRepository():
     def update_participant(self, participant: Participant, name: str | None, profile_url : str | None, biography: str | None ) -> None:
         if name:
             participant.name = name
+            self.invalidate_participant_name(participant.id)
         if profile_url:
             participant.profile_url = profile_url
         if biography:
@@ -69,21 +144,7 @@ class ParticipantRepository():
         self.session.flush()
 
     def like_participant(self, user_id: int, participant: Participant) -> None:
-        get_participant_like_query = select(UserLikesParticipant).filter(
-            (UserLikesParticipant.user_id == user_id)
-            & (UserLikesParticipant.participant_id == participant.id)
-        )
-        user_likes_participant = self.session.scalar(get_participant_like_query)
-
-        if user_likes_participant is None:
-            user_likes_participant = UserLikesParticipant(user_id=user_id, participant_id=participant.id)
-            self.session.add(user_likes_participant)
-            participant.likes_count += 1
-        else:
-            self.session.delete(user_likes_participant)
-            participant.likes_count -= 1
-        self.session.flush()
-
+        toggle_like(self.session, participant, UserLikesParticipant, user_id, "participant_id")
         return participant
     
     def like_info(self, user_id: int, participant: Participant) -> bool:
@@ -106,9 +167,14 @@ class ParticipantRepository():
         )
         return self.session.scalars(get_participant_roles_query).all()
     
-    def get_participant_movies(self, participant_id: int, cast: str) -> list[Movie]:
-        get_participant_movies_query = select(Movie).join(MovieParticipant).filter(
+    def get_participant_movies(
+        self, participant_id: int, casts: list[str], pagination: Pagination | None = None
+    ) -> list[tuple[Movie, str]]:
+        # casts 중 하나라도 포함된 역할의 (영화, 역할)을 개봉연도 내림차순으로
+        get_participant_movies_query = select(Movie, MovieParticipant.role).join(MovieParticipant).filter(
             (MovieParticipant.participant_id == participant_id)
-            & (MovieParticipant.role.contains(cast))
-        )
-        return self.session.scalars(get_participant_movies_query).all()
+            & or_(*(MovieParticipant.role.contains(cast) for cast in casts))
+        ).order_by(Movie.year.desc(), Movie.id.desc())
+        if pagination is not None:
+            get_participant_movies_query = pagination.slice(get_participant_movies_query)
+        return self.session.execute(get_participant_movies_query).all()
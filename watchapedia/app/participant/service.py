@@ -2,7 +2,8 @@ from typing import Annotated
 from fastapi import Depends
 from watchapedia.app.participant.repository import ParticipantRepository
 from watchapedia.app.participant.errors import ParticipantNotFoundError
-from watchapedia.common.errors import InvalidFormatError, InvalidRangeError
+from watchapedia.common.errors import InvalidFormatError
+from watchapedia.common.pagination import Pagination
 from watchapedia.app.participant.dto.responses import ParticipantDataResponse, MovieDataResponse, ParticipantProfileResponse
 from watchapedia.app.movie.models import Movie
 from watchapedia.app.participant.models import Participant
@@ -21,27 +22,16 @@ class ParticipantService():
             raise ParticipantNotFoundError()
         return self._process_participant(participant)
 
-    def get_participant_movies(self, participant_id: int, begin: int | None, end: int | None) -> list[ParticipantDataResponse]:
+    def get_participant_movies(self, participant_id: int, pagination: Pagination) -> list[ParticipantDataResponse]:
         participant = self.participant_repository.get_participant_by_id(participant_id)
         if participant is None:
             raise ParticipantNotFoundError()
-        participant_info = {"감독": [], "출연": []}
-        roles = self.get_participant_roles(participant_id)
-        casts = set()
-        for role in roles:
-            casts.add(role.split("|")[0].strip())
-        for cast in casts:
-            movies = self.participant_repository.get_participant_movies(participant_id, cast)
-            if cast == "감독":
-                participant_info["감독"].extend(self._process_movies(movies, cast))
-            elif cast in ["주연", "조연", "단역"]:
-                participant_info["출연"].extend(self._process_movies(movies, cast))
-        participant_info["감독"] = sorted(participant_info["감독"], key=lambda x: x.year, reverse=True) # 연도 내림차순 정렬
-        participant_info["출연"] = sorted(participant_info["출연"], key=lambda x: x.year, reverse=True) # 연도 내림차순 정렬
-        # pagination
-        participant_info["감독"] = self._process_range(participant_info["감독"], begin, end)
-        participant_info["출연"] = self._process_range(participant_info["출연"], begin, end)
-        return [self._process_participants(role=cast, movies=movies) for cast, movies in participant_info.items()]
+        # 연도 내림차순 정렬, pagination은 쿼리에서 처리
+        participant_info = {
+            "감독": self.participant_repository.get_participant_movies(participant_id, ["감독"], pagination),
+            "출연": self.participant_repository.get_participant_movies(participant_id, ["주연", "조연", "단역"], pagination)
+        }
+        return [self._process_participants(role=cast, movies=self._process_movies(movies)) for cast, movies in participant_info.items()]
 
     
     def update_participant(self, participant_id: int, name: str | None, profile_url: str | None, biography: str | None):
@@ -82,8 +72,8 @@ class ParticipantService():
                 roles.add("배우")
         return list(roles)
     
-    def search_participant_list(self, name: str) -> list[ParticipantProfileResponse] | None:
-        participants = self.participant_repository.search_participant_list(name)
+    def search_participant_list(self, name: str, pagination: Pagination | None = None) -> list[ParticipantProfileResponse] | None:
+        participants = self.participant_repository.search_participant_list(name, pagination)
         return [ParticipantProfileResponse(
                 id=participant.id,
                 name=participant.name,
@@ -91,14 +81,14 @@ class ParticipantService():
                 roles=['temp'],
                 biography=None) for participant in participants]
 
-    def _process_movies(self, movies: list[Movie], cast: str) -> list[MovieDataResponse]:
+    def _process_movies(self, movies: list[tuple[Movie, str]]) -> list[MovieDataResponse]:
         return [MovieDataResponse(id=movie.id, 
                                   title=movie.title, 
                                   year=movie.year, 
                                   average_rating=movie.average_rating, 
                                   poster_url=movie.poster_url,
-                                  cast=cast) 
-                                  for movie in movies]
+                                  cast=role.split("|")[0].strip()) 
+                                  for movie, role in movies]
     
     def _process_participants(self, role: str, movies: list[MovieDataResponse]) -> ParticipantDataResponse:
         return ParticipantDataResponse(role=role, movies=movies)
@@ -112,14 +102,3 @@ class ParticipantService():
             biography=participant.biography,
             likes_count=participant.likes_count
         )
-    
-    def _process_range(self, response_list, begin: int | None, end: int | None) -> list[MovieDataResponse]:
-        if begin is None :
-            begin = 0
-        if end is None or end > len(response_list) :
-            end = len(response_list)
-        if begin > len(response_list) :
-            begin = len(response_list)
-        if begin < 0 or begin > end :
-            raise InvalidRangeError()
-        return response_list[begin : end]
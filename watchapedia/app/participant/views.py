@@ -5,6 +5,7 @@ from watchapedia.app.participant.dto.requests import ParticipantProfileUpdateReq
 from watchapedia.app.participant.dto.responses import ParticipantDataResponse, ParticipantProfileResponse
 from watchapedia.app.user.views import login_with_header
 from watchapedia.app.user.models import User
+from watchapedia.common.pagination import Pagination, get_pagination
 
 participant_router = APIRouter()
 
@@ -30,10 +31,9 @@ def get_participant_profile(
 def get_participant_movie(
     participant_id: int,
     participant_service: Annotated[ParticipantService, Depends()],
-    begin: int | None = None,
-    end: int | None = None,
+    pagination: Annotated[Pagination, Depends(get_pagination)],
 ) -> list[ParticipantDataResponse]:
-    return participant_service.get_participant_movies(participant_id, begin, end)
+    return participant_service.get_participant_movies(participant_id, pagination)
 
 
 @participant_router.patch('/{participant_id}',
@@ -0,0 +1,29 @@
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from fastapi import Depends
+from typing import Annotated
+from watchapedia.database.connection import get_db_session
+from watchapedia.common.cache import TTLCache
+from watchapedia.app.review.models import Review
+from watchapedia.app.recommend.engine import RatingMatrix
+
+# 전체 별점 행렬. 새 리뷰는 최대 ttl초 늦게 다른 유저의 추천에 반영 (대상 유저 본인의 별점은 매번 새로 조회)
+rating_matrix_cache = TTLCache(ttl=300, maxsize=1)
+
+class RecommendRepository():
+    def __init__(self, session: Annotated[Session, Depends(get_db_session)]) -> None:
+        self.session = session
+
+    def get_rating_matrix(self) -> RatingMatrix:
+        rating_matrix = rating_matrix_cache.get("all")
+        if rating_matrix is None:
+            get_ratings_query = select(Review.user_id, Review.movie_id, Review.rating).filter(Review.rating > 0)
+            rating_matrix = RatingMatrix.from_rows(self.session.execute(get_ratings_query).tuples())
+            rating_matrix_cache.set("all", rating_matrix)
+        return rating_matrix
+
+    def get_user_ratings(self, user_id: int) -> dict[int, float]:
+        get_ratings_query = select(Review.movie_id, Review.rating).filter(
+            (Review.user_id == user_id) & (Review.rating > 0)
+        )
+        return dict(self.session.execute(get_ratings_query).tuples().all())
@@ -35,6 +35,16 @@ def validate_date_query(calendar_q: Annotated[str, Query(..., description="YYYY-
     except ValueError:
         raise InvalidFieldFormatError("날짜 형식이 올바르지 않습니다: {date_str} (YYYY-MM-DD 형식이어야 함)")
 
+def validate_sort_query(
+    sort: Annotated[str | None, Query(description="popular(추천순), recent(최신순), rating_high(별점 높은순), rating_low(별점 낮은순)")] = None
+) -> str | None:
+    # sort는 None이거나 정해진 정렬 방식 중 하나여야 함
+    if sort is None:
+        return sort
+    if sort not in ["popular", "recent", "rating_high", "rating_low"] :
+        raise InvalidFieldFormatError("sort")
+    return sort
+
 
 class ReviewCreateRequest(BaseModel):
     content: Annotated[str | None, AfterValidator(validate_content)] = None
@@ -1,10 +1,10 @@
-from sqlalchemy import Integer, String, Float, ForeignKey, Boolean, JSON
+from sqlalchemy import Integer, String, Float, ForeignKey, Boolean, Date, Index, UniqueConstraint
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from datetime import datetime
 from watchapedia.database.common import Base
 from sqlalchemy import DateTime
 from typing import TYPE_CHECKING
-from datetime import datetime
+from datetime import date
 
 if TYPE_CHECKING:
     from watchapedia.app.movie.models import Movie
@@ -20,7 +20,6 @@ class Review(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
     spoiler: Mapped[bool] = mapped_column(Boolean, nullable=False)
     status: Mapped[str] = mapped_column(String(20), nullable=True)
-    view_date: Mapped[dict[str, bool]] = mapped_column(JSON, nullable=False, default=lambda: {datetime.now().strftime("%Y-%m-%d"): True})
     user_id: Mapped[int] = mapped_column(
         Integer, ForeignKey("user.id", ondelete="CASCADE"), nullable=False
     )
@@ -32,6 +31,15 @@ class Review(Base):
     movie: Mapped["Movie"] = relationship("Movie", back_populates="reviews")
 
     comments: Mapped[list["Comment"]] = relationship("Comment", back_populates="review", cascade="all, delete, delete-orphan")
+    views: Mapped[list["ReviewView"]] = relationship("ReviewView", back_populates="review", cascade="all, delete, delete-orphan")
+
+    __table_args__ = (
+        UniqueConstraint('user_id', 'movie_id', name='uq_review_user_movie'),  # 유저당 영화 하나에 리뷰 하나
+        # 영화별 리뷰 정렬 (추천순, 최신순, 별점순)
+        Index('ix_review_movie_likes_count', 'movie_id', 'likes_count', 'id'),
+        Index('ix_review_movie_created_at', 'movie_id', 'created_at', 'id'),
+        Index('ix_review_movie_rating', 'movie_id', 'rating', 'id'),
+    )
 
 
 class UserLikesReview(Base):
@@ -44,3 +52,34 @@ class UserLikesReview(Base):
     review_id: Mapped[int] = mapped_column(
         Integer, ForeignKey("review.id", ondelete="CASCADE"), nullable=False
     )
+
+    __table_args__ = (
+        UniqueConstraint('user_id', 'review_id', name='uq_user_likes_review'),
+    )
+
+
+class ReviewView(Base):
+    """
+    리뷰한 영화를 본 날짜. 한 리뷰에 여러 번(재관람) 기록될 수 있습니다.
+    """
+    __tablename__ = 'review_view'
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    review_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("review.id", ondelete="CASCADE"), nullable=False
+    )
+    review: Mapped["Review"] = relationship("Review", back_populates="views")
+    # 캘린더 조회용으로 리뷰의 user_id, movie_id를 함께 저장 (리뷰 생성 후 바뀌지 않음)
+    user_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("user.id", ondelete="CASCADE"), nullable=False
+    )
+    movie_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("movie.id", ondelete="CASCADE"), nullable=False
+    )
+    view_date: Mapped[date] = mapped_column(Date, nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint('review_id', 'view_date', name='uq_review_view_date'),
+        # 유저의 기간별 시청 기록 (캘린더). movie_id까지 포함해 인덱스만으로 조회
+        Index('ix_review_view_user_date', 'user_id', 'view_date', 'movie_id'),
+    )
@@ -1,13 +1,46 @@
-from sqlalchemy import select, func
-from sqlalchemy.orm import Session
+from sqlalchemy import Select, delete, select, func
+from sqlalchemy.orm import InstrumentedAttribute, Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import Depends
-from watchapedia.database.connection import get_db_session
-from typing import Annotated, Sequence
+from watchapedia.database.connection import get_db_session, get_async_db_session
+from watchapedia.database.counters import toggle_like
+from watchapedia.app.analysis.queue import enqueue_analysis_update
+from typing import Annotated, Collection, Sequence
 from watchapedia.app.user.models import User
-from watchapedia.app.review.models import Review, UserLikesReview
+from watchapedia.app.review.models import Review, ReviewView, UserLikesReview
+from watchapedia.app.comment.models import Comment
 from watchapedia.app.review.errors import RedundantReviewError, ReviewNotFoundError
 from datetime import datetime, date
-from sqlalchemy.orm.attributes import flag_modified
+from watchapedia.common.pagination import Pagination
+
+# sort별 (keyset 정렬 키, 내림차순 여부). 각각 (movie_id, 정렬 키, id) 인덱스를 사용
+REVIEW_SORT_ORDERS = {
+    "popular": ((Review.likes_count, Review.id), True),
+    "recent": ((Review.created_at, Review.id), True),
+    "rating_high": ((Review.rating, Review.id), True),
+    "rating_low": ((Review.rating, Review.id), False),
+}
+
+def build_reviews_by_movie_query(
+    movie_id: int,
+    sort: str | None = None,
+    exclude_user_ids: Collection[int] = ()
+) -> tuple[Select, tuple[InstrumentedAttribute, ...], bool]:
+    """
+    영화의 리뷰 목록 쿼리와 (keyset 정렬 키, 내림차순 여부). 동기/async repository가 함께 사용합니다.
+    """
+    reviews_list_query = select(Review).where(Review.movie_id == movie_id)
+    if exclude_user_ids:
+        # 차단한 유저의 리뷰는 pagination 전에 제외
+        reviews_list_query = reviews_list_query.where(Review.user_id.not_in(exclude_user_ids))
+    if sort is None:
+        return reviews_list_query, (Review.id,), False
+
+    if sort in ("rating_high", "rating_low"):
+        # 별점 없는 리뷰는 별점순 정렬에서 제외 (NULL은 keyset 비교가 불가능)
+        reviews_list_query = reviews_list_query.where(Review.rating > 0)
+    keys, descending = REVIEW_SORT_ORDERS[sort]
+    return reviews_list_query, keys, descending
 
 class ReviewRepository():
     def __init__(self, session: Annotated[Session, Depends(get_db_session)]) -> None:
@@ -34,6 +67,8 @@ class ReviewRepository():
             spoiler=spoiler,
             status=status
         )
+        # 리뷰 작성일을 첫 시청일로 기록
+        review.views.append(ReviewView(user_id=user_id, movie_id=movie_id, view_date=created_at.date()))
         self.session.add(review)
         self.session.flush()
 
@@ -60,22 +95,47 @@ class ReviewRepository():
 
         return review
     
-    def add_view_date(self, review: Review, new_view_date: str) -> Review:
-        review.view_date[new_view_date] = True
-        flag_modified(review, "view_date")
+    def add_view_date(self, review: Review, new_view_date: date) -> Review:
+        self.session.add(ReviewView(
+            review_id=review.id, user_id=review.user_id, movie_id=review.movie_id, view_date=new_view_date
+        ))
         self.session.flush()
         return review
     
-    def delete_view_date(self, review, delete_view_date: str) -> Review:
-        del review.view_date[delete_view_date]
-        flag_modified(review, "view_date")
-        self.session.flush()
+    def delete_view_date(self, review: Review, delete_view_date: date) -> Review:
+        delete_query = delete(ReviewView).where(
+            (ReviewView.review_id == review.id)
+            & (ReviewView.view_date == delete_view_date)
+        )
+        self.session.execute(delete_query)
 
         return review
 
-    def get_reviews_by_movie_id(self, movie_id: int) -> Sequence[Review]:
-        reviews_list_query = select(Review).where(Review.movie_id == movie_id)
-        return self.session.scalars(reviews_list_query).all()
+    def get_view_dates_by_review_ids(self, review_ids: list[int]) -> dict[int, list[date]]:
+        # review_id별 시청일 목록 (오래된 순)
+        view_dates: dict[int, list[date]] = {review_id: [] for review_id in review_ids}
+        if not review_ids:
+            return view_dates
+        get_view_dates_query = (
+            select(ReviewView.review_id, ReviewView.view_date)
+            .where(ReviewView.review_id.in_(review_ids))
+            .order_by(ReviewView.view_date)
+        )
+        for review_id, view_date in self.session.execute(get_view_dates_query):
+            view_dates[review_id].append(view_date)
+        return view_dates
+
+    def get_reviews_by_movie_id(
+        self,
+        movie_id: int,
+        pagination: Pagination | None = None,
+        sort: str | None = None,
+        exclude_user_ids: Collection[int] = ()
+    ) -> Sequence[Review]:
+        reviews_list_query, keys, descending = build_reviews_by_movie_query(movie_id, sort, exclude_user_ids)
+        return (pagination or Pagination()).fetch(
+            self.session, reviews_list_query, *keys, descending=descending, sort=sort
+        )
     
     def get_reviews_count_by_movie_id(self, movie_id: int) -> int:
         # content가 ""가 아니거나, null이 아닌 리뷰만 카운트
@@ -84,9 +144,9 @@ class ReviewRepository():
         )
         return self.session.scalar(count_query)
 
-    def get_reviews_by_user_id(self, user_id: int) -> Sequence[Review]:
+    def get_reviews_by_user_id(self, user_id: int, pagination: Pagination | None = None) -> Sequence[Review]:
         reviews_list_query = select(Review).where(Review.user_id == user_id)
-        return self.session.scalars(reviews_list_query).all()
+        return (pagination or Pagination()).fetch(self.session, reviews_list_query, Review.id)
 
     def get_review_by_review_id(self, review_id: int) -> Review:
         review = self.session.get(Review, review_id)
@@ -108,30 +168,23 @@ class ReviewRepository():
             return True
 
     def like_review(self, user_id: int, review: Review) -> None:
-        get_like_query = select(UserLikesReview).filter(
+        toggle_like(self.session, review, UserLikesReview, user_id, "review_id")
+        return review
+    
+    def get_liked_review_ids(self, user_id: int, review_ids: list[int]) -> set[int]:
+        # review_ids 중 user가 추천한 리뷰 id
+        if not review_ids:
+            return set()
+        get_liked_query = select(UserLikesReview.review_id).filter(
             (UserLikesReview.user_id == user_id)
-            & (UserLikesReview.review_id == review.id)
+            & (UserLikesReview.review_id.in_(review_ids))
         )
-        user_likes_review = self.session.scalar(get_like_query)
-
-        if user_likes_review is None :
-            user_likes_review = UserLikesReview(
-                user_id=user_id,
-                review_id=review.id,
-            )
-            self.session.add(user_likes_review)
-
-            review.likes_count += 1
-
-        else :
-            self.session.delete(user_likes_review)
+        return set(self.session.scalars(get_liked_query))
 
-            review.likes_count -= 1
-        
-        self.session.flush()
+    def get_authors_by_user_ids(self, user_ids: set[int]) -> dict[int, User]:
+        get_users_query = select(User).filter(User.id.in_(user_ids))
+        return {user.id: user for user in self.session.scalars(get_users_query)}
 
-        return review
-    
     def get_like_review_list(self, user_id: int) -> list[Review]:
         get_like_review_query = select(Review).join(UserLikesReview, Review.id == UserLikesReview.review_id).filter(UserLikesReview.user_id == user_id)
         return self.session.scalars(get_like_review_query).all()
@@ -140,3 +193,51 @@ class ReviewRepository():
     def delete_review_by_id(self, review: Review) -> None:
         self.session.delete(review)
         self.session.flush()
+
+    def enqueue_analysis_update(self, user_id: int) -> None:
+        # 별점 통계(UserRating)는 커밋 후 백그라운드에서 유저별로 모아 다시 계산
+        enqueue_analysis_update(self.session, user_id)
+
+class AsyncReviewRepository():
+    """
+    async 라우트용 조회 전용 repository. lazy loading을 쓸 수 없으므로 응답에 필요한 값은 쿼리로 따로 조회합니다.
+    """
+    def __init__(self, session: Annotated[AsyncSession, Depends(get_async_db_session)]) -> None:
+        self.session = session
+
+    async def get_reviews_by_movie_id(
+        self,
+        movie_id: int,
+        pagination: Pagination | None = None,
+        sort: str | None = None,
+        exclude_user_ids: Collection[int] = ()
+    ) -> Sequence[Review]:
+        reviews_list_query, keys, descending = build_reviews_by_movie_query(movie_id, sort, exclude_user_ids)
+        return await (pagination or Pagination()).fetch_async(
+            self.session, reviews_list_query, *keys, descending=descending, sort=sort
+        )
+
+    async def get_view_dates_by_review_ids(self, review_ids: list[int]) -> dict[int, list[date]]:
+        # review_id별 시청일 목록 (오래된 순)
+        view_dates: dict[int, list[date]] = {review_id: [] for review_id in review_ids}
+        if not review_ids:
+            return view_dates
+        get_view_dates_query = (
+            select(ReviewView.review_id, ReviewView.view_date)
+            .where(ReviewView.review_id.in_(review_ids))
+            .order_by(ReviewView.view_date)
+        )
+        for review_id, view_date in await self.session.execute(get_view_dates_query):
+            view_dates[review_id].append(view_date)
+        return view_dates
+
+    async def get_comments_counts_by_review_ids(self, review_ids: list[int]) -> dict[int, int]:
+        # 코멘트가 없는 리뷰는 결과에 포함되지 않음
+        if not review_ids:
+            return {}
+        comments_count_query = (
+            select(Comment.review_id, func.count())
+            .where(Comment.review_id.in_(review_ids))
+            .group_by(Comment.review_id)
+        )
+        return dict((await self.session.execute(comments_count_query)).all())
@@ -1,31 +1,38 @@
-from typing import Annotated
+from typing import Annotated, Sequence
 from fastapi import Depends
 from watchapedia.common.errors import PermissionDeniedError, InvalidRangeError
+from watchapedia.common.pagination import Pagination
 from watchapedia.app.user.models import User
-from watchapedia.app.movie.repository import MovieRepository
+from watchapedia.app.movie.repository import MovieRepository, AsyncMovieRepository
 from watchapedia.app.movie.errors import MovieNotFoundError
 from watchapedia.app.review.dto.responses import ReviewResponse
-from watchapedia.app.review.repository import ReviewRepository
+from watchapedia.app.review.repository import ReviewRepository, AsyncReviewRepository
 from watchapedia.app.comment.repository import CommentRepository
+from watchapedia.app.user.repository import UserRepository, AsyncUserRepository
+from watchapedia.app.calendar.repository import CalendarRepository
+from watchapedia.app.analysis.repository import UserPreferenceRepository
+from watchapedia.app.analysis.service import UserRatingService
 from watchapedia.app.review.models import Review
 from watchapedia.app.review.errors import RedundantReviewError, ReviewNotFoundError
 from datetime import datetime, date
-from watchapedia.app.analysis.service import UserRatingService, UserPreferenceService
 
 class ReviewService:
     def __init__(self,
         movie_repository: Annotated[MovieRepository, Depends()],
         review_repository: Annotated[ReviewRepository, Depends()],
         comment_repository: Annotated[CommentRepository, Depends()],
-        user_rating_service: Annotated[UserRatingService, Depends()],
-        user_preference_service: Annotated[UserPreferenceService, Depends()]
+        user_repository: Annotated[UserRepository, Depends()],
+        calendar_repository: Annotated[CalendarRepository, Depends()],
+        user_preference_repository: Annotated[UserPreferenceRepository, Depends()],
+        user_rating_service: Annotated[UserRatingService, Depends()]
     ) -> None:
         self.movie_repository = movie_repository
         self.review_repository = review_repository
         self.comment_repository = comment_repository
-
+        self.user_repository = user_repository
+        self.calendar_repository = calendar_repository
+        self.user_preference_repository = user_preference_repository
         self.user_rating_service = user_rating_service
-        self.user_preference_service = user_preference_service
 
     def create_review(self, user_id: int, movie_id: int, content: str | None,
                     rating: float | None, spoiler: bool, status: str | None
@@ -40,10 +47,21 @@ class ReviewService:
 
         new_review = self.review_repository.create_review(user_id=user_id, movie_id=movie_id, content=content, rating=rating,
                                                         created_at=datetime.now(), spoiler=spoiler, status=status)
-        self.movie_repository.update_average_rating(movie)
+        self.movie_repository.update_movie_stats(
+            movie,
+            new_rating=new_review.rating,
+            review_count_delta=int(_has_content(new_review.content)),
+            reviewed_at=new_review.created_at
+        )
 
-        self.user_rating_service.update_rating(user_id)
-        self.user_preference_service.update_preference(user_id, new_review.id)
+        self.user_preference_repository.update_entity_stats(
+            user_id, movie_id, new_rating=new_review.rating, movie_cnt_delta=1
+        )
+        self.user_rating_service.apply_review_change(
+            user_id, new_rating=new_review.rating, viewing_minutes_delta=movie.running_time or 0
+        )
+        self.review_repository.enqueue_analysis_update(user_id)
+        self.calendar_repository.invalidate_daily_stats(user_id, [new_review.created_at.year])
 
         return self._process_review_response(user_id, new_review)
 
@@ -55,38 +73,45 @@ class ReviewService:
             raise PermissionDeniedError()
 
         movie = review.movie
+        old_rating, had_content = review.rating, _has_content(review.content)
 
         updated_review = self.review_repository.update_review(review, content=content, rating=rating,
                                                             spoiler=spoiler, status=status)
-        self.movie_repository.update_average_rating(movie)
+        self.movie_repository.update_movie_stats(
+            movie,
+            old_rating=old_rating,
+            new_rating=updated_review.rating,
+            review_count_delta=int(_has_content(updated_review.content)) - int(had_content)
+        )
 
-        self.user_rating_service.update_rating(user_id)
-        self.user_preference_service.update_preference(user_id, review_id)
+        self.user_preference_repository.update_entity_stats(
+            user_id, movie.id, old_rating=old_rating, new_rating=updated_review.rating
+        )
+        self.user_rating_service.apply_review_change(user_id, old_rating=old_rating, new_rating=updated_review.rating)
+        self.review_repository.enqueue_analysis_update(user_id)
 
         return self._process_review_response(user_id, updated_review)
     
     def add_view_date(self, user_id: int, review_id: int, new_view_date: date) -> ReviewResponse:
         review = self.review_repository.get_review_by_review_id(review_id)
-        view_date = review.view_date
+        view_dates = self.review_repository.get_view_dates_by_review_ids([review.id])[review.id]
 
-        # date -> str 변환
-        new_view_date = new_view_date.strftime("%Y-%m-%d") 
-        if new_view_date not in view_date.keys():
+        if new_view_date not in view_dates:
             updated_review = self.review_repository.add_view_date(review, new_view_date)
+            self.calendar_repository.invalidate_daily_stats(review.user_id, [new_view_date.year])
         else:
             raise InvalidRangeError() # 존재하는 시청날짜 
         return self._process_review_response(user_id, updated_review)
 
     def delete_view_date(self, user_id: int, review_id: int, delete_view_date: date) -> ReviewResponse:
         review = self.review_repository.get_review_by_review_id(review_id)
-        view_date = review.view_date
-        # date -> str 변환
-        delete_view_date = delete_view_date.strftime("%Y-%m-%d")
-        if delete_view_date in view_date.keys():
-            if len(view_date) == 1:
+        view_dates = self.review_repository.get_view_dates_by_review_ids([review.id])[review.id]
+        if delete_view_date in view_dates:
+            if len(view_dates) == 1:
                 raise InvalidRangeError() # 시청기록1회는삭제불가 
             else:
                 updated_review = self.review_repository.delete_view_date(review, delete_view_date)
+                self.calendar_repository.invalidate_daily_stats(review.user_id, [delete_view_date.year])
         else:
             raise InvalidRangeError() # 해당날짜 시청기록없음 
         return self._process_review_response(user_id, updated_review)
@@ -101,25 +126,26 @@ class ReviewService:
         review = self.review_repository.get_review_by_review_id(review_id)
         return self._process_review_response(-1, review)
 
-    def movie_reviews(self, movie_id: int, begin: int | None, end: int | None) -> list[ReviewResponse]:
+    def movie_reviews(self, movie_id: int, pagination: Pagination, sort: str | None = None) -> list[ReviewResponse]:
         movie = self.movie_repository.get_movie_by_movie_id(movie_id)
         if movie is None :
             raise MovieNotFoundError()
 
-        reviews = self.review_repository.get_reviews_by_movie_id(movie_id)
-        return self._process_range([self._process_review_response(-1, review) for review in reviews], begin, end)
+        reviews = self.review_repository.get_reviews_by_movie_id(movie_id, pagination, sort)
+        return self._process_review_responses(-1, reviews)
 
-    def movie_user_reviews(self, user_id: int, movie_id: int, begin: int | None, end: int | None) -> list[ReviewResponse]:
+    def movie_user_reviews(self, user_id: int, movie_id: int, pagination: Pagination, sort: str | None = None) -> list[ReviewResponse]:
         movie = self.movie_repository.get_movie_by_movie_id(movie_id)
         if movie is None :
             raise MovieNotFoundError()
 
-        reviews = self.review_repository.get_reviews_by_movie_id(movie_id)
-        return self._process_range([self._process_review_response(user_id, review) for review in reviews], begin, end)
+        blocked_user_ids = self.user_repository.get_blocked_user_ids(user_id)
+        reviews = self.review_repository.get_reviews_by_movie_id(movie_id, pagination, sort, blocked_user_ids)
+        return self._process_review_responses(user_id, reviews)
 
-    def user_reviews(self, user_id: int, begin: int | None, end: int | None) -> list[ReviewResponse]:
-        reviews = self.review_repository.get_reviews_by_user_id(user_id)
-        return self._process_range([self._process_review_response(user_id, review) for review in reviews], begin, end)
+    def user_reviews(self, user_id: int, pagination: Pagination) -> list[ReviewResponse]:
+        reviews = self.review_repository.get_reviews_by_user_id(user_id, pagination)
+        return self._process_review_responses(user_id, reviews)
 
 
     def like_review(self, user_id: int, review_id: int) -> ReviewResponse :
@@ -129,7 +155,7 @@ class ReviewService:
     
     def get_like_review_list(self, user_id: int) -> list[ReviewResponse]:
         reviews = self.review_repository.get_like_review_list(user_id)
-        return [self._process_review_response(user_id, review) for review in reviews]
+        return self._process_review_responses(user_id, reviews)
 
     def delete_review_by_id(self, user_id: int, review_id: int) -> None:
         review = self.review_repository.get_review_by_review_id(review_id)
@@ -139,37 +165,92 @@ class ReviewService:
             raise PermissionDeniedError()
 
         movie_id = review.movie_id # 삭제전 movie_id 저장
+        view_dates = self.review_repository.get_view_dates_by_review_ids([review.id])[review.id]
+        self.movie_repository.update_movie_stats(
+            review.movie,
+            old_rating=review.rating,
+            review_count_delta=-int(_has_content(review.content))
+        )
+        self.user_preference_repository.update_entity_stats(
+            user_id, movie_id, old_rating=review.rating, movie_cnt_delta=-1
+        )
+        self.user_rating_service.apply_review_change(
+            user_id, old_rating=review.rating, viewing_minutes_delta=-(review.movie.running_time or 0)
+        )
         self.review_repository.delete_review_by_id(review)
+        self.calendar_repository.invalidate_daily_stats(user_id, [view_date.year for view_date in view_dates])
 
-        self.user_rating_service.update_rating(user_id)
-        self.user_preference_service.update_preference(user_id, review_id, delete=True, movie_id=movie_id)
+        self.review_repository.enqueue_analysis_update(user_id)
 
 
-    def _process_range(self, response_list, begin: int | None, end: int | None) -> list[ReviewResponse]:
-        if begin is None :
-            begin = 0
-        if end is None or end > len(response_list) :
-            end = len(response_list)
-        if begin > len(response_list) :
-            begin = len(response_list)
-        if begin < 0 or begin > end :
-            raise InvalidRangeError()
-        return response_list[begin : end]
-
     def _process_review_response(self, user_id: int, review: Review) -> ReviewResponse:
-        return ReviewResponse(
+        return self._process_review_responses(user_id, [review])[0]
+
+    def _process_review_responses(self, user_id: int, reviews: Sequence[Review]) -> list[ReviewResponse]:
+        # 리뷰 목록 전체에 대해 작성자, 추천 여부, 코멘트 수, 시청일을 각각 한 번의 쿼리로 조회
+        if not reviews:
+            return []
+        review_ids = [review.id for review in reviews]
+        authors = self.review_repository.get_authors_by_user_ids({review.user_id for review in reviews})
+        liked_review_ids = self.review_repository.get_liked_review_ids(user_id, review_ids)
+        comments_counts = self.comment_repository.get_comments_counts_by_review_ids(review_ids)
+        view_dates = self.review_repository.get_view_dates_by_review_ids(review_ids)
+        return build_review_responses(reviews, authors, liked_review_ids, comments_counts, view_dates)
+
+class AsyncReviewService():
+    """
+    조회 전용 async 서비스. 쓰기 작업과 로그인이 필요한 목록은 ReviewService(동기)를 사용합니다.
+    """
+    def __init__(self,
+        movie_repository: Annotated[AsyncMovieRepository, Depends()],
+        review_repository: Annotated[AsyncReviewRepository, Depends()],
+        user_repository: Annotated[AsyncUserRepository, Depends()]
+    ) -> None:
+        self.movie_repository = movie_repository
+        self.review_repository = review_repository
+        self.user_repository = user_repository
+
+    async def movie_reviews(self, movie_id: int, pagination: Pagination, sort: str | None = None) -> list[ReviewResponse]:
+        if not await self.movie_repository.movie_exists(movie_id):
+            raise MovieNotFoundError()
+
+        reviews = await self.review_repository.get_reviews_by_movie_id(movie_id, pagination, sort)
+        if not reviews:
+            return []
+        # 비로그인 조회이므로 추천 여부는 조회하지 않음
+        review_ids = [review.id for review in reviews]
+        authors = await self.user_repository.get_users_by_user_ids({review.user_id for review in reviews})
+        comments_counts = await self.review_repository.get_comments_counts_by_review_ids(review_ids)
+        view_dates = await self.review_repository.get_view_dates_by_review_ids(review_ids)
+        return build_review_responses(reviews, authors, set(), comments_counts, view_dates)
+
+def build_review_responses(
+    reviews: Sequence[Review],
+    authors: dict[int, User],
+    liked_review_ids: set[int],
+    comments_counts: dict[int, int],
+    view_dates: dict[int, list[date]]
+) -> list[ReviewResponse]:
+    return [
+        ReviewResponse(
             id=review.id,
-            user_id=review.user.id,
-            user_name=review.user.username,
-            profile_url=review.user.profile_url,
+            user_id=review.user_id,
+            user_name=authors[review.user_id].username,
+            profile_url=authors[review.user_id].profile_url,
             movie_id=review.movie_id,
             content=review.content,
             rating=review.rating,
             likes_count=review.likes_count,
             created_at=review.created_at,
-            view_date=review.view_date,
+            view_date={view_date.strftime("%Y-%m-%d"): True for view_date in view_dates[review.id]},
             spoiler=review.spoiler,
             status=review.status,
-            like=self.review_repository.like_info(user_id, review),
-            comments_count=self.comment_repository.get_comments_count_by_review_id(review.id)
+            like=review.id in liked_review_ids,
+            comments_count=comments_counts.get(review.id, 0)
         )
+        for review in reviews
+    ]
+
+def _has_content(content: str | None) -> bool:
+    # content가 ""가 아니거나, null이 아닌 리뷰만 텍스트 리뷰로 카운트
+    return content is not None and content != ""
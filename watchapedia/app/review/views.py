@@ -4,11 +4,13 @@ from typing import Annotated
 from datetime import datetime
 from watchapedia.app.user.views import login_with_header
 from watchapedia.app.user.models import User
-from watchapedia.app.review.dto.requests import ReviewCreateRequest, ReviewUpdateRequest, validate_date_query
+from watchapedia.app.review.dto.requests import ReviewCreateRequest, ReviewUpdateRequest, validate_date_query, validate_sort_query
 from watchapedia.app.review.dto.responses import ReviewResponse
 from watchapedia.app.review.models import Review
-from watchapedia.app.review.service import ReviewService
+from watchapedia.app.review.service import ReviewService, AsyncReviewService
 from watchapedia.app.review.errors import *
+from watchapedia.database.connection import get_primary_db_session
+from watchapedia.common.pagination import Pagination, get_pagination
 
 review_router = APIRouter()
 
@@ -16,6 +18,7 @@ review_router = APIRouter()
                 status_code=201, 
                 summary="리뷰 작성", 
                 description="movie_id, content와 rating, spoiler 여부를 받아 리뷰를 작성하고 성공 시 username을 포함하여 리뷰를 반환합니다.",
+                dependencies=[Depends(get_primary_db_session)]  # 작성 직후 응답을 만들기 위해 primary에서 읽음
             )
 def create_review(
     user: Annotated[User, Depends(login_with_header)],
@@ -30,7 +33,8 @@ def create_review(
                 status_code=200, 
                 summary="리뷰 수정", 
                 description="review_id와 content, rating, spoiler 여부를 받아 리뷰를 수정하고 반환합니다.",
-                response_model=ReviewResponse
+                response_model=ReviewResponse,
+                dependencies=[Depends(get_primary_db_session)]
                 )
 def update_review(
     user: Annotated[User, Depends(login_with_header)],
@@ -84,10 +88,9 @@ def delete_view_date(
 def get_reviews(
     user: Annotated[User, Depends(login_with_header)],
     review_service: Annotated[ReviewService, Depends()],
-    begin: int | None = None,
-    end: int | None = None,
+    pagination: Annotated[Pagination, Depends(get_pagination)],
 ):
-    return review_service.user_reviews(user.id, begin, end)
+    return review_service.user_reviews(user.id, pagination)
 
 @review_router.get('/user/{user_id}',
                 status_code=200,
@@ -98,24 +101,23 @@ def get_reviews(
 def get_reviews_by_user(
     user_id: int,
     review_service: Annotated[ReviewService, Depends()],
-    begin: int | None = None,
-    end: int | None = None,
+    pagination: Annotated[Pagination, Depends(get_pagination)],
 ):
-    return review_service.user_reviews(user_id, begin, end)
+    return review_service.user_reviews(user_id, pagination)
 
 @review_router.get('/movie/{movie_id}',
                 status_code=200, 
                 summary="비로그인 리뷰 출력", 
-                description="[로그인 불필요] movie_id를 받아 해당 영화에 달린 리뷰들을 반환합니다",
+                description="[로그인 불필요] movie_id를 받아 해당 영화에 달린 리뷰들을 sort 순서로 반환합니다. 별점순 정렬에는 별점이 있는 리뷰만 포함됩니다",
                 response_model=list[ReviewResponse]
                 )
-def get_reviews_by_movie(
+async def get_reviews_by_movie(
     movie_id: int,
-    review_service: Annotated[ReviewService, Depends()],
-    begin: int | None = None,
-    end: int | None = None,
+    review_service: Annotated[AsyncReviewService, Depends()],
+    pagination: Annotated[Pagination, Depends(get_pagination)],
+    sort: str | None = Depends(validate_sort_query),
 ):
-    return review_service.movie_reviews(movie_id, begin, end)
+    return await review_service.movie_reviews(movie_id, pagination, sort)
     
 @review_router.get('/list/{movie_id}',
                 status_code=200, 
@@ -127,10 +129,10 @@ def get_reviews_by_movie_and_user(
     user: Annotated[User, Depends(login_with_header)],
     movie_id: int,
     review_service: Annotated[ReviewService, Depends()],
-    begin: int | None = None,
-    end: int | None = None,
+    pagination: Annotated[Pagination, Depends(get_pagination)],
+    sort: str | None = Depends(validate_sort_query),
 ):
-    return review_service.movie_user_reviews(user.id, movie_id, begin, end)
+    return review_service.movie_user_reviews(user.id, movie_id, pagination, sort)
 
 @review_router.get('/{review_id}',
                 status_code=200, 
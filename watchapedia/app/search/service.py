@@ -6,7 +6,7 @@ from watchapedia.app.user.service import UserService
 from watchapedia.app.participant.service import ParticipantService
 from watchapedia.app.collection.service import CollectionService
 from watchapedia.app.genre.repository import GenreRepository
-from watchapedia.common.errors import InvalidRangeError
+from watchapedia.common.pagination import Pagination
 
 class SearchService():
     def __init__(self,
@@ -24,50 +24,29 @@ class SearchService():
 
     
     def search(self,
-            name: str
+            name: str,
+            pagination: Pagination
             ) -> None:
-        self.movie_list = self.movie_service.search_movie_list(title=name)
-        self.user_list = self.user_service.search_user_list(name)
-        self.participant_list = self.participant_service.search_participant_list(name)
-        self.collection_list = self.collection_service.search_collection_list(name)
+        # 각 목록에 같은 범위를 쿼리에서 적용
+        self.movie_id_list = self.movie_service.search_movie_id_list(title=name, pagination=pagination)
+        self.user_list = self.user_service.search_user_list(name, pagination)
+        self.participant_list = self.participant_service.search_participant_list(name, pagination)
+        self.collection_list = self.collection_service.search_collection_list(name, pagination)
 
     def search_genre(self,
-            name: str
+            name: str,
+            pagination: Pagination
             ) -> None:
         self.genre_list = self.genre_repository.get_genres_by_genre_name(name)
         self.movie_dict_by_genre = {}
         for genre in self.genre_list:
-            self.movie_dict_by_genre[genre.name] = self.movie_service.search_movie_list(genres=[genre.name])
-        for key in self.movie_dict_by_genre:
-            self.movie_dict_by_genre[key] = [movie.id for movie in self.movie_dict_by_genre[key]]
-
-    def process_search_response(self, begin: int | None, end: int | None) -> SearchResponse:
-        movie_list = self._process_range([i.id for i in self.movie_list], begin, end)
-        user_list = self._process_range([i.id for i in self.user_list], begin, end)
-        participant_list = self._process_range([i.id for i in self.participant_list], begin, end)
-        collection_list = self._process_range(sorted([i.id for i in self.collection_list]), begin, end)
-        collection_list.sort()
-
-        paginated_movie_dict_by_genre = {
-            genre: self._process_range(movies, begin, end)
-            for genre, movies in self.movie_dict_by_genre.items()
-        }
+            self.movie_dict_by_genre[genre.name] = self.movie_service.search_movie_id_list(genres=[genre.name], pagination=pagination)
 
+    def process_search_response(self) -> SearchResponse:
         return SearchResponse(
-                movie_list=movie_list,
-                user_list=user_list,
-                participant_list=participant_list,
-                collection_list=collection_list,
-                movie_dict_by_genre=paginated_movie_dict_by_genre
+                movie_list=self.movie_id_list,
+                user_list=[i.id for i in self.user_list],
+                participant_list=[i.id for i in self.participant_list],
+                collection_list=[i.id for i in self.collection_list],
+                movie_dict_by_genre=self.movie_dict_by_genre
                 )
-
-    def _process_range(self, response_list, begin: int | None, end: int | None) -> list:
-        if begin is None :
-            begin = 0
-        if end is None or end > len(response_list) :
-            end = len(response_list)
-        if begin > len(response_list) :
-            begin = len(response_list)
-        if begin < 0 or begin > end :
-            raise InvalidRangeError()
-        return response_list[begin : end]
\ No newline at end of file
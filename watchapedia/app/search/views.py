@@ -4,17 +4,17 @@ from fastapi import APIRouter, Depends
 from watchapedia.app.search.service import SearchService
 from watchapedia.app.search.dto.responses import SearchResponse
 from watchapedia.app.search.dto.requests import validate_search_query
+from watchapedia.common.pagination import Pagination, get_pagination
 
 search_router = APIRouter()
 
 @search_router.get("", status_code=200, summary="검색", description="검색어와 일치하는 movie, user, participant, collection, genre id 반환")
 def search(
         search_service: Annotated[SearchService, Depends()],
+        pagination: Annotated[Pagination, Depends(get_pagination)],
         search_q: str = Depends(validate_search_query),
-        begin: int | None = None,
-        end: int | None = None,
         ) -> SearchResponse:
-    search_service.search(search_q)
-    search_service.search_genre(search_q)
-    return search_service.process_search_response(begin, end)
+    search_service.search(search_q, pagination)
+    search_service.search_genre(search_q, pagination)
+    return search_service.process_search_response()
 
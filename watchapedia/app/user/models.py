@@ -1,4 +1,4 @@
-from sqlalchemy import Integer, String, ForeignKey, UniqueConstraint
+from sqlalchemy import Integer, String, ForeignKey, UniqueConstraint, Index
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from datetime import datetime
 from sqlalchemy import DateTime
@@ -47,6 +47,7 @@ class Follow(Base):
     
     __table_args__ = (
         UniqueConstraint('follower_id', 'following_id', name='uq_follower_following'),
+        Index('ix_follow_following_id', 'following_id'),
     )
 
 class UserBlock(Base):
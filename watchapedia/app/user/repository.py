@@ -1,7 +1,8 @@
 from sqlalchemy import select, func
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import Depends
-from watchapedia.database.connection import get_db_session
+from watchapedia.database.connection import get_db_session, get_async_db_session
 from typing import Annotated
 from watchapedia.app.user.models import User, BlockedToken, Follow, UserBlock
 from watchapedia.app.review.models import Review
@@ -12,6 +13,11 @@ from watchapedia.auth.utils import create_hashed_password
 from datetime import datetime
 from watchapedia.app.user.errors import UserAlreadyExistsError
 from watchapedia.app.analysis.models import UserRating, UserPreference
+from watchapedia.common.pagination import Pagination
+from watchapedia.common.cache import TTLCache, invalidate_on_commit
+
+# 유저별 차단한 유저 id 집합. 목록 조회마다 user_block을 다시 읽지 않도록 캐시
+blocked_users_cache = TTLCache(ttl=60)
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
@@ -35,7 +41,7 @@ class UserRepository():
         self.session.add(user)
         
         user.user_rating = UserRating(rating_num=0, rating_avg=None, rating_mode=None, rating_dist=None)
-        user.user_preference = UserPreference(actor_dict=None)
+        user.user_preference = UserPreference()
 
     def get_user(self, username: str, login_id: str) -> User | None:
         get_user_query = select(User).filter(
@@ -69,13 +75,13 @@ class UserRepository():
         unfollow = self.session.scalar(unfollow_query)
         self.session.delete(unfollow)
 
-    def get_followings(self, user_id: int) -> list[User]:
+    def get_followings(self, user_id: int, pagination: Pagination | None = None) -> list[User]:
         get_followings_query = select(User).join(Follow, Follow.following_id == User.id).filter(Follow.follower_id == user_id)
-        return self.session.scalars(get_followings_query).all()
+        return (pagination or Pagination()).fetch(self.session, get_followings_query, User.id)
     
-    def get_followers(self, user_id: int) -> list[User]:
+    def get_followers(self, user_id: int, pagination: Pagination | None = None) -> list[User]:
         get_followers_query = select(User).join(Follow, Follow.follower_id == User.id).filter(Follow.following_id == user_id)
-        return self.session.scalars(get_followers_query).all()
+        return (pagination or Pagination()).fetch(self.session, get_followers_query, User.id)
     
     def get_followings_count(self, user_id: int) -> int:
         get_following_count_query = select(func.count()).select_from(Follow).where(Follow.follower_id == user_id)
@@ -110,8 +116,10 @@ class UserRepository():
         return self.session.scalar(get_user_query)
     
     # username으로 복수의 user get. 부분집합 허용.
-    def search_user_list(self, username: str) -> list[User] | None:
+    def search_user_list(self, username: str, pagination: Pagination | None = None) -> list[User] | None:
         get_user_query = select(User).filter(User.username.ilike(f"%{username}%"))
+        if pagination is not None:
+            get_user_query = pagination.slice(get_user_query.order_by(User.id))
         return self.session.execute(get_user_query).scalars().all()
     
     def block_user(self, blocker_id: int, blocked_id: int) -> None:
@@ -129,6 +137,16 @@ class UserRepository():
         get_blocked_users_query = select(UserBlock).filter(UserBlock.blocker_id == user_id)
         return [user_block.blocked_id for user_block in self.session.execute(get_blocked_users_query).scalars().all()]
     
+    def get_blocked_user_ids(self, user_id: int) -> frozenset[int]:
+        blocked_user_ids = blocked_users_cache.get(user_id)
+        if blocked_user_ids is None:
+            blocked_user_ids = frozenset(self.get_blocked_users(user_id))
+            blocked_users_cache.set(user_id, blocked_user_ids)
+        return blocked_user_ids
+
+    def invalidate_blocked_user_ids(self, user_id: int) -> None:
+        invalidate_on_commit(self.session, blocked_users_cache, user_id)
+
     def is_blocked(self, blocker_id: int, blocked_id: int) -> bool:
         is_blocked_query = select(UserBlock).filter(
             (UserBlock.blocker_id == blocker_id) & (UserBlock.blocked_id == blocked_id)
@@ -154,3 +172,28 @@ class UserRepository():
             (Follow.follower_id == follower_id) & (Follow.following_id == following_id)
         )
         return self.session.scalar(follow_query) is not None
+
+class AsyncUserRepository():
+    """
+    async 라우트용 조회 전용 repository.
+    """
+    def __init__(self, session: Annotated[AsyncSession, Depends(get_async_db_session)]) -> None:
+        self.session = session
+
+    async def get_user_by_user_id(self, user_id: int) -> User | None:
+        get_user_query = select(User).filter(User.id == user_id)
+        return await self.session.scalar(get_user_query)
+
+    async def get_user_by_login_id(self, login_id: str) -> User | None:
+        get_user_query = select(User).filter(User.login_id == login_id)
+        return await self.session.scalar(get_user_query)
+
+    async def get_user_by_username(self, username: str) -> User | None:
+        get_user_query = select(User).filter(User.username == username)
+        return await self.session.scalar(get_user_query)
+
+    async def get_users_by_user_ids(self, user_ids: set[int]) -> dict[int, User]:
+        if not user_ids:
+            return {}
+        get_users_query = select(User).filter(User.id.in_(user_ids))
+        return {user.id: user for user in await self.session.scalars(get_users_query)}
@@ -1,7 +1,8 @@
 from typing import Annotated
 from watchapedia.app.user.repository import UserRepository
 from fastapi import Depends
-from watchapedia.common.errors import InvalidCredentialsError, InvalidRangeError, InvalidTokenError, BlockedTokenError
+from watchapedia.common.errors import InvalidCredentialsError, InvalidTokenError, BlockedTokenError
+from watchapedia.common.pagination import Pagination
 from watchapedia.app.user.errors import UserAlreadyExistsError, UserNotFoundError, UserAlreadyFollowingError, UserAlreadyNotFollowingError, CANNOT_FOLLOW_MYSELF_Error, CANNOT_BLOCK_MYSELF_Error, UserBlockedError, UserNotBlockedError
 from watchapedia.app.user.dto.responses import MyProfileResponse, UserResponse, UserFollowResponse
 from watchapedia.auth.utils import verify_password
@@ -45,17 +46,17 @@ class UserService:
             raise UserAlreadyNotFollowingError()
         self.user_repository.unfollow(follower_id, following_id)
     
-    def get_followings(self, user_id: int, begin: int | None, end: int | None) -> list[UserFollowResponse]:
+    def get_followings(self, user_id: int, pagination: Pagination) -> list[UserFollowResponse]:
         if self.get_user_by_user_id(user_id) is None:
             raise UserNotFoundError()
-        users= self.user_repository.get_followings(user_id)
-        return self._process_range([self._process_user_follow_response(user) for user in users], begin, end)
+        users= self.user_repository.get_followings(user_id, pagination)
+        return [self._process_user_follow_response(user) for user in users]
     
-    def get_followers(self, user_id: int, begin: int | None, end: int | None) -> list[UserFollowResponse]:
+    def get_followers(self, user_id: int, pagination: Pagination) -> list[UserFollowResponse]:
         if self.get_user_by_user_id(user_id) is None:
             raise UserNotFoundError()
-        users = self.user_repository.get_followers(user_id)
-        return self._process_range([self._process_user_follow_response(user) for user in users], begin, end)
+        users = self.user_repository.get_followers(user_id, pagination)
+        return [self._process_user_follow_response(user) for user in users]
     
     def get_followings_count(self, user_id: int) -> int:
         return self.user_repository.get_followings_count(user_id)
@@ -88,8 +89,8 @@ class UserService:
     def get_user_by_username(self, username: str) -> User | None:
         return self.user_repository.get_user_by_username(username)
     
-    def search_user_list(self, username: str) -> list[UserResponse] | None:
-        users = self.user_repository.search_user_list(username)
+    def search_user_list(self, username: str, pagination: Pagination | None = None) -> list[UserResponse] | None:
+        users = self.user_repository.search_user_list(username, pagination)
         return [UserResponse(
                 id=user.id) for user in users]
     
@@ -101,6 +102,7 @@ class UserService:
         if self.user_repository.is_blocked(blocker_id, blocked_id):
             raise UserBlockedError()
         self.user_repository.block_user(blocker_id, blocked_id)
+        self.user_repository.invalidate_blocked_user_ids(blocker_id)
 
     def unblock_user(self, blocker_id: int, blocked_id: int) -> None:
         if self.get_user_by_user_id(blocked_id) is None:
@@ -110,6 +112,7 @@ class UserService:
         if not self.user_repository.is_blocked(blocker_id, blocked_id):
             raise UserNotBlockedError()
         self.user_repository.unblock_user(blocker_id, blocked_id)
+        self.user_repository.invalidate_blocked_user_ids(blocker_id)
         
     def get_blocked_users(self, user_id: int) -> list[int]:
         if self.get_user_by_user_id(user_id) is None:
@@ -157,14 +160,3 @@ class UserService:
             login_id=user.login_id,
             profile_url=user.profile_url
             )
-    
-    def _process_range(self, response_list, begin: int | None, end: int | None) -> list[MyProfileResponse]:
-        if begin is None :
-            begin = 0
-        if end is None or end > len(response_list) :
-            end = len(response_list)
-        if begin > len(response_list) :
-            begin = len(response_list)
-        if begin < 0 or begin > end :
-            raise InvalidRangeError()
-        return response_list[begin : end]
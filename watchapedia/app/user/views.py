@@ -11,6 +11,7 @@ from watchapedia.app.collection.service import CollectionService
 from watchapedia.app.review.service import ReviewService
 from watchapedia.app.user.errors import InvalidTokenError, UserNotFoundError
 from watchapedia.common.errors import InvalidCredentialsError
+from watchapedia.common.pagination import Pagination, get_pagination
 from watchapedia.auth.settings import JWT_SETTINGS
 from datetime import datetime
 
@@ -118,19 +119,17 @@ def unfollow(
 def followings(
     user_id: int,
     user_service: Annotated[UserService, Depends()],
-    begin: int | None = None,
-    end: int | None = None,
+    pagination: Annotated[Pagination, Depends(get_pagination)],
 ):
-    return user_service.get_followings(user_id, begin, end)
+    return user_service.get_followings(user_id, pagination)
 
 @user_router.get('/followers/{user_id}', status_code=200, summary="팔로워 목록", description="user_id를 받아 해당 유저를 팔로우하는 유저들의 목록을 반환합니다.")
 def followers(
     user_id: int,
     user_service: Annotated[UserService, Depends()],
-    begin: int | None = None,
-    end: int | None = None,
+    pagination: Annotated[Pagination, Depends(get_pagination)],
 ):
-    return user_service.get_followers(user_id, begin, end)
+    return user_service.get_followers(user_id, pagination)
 
 @user_router.get('/profile/{user_id}', status_code=200, summary="프로필 조회", description="user_id를 받아 해당 유저의 프로필 정보를 반환합니다.")
 def profile(
@@ -0,0 +1,76 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+
+class TTLCache:
+    """
+    프로세스 내 TTL 캐시. 항목은 ttl초 뒤 만료되고, maxsize를 넘으면 가장 오래된 항목부터 버립니다.
+
+    워커 프로세스마다 따로 유지되므로 다른 프로세스의 변경은 최대 ttl초 늦게 반영됩니다.
+    """
+    def __init__(self, ttl: float, maxsize: int = 10000) -> None:
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return default
+            expires_at, value = item
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return default
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+class LRUCache(TTLCache):
+    """
+    조회된 항목을 가장 최근으로 옮기는 TTLCache. maxsize를 넘으면 가장 오래 조회되지 않은 항목부터 버립니다.
+    """
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        value = super().get(key, _MISSING)
+        if value is _MISSING:
+            return default
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+        return value
+
+
+_MISSING = object()
+
+
+def invalidate_on_commit(session: Session, cache: TTLCache, *keys: Hashable) -> None:
+    """
+    캐시 항목을 지금 비우고, session이 커밋된 뒤에 한 번 더 비웁니다.
+    """
+    for key in keys:
+        cache.delete(key)
+
+    # 커밋 전에 다른 요청이 이전 값을 다시 캐시할 수 있으므로 커밋 후에도 한 번 더 비움
+    def delete_after_commit(session: Session) -> None:
+        for key in keys:
+            cache.delete(key)
+    event.listen(session, "after_commit", delete_after_commit, once=True)
@@ -34,4 +34,8 @@ class InvalidFormatError(HTTPException):
 
 class InvalidRangeError(HTTPException):
     def __init__(self):
-        super().__init__(status_code=400, detail="Invalid range")
\ No newline at end of file
+        super().__init__(status_code=400, detail="Invalid range")
+
+class InvalidCursorError(HTTPException):
+    def __init__(self):
+        super().__init__(status_code=400, detail="Invalid cursor")
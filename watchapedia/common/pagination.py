@@ -0,0 +1,164 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Sequence
+from fastapi import Response
+from sqlalchemy import Select, and_, or_
+from sqlalchemy.orm import InstrumentedAttribute, Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from watchapedia.common.errors import InvalidRangeError, InvalidCursorError
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(values: Sequence[Any], sort: str | None = None) -> str:
+    # 다른 정렬의 cursor로 조회하지 않도록 정렬 이름을 함께 저장
+    payload = {
+        "sort": sort,
+        "keys": [{"$dt": value.isoformat()} if isinstance(value, datetime) else value for value in values]
+    }
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[str | None, list[Any]]:
+    """
+    cursor를 (정렬 이름, 정렬 key 값 목록)으로 복원합니다.
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise InvalidCursorError()
+    if not isinstance(payload, dict) or payload.keys() != {"sort", "keys"}:
+        raise InvalidCursorError()
+    sort, values = payload["sort"], payload["keys"]
+    if (sort is not None and not isinstance(sort, str)) or not isinstance(values, list) or not values:
+        raise InvalidCursorError()
+    try:
+        return sort, [_decode_cursor_value(value) for value in values]
+    except (KeyError, TypeError, ValueError):
+        raise InvalidCursorError()
+
+
+def _decode_cursor_value(value: Any) -> Any:
+    # 조작된 cursor의 list/object가 그대로 SQL 비교에 들어가지 않도록 {"$dt": str}와 스칼라만 허용
+    if isinstance(value, dict):
+        if value.keys() != {"$dt"} or not isinstance(value["$dt"], str):
+            raise InvalidCursorError()
+        return datetime.fromisoformat(value["$dt"])
+    if value is not None and not isinstance(value, (int, float, str)):
+        raise InvalidCursorError()
+    return value
+
+
+def _after(keys: Sequence[InstrumentedAttribute], values: Sequence[Any], descending: bool):
+    # (a, b) > (x, y) 를 a > x OR (a = x AND b > y) 로 풀어 씀 (MySQL에서 인덱스 range scan 가능)
+    conditions = []
+    for i, key in enumerate(keys):
+        equals = [keys[j] == values[j] for j in range(i)]
+        conditions.append(and_(*equals, key < values[i] if descending else key > values[i]))
+    return or_(*conditions)
+
+
+class Pagination:
+    """
+    begin/end 범위 조회를 repository 쿼리의 LIMIT/OFFSET으로 내려보냅니다.
+
+    cursor가 주어지면 OFFSET 대신 이전 페이지 마지막 행의 정렬 키 다음부터 조회하고(keyset),
+    이때 begin/end는 페이지 크기(end - begin)로만 사용됩니다.
+    다음 페이지가 있으면 next_cursor를 X-Next-Cursor 응답 헤더로 내려줍니다.
+    """
+    def __init__(
+        self,
+        begin: int | None = None,
+        end: int | None = None,
+        cursor: str | None = None,
+        response: Response | None = None
+    ) -> None:
+        if begin is None :
+            begin = 0
+        if begin < 0 or (end is not None and begin > end) :
+            raise InvalidRangeError()
+        self.begin = begin
+        self.end = end
+        self.cursor_sort, self.cursor = decode_cursor(cursor) if cursor else (None, None)
+        self.response = response
+        self.next_cursor: str | None = None
+
+    @property
+    def limit(self) -> int | None:
+        return None if self.end is None else self.end - self.begin
+
+    def slice(self, query: Select) -> Select:
+        """
+        OFFSET/LIMIT만 적용합니다. 한 요청에서 여러 목록을 같은 범위로 자르는 경우 (검색 등) 사용하며 cursor는 무시됩니다.
+        """
+        if self.begin:
+            query = query.offset(self.begin)
+        if self.limit is not None:
+            query = query.limit(self.limit)
+        return query
+
+    def fetch(
+        self,
+        session: Session,
+        query: Select,
+        *keys: InstrumentedAttribute,
+        descending: bool = False,
+        sort: str | None = None
+    ) -> list:
+        """
+        keys 순으로 정렬한 한 페이지의 엔티티를 조회합니다. 마지막 key는 유일해야 합니다. (보통 id)
+        여러 정렬을 지원하는 목록은 sort에 정렬 이름을 넘기면 다른 정렬에서 만든 cursor를 거부합니다.
+        """
+        rows = list(session.scalars(self._page_query(query, keys, descending, sort)).all())
+        return self._trim_page(rows, keys, sort)
+
+    async def fetch_async(
+        self,
+        session: AsyncSession,
+        query: Select,
+        *keys: InstrumentedAttribute,
+        descending: bool = False,
+        sort: str | None = None
+    ) -> list:
+        """
+        AsyncSession에서 fetch와 같은 방식으로 한 페이지를 조회합니다.
+        """
+        rows = list((await session.scalars(self._page_query(query, keys, descending, sort))).all())
+        return self._trim_page(rows, keys, sort)
+
+    def _page_query(
+        self, query: Select, keys: Sequence[InstrumentedAttribute], descending: bool, sort: str | None
+    ) -> Select:
+        query = query.order_by(*(key.desc() if descending else key for key in keys))
+        if self.cursor is not None:
+            if self.cursor_sort != sort or len(self.cursor) != len(keys):
+                raise InvalidCursorError()
+            query = query.where(_after(keys, self.cursor, descending))
+        elif self.begin:
+            query = query.offset(self.begin)
+        if self.limit is not None:
+            # 다음 페이지 존재 여부를 알기 위해 한 행 더 조회
+            query = query.limit(self.limit + 1)
+        return query
+
+    def _trim_page(self, rows: list, keys: Sequence[InstrumentedAttribute], sort: str | None) -> list:
+        if self.limit is not None and len(rows) > self.limit:
+            rows = rows[:self.limit]
+            self._set_next_cursor(encode_cursor([getattr(rows[-1], key.key) for key in keys], sort))
+        return rows
+
+    def _set_next_cursor(self, next_cursor: str) -> None:
+        self.next_cursor = next_cursor
+        if self.response is not None:
+            self.response.headers[NEXT_CURSOR_HEADER] = next_cursor
+
+
+def get_pagination(
+    response: Response,
+    begin: int | None = None,
+    end: int | None = None,
+    cursor: str | None = None
+) -> Pagination:
+    return Pagination(begin, end, cursor, response)
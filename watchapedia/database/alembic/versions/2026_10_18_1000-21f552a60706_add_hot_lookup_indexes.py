@@ -0,0 +1,80 @@
+"""add hot lookup indexes
+
+Revision ID: 21f552a60706
+Revises: f7e9c2dd5358
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '21f552a60706'
+down_revision: Union[str, None] = 'f7e9c2dd5358'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (테이블, 대상 컬럼) - 좋아요 테이블마다 (user_id, 대상) 유니크 제약을 추가
+LIKES_TABLES = [
+    ('user_likes_review', 'review_id'),
+    ('user_likes_comment', 'comment_id'),
+    ('user_likes_collection', 'collection_id'),
+    ('user_likes_collection_comment', 'collection_comment_id'),
+    ('user_likes_participant', 'participant_id'),
+]
+
+
+def _delete_duplicated_likes(table: str, target: str) -> None:
+    # 유니크 제약을 걸기 전에 중복된 좋아요를 가장 먼저 생긴 것 하나만 남기고 삭제
+    op.execute(
+        f"DELETE t1 FROM {table} t1 JOIN {table} t2 "
+        f"ON t1.user_id = t2.user_id AND t1.{target} = t2.{target} AND t1.id > t2.id"
+    )
+
+
+def _restore_fk_index(table: str, column: str) -> None:
+    # MySQL은 FK 컬럼을 포함하는 인덱스가 새로 생기면 자동 생성했던 FK 인덱스를 지웁니다.
+    # 새 인덱스를 지우기 전에 FK용 인덱스를 다시 만들어야 합니다.
+    op.create_index(column, table, [column])
+
+
+def upgrade() -> None:
+    for table, target in LIKES_TABLES:
+        _delete_duplicated_likes(table, target)
+        op.create_unique_constraint(f'uq_{table}', table, ['user_id', target])
+
+    # 서비스에서 이미 보장하고 있으므로 중복이 있으면 실패합니다. 중복을 먼저 정리해 주세요.
+    op.create_unique_constraint('uq_review_user_movie', 'review', ['user_id', 'movie_id'])
+    op.create_index('ix_review_movie_id', 'review', ['movie_id'])
+    op.create_index('ix_comment_review_id', 'comment', ['review_id'])
+    op.create_index('ix_follow_following_id', 'follow', ['following_id'])
+    op.create_index('ix_chart_platform_movie_id', 'chart', ['platform', 'movie_id'])
+    op.create_index('ix_movie_title_year_running_time', 'movie', ['title', 'year', 'running_time'])
+    op.create_index('ix_participant_name_profile_url', 'participant', ['name', 'profile_url'])
+    op.create_index('ix_genre_name', 'genre', ['name'])
+    op.create_index('ix_country_name', 'country', ['name'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_country_name', table_name='country')
+    op.drop_index('ix_genre_name', table_name='genre')
+    op.drop_index('ix_participant_name_profile_url', table_name='participant')
+    op.drop_index('ix_movie_title_year_running_time', table_name='movie')
+    op.drop_index('ix_chart_platform_movie_id', table_name='chart')
+
+    _restore_fk_index('follow', 'following_id')
+    op.drop_index('ix_follow_following_id', table_name='follow')
+    _restore_fk_index('comment', 'review_id')
+    op.drop_index('ix_comment_review_id', table_name='comment')
+    _restore_fk_index('review', 'movie_id')
+    op.drop_index('ix_review_movie_id', table_name='review')
+    _restore_fk_index('review', 'user_id')
+    op.drop_constraint('uq_review_user_movie', 'review', type_='unique')
+
+    for table, target in reversed(LIKES_TABLES):
+        _restore_fk_index(table, 'user_id')
+        op.drop_constraint(f'uq_{table}', table, type_='unique')
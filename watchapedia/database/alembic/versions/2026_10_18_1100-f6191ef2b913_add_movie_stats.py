@@ -0,0 +1,67 @@
+"""add movie_stats
+
+Revision ID: f6191ef2b913
+Revises: 21f552a60706
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+import json
+from collections import defaultdict
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f6191ef2b913'
+down_revision: Union[str, None] = '21f552a60706'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('movie_stats',
+    sa.Column('movie_id', sa.Integer(), nullable=False),
+    sa.Column('rating_sum', sa.Float(), nullable=False),
+    sa.Column('rating_count', sa.Integer(), nullable=False),
+    sa.Column('review_count', sa.Integer(), nullable=False),
+    sa.Column('rating_dist', sa.JSON(), nullable=False),
+    sa.Column('last_review_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['movie_id'], ['movie.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('movie_id')
+    )
+
+    # 기존 리뷰로 집계 채우기
+    op.execute(
+        """
+        INSERT INTO movie_stats (movie_id, rating_sum, rating_count, review_count, rating_dist, last_review_at)
+        SELECT movie.id,
+               COALESCE(SUM(CASE WHEN review.rating > 0 THEN review.rating END), 0),
+               COUNT(CASE WHEN review.rating > 0 THEN 1 END),
+               COUNT(CASE WHEN review.content IS NOT NULL AND review.content != '' THEN 1 END),
+               '{}',
+               MAX(review.created_at)
+        FROM movie LEFT JOIN review ON review.movie_id = movie.id
+        GROUP BY movie.id
+        """
+    )
+
+    connection = op.get_bind()
+    rating_dists = defaultdict(dict)
+    rows = connection.execute(sa.text(
+        "SELECT movie_id, ROUND(rating * 2) / 2 AS bucket, COUNT(*) FROM review "
+        "WHERE rating > 0 GROUP BY movie_id, ROUND(rating * 2) / 2"
+    ))
+    for movie_id, bucket, count in rows:
+        key = f"{float(bucket):.1f}"
+        rating_dists[movie_id][key] = rating_dists[movie_id].get(key, 0) + count
+    if rating_dists:
+        connection.execute(
+            sa.text("UPDATE movie_stats SET rating_dist = :rating_dist WHERE movie_id = :movie_id"),
+            [{"movie_id": movie_id, "rating_dist": json.dumps(dist)} for movie_id, dist in rating_dists.items()]
+        )
+
+
+def downgrade() -> None:
+    op.drop_table('movie_stats')
@@ -0,0 +1,34 @@
+"""add review sort indexes
+
+Revision ID: 5df39e3e9e26
+Revises: f6191ef2b913
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5df39e3e9e26'
+down_revision: Union[str, None] = 'f6191ef2b913'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_review_movie_likes_count', 'review', ['movie_id', 'likes_count', 'id'])
+    op.create_index('ix_review_movie_created_at', 'review', ['movie_id', 'created_at', 'id'])
+    op.create_index('ix_review_movie_rating', 'review', ['movie_id', 'rating', 'id'])
+    # movie_id로 시작하는 인덱스가 생겼으므로 기존 단일 인덱스는 불필요
+    op.drop_index('ix_review_movie_id', table_name='review')
+
+
+def downgrade() -> None:
+    # FK가 사용할 movie_id 인덱스를 먼저 복구
+    op.create_index('ix_review_movie_id', 'review', ['movie_id'])
+    op.drop_index('ix_review_movie_rating', table_name='review')
+    op.drop_index('ix_review_movie_created_at', table_name='review')
+    op.drop_index('ix_review_movie_likes_count', table_name='review')
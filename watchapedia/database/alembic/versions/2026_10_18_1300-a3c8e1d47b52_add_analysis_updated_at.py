@@ -0,0 +1,28 @@
+"""add analysis updated_at
+
+Revision ID: a3c8e1d47b52
+Revises: 5df39e3e9e26
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3c8e1d47b52'
+down_revision: Union[str, None] = '5df39e3e9e26'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('user_rating', sa.Column('updated_at', sa.DateTime(), nullable=True))
+    op.add_column('user_preference', sa.Column('updated_at', sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('user_preference', 'updated_at')
+    op.drop_column('user_rating', 'updated_at')
@@ -0,0 +1,99 @@
+"""add review_view
+
+Revision ID: 7b1e9d2c4f60
+Revises: a3c8e1d47b52
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+import json
+from collections import defaultdict
+from datetime import date
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7b1e9d2c4f60'
+down_revision: Union[str, None] = 'a3c8e1d47b52'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# review id 구간 단위로 나누어 옮김 (한 번에 전체 JSON을 메모리에 올리지 않도록)
+BATCH_SIZE = 5000
+
+
+def _review_id_batches(connection) -> list[tuple[int, int]]:
+    max_id = connection.scalar(sa.text("SELECT MAX(id) FROM review")) or 0
+    return [(start, start + BATCH_SIZE - 1) for start in range(1, max_id + 1, BATCH_SIZE)]
+
+
+def upgrade() -> None:
+    op.create_table('review_view',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('review_id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('movie_id', sa.Integer(), nullable=False),
+    sa.Column('view_date', sa.Date(), nullable=False),
+    sa.ForeignKeyConstraint(['review_id'], ['review.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_id'], ['user.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['movie_id'], ['movie.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('review_id', 'view_date', name='uq_review_view_date')
+    )
+    op.create_index('ix_review_view_user_date', 'review_view', ['user_id', 'view_date', 'movie_id'])
+
+    # review.view_date JSON ({"YYYY-MM-DD": true, ...})을 row로 옮기기
+    connection = op.get_bind()
+    review_view = sa.table('review_view',
+        sa.column('review_id', sa.Integer()),
+        sa.column('user_id', sa.Integer()),
+        sa.column('movie_id', sa.Integer()),
+        sa.column('view_date', sa.Date()),
+    )
+    for start, end in _review_id_batches(connection):
+        rows = connection.execute(
+            sa.text("SELECT id, user_id, movie_id, view_date FROM review WHERE id BETWEEN :start AND :end"),
+            {"start": start, "end": end}
+        )
+        views = []
+        for review_id, user_id, movie_id, view_date in rows:
+            if isinstance(view_date, str):
+                view_date = json.loads(view_date)
+            for date_str in (view_date or {}):
+                views.append({
+                    "review_id": review_id,
+                    "user_id": user_id,
+                    "movie_id": movie_id,
+                    "view_date": date.fromisoformat(date_str)
+                })
+        if views:
+            connection.execute(review_view.insert(), views)
+
+    op.drop_column('review', 'view_date')
+
+
+def downgrade() -> None:
+    op.add_column('review', sa.Column('view_date', sa.JSON(), nullable=True))
+
+    connection = op.get_bind()
+    for start, end in _review_id_batches(connection):
+        rows = connection.execute(
+            sa.text("SELECT review_id, view_date FROM review_view WHERE review_id BETWEEN :start AND :end"),
+            {"start": start, "end": end}
+        )
+        view_dates = defaultdict(dict)
+        for review_id, view_date in rows:
+            if isinstance(view_date, str):
+                view_date = date.fromisoformat(view_date)
+            view_dates[review_id][view_date.strftime("%Y-%m-%d")] = True
+        if view_dates:
+            connection.execute(
+                sa.text("UPDATE review SET view_date = :view_date WHERE id = :review_id"),
+                [{"review_id": review_id, "view_date": json.dumps(dates)} for review_id, dates in view_dates.items()]
+            )
+    op.execute("UPDATE review SET view_date = '{}' WHERE view_date IS NULL")
+    op.alter_column('review', 'view_date', existing_type=sa.JSON(), nullable=False)
+
+    op.drop_table('review_view')
@@ -0,0 +1,59 @@
+"""add user_entity_stats
+
+Revision ID: c4d2a8f19e37
+Revises: 7b1e9d2c4f60
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4d2a8f19e37'
+down_revision: Union[str, None] = '7b1e9d2c4f60'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# entity_type: (연결 테이블, entity id 컬럼, 추가 조건)
+ENTITY_SOURCES = {
+    "actor": ("movie_participant", "participant_id",
+              "(link.role LIKE '%주연%' OR link.role LIKE '%조연%' OR link.role LIKE '%단역%')"),
+    "director": ("movie_participant", "participant_id", "link.role LIKE '%감독%'"),
+    "genre": ("movie_genre", "genre_id", "TRUE"),
+    "country": ("movie_country", "country_id", "TRUE"),
+}
+
+
+def upgrade() -> None:
+    op.create_table('user_entity_stats',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('entity_type', sa.String(length=20), nullable=False),
+    sa.Column('entity_id', sa.Integer(), nullable=False),
+    sa.Column('rating_sum', sa.Float(), nullable=False),
+    sa.Column('rating_cnt', sa.Integer(), nullable=False),
+    sa.Column('movie_cnt', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['user.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id', 'entity_type', 'entity_id')
+    )
+
+    # 기존 리뷰로 집계 채우기
+    for entity_type, (link_table, entity_column, condition) in ENTITY_SOURCES.items():
+        op.execute(
+            f"""
+            INSERT INTO user_entity_stats (user_id, entity_type, entity_id, rating_sum, rating_cnt, movie_cnt)
+            SELECT review.user_id, '{entity_type}', link.{entity_column},
+                   COALESCE(SUM(CASE WHEN review.rating > 0 THEN review.rating END), 0),
+                   COUNT(CASE WHEN review.rating > 0 THEN 1 END),
+                   COUNT(*)
+            FROM review JOIN {link_table} link ON link.movie_id = review.movie_id
+            WHERE {condition}
+            GROUP BY review.user_id, link.{entity_column}
+            """
+        )
+
+
+def downgrade() -> None:
+    op.drop_table('user_entity_stats')
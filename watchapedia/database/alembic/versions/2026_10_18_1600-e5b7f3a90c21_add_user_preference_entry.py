@@ -0,0 +1,63 @@
+"""add user_preference_entry
+
+Revision ID: e5b7f3a90c21
+Revises: c4d2a8f19e37
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5b7f3a90c21'
+down_revision: Union[str, None] = 'c4d2a8f19e37'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+DICT_COLUMNS = ('actor_dict', 'director_dict', 'country_dict', 'genre_dict')
+
+
+def upgrade() -> None:
+    op.create_table('user_preference_entry',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('entity_type', sa.String(length=20), nullable=False),
+    sa.Column('entity_id', sa.Integer(), nullable=False),
+    sa.Column('score', sa.Float(), nullable=False),
+    sa.Column('movie_cnt', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['user.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id', 'entity_type', 'entity_id')
+    )
+    op.create_index('ix_user_preference_entry_user_score', 'user_preference_entry', ['user_id', 'entity_type', 'score', 'entity_id'], unique=False)
+    op.create_index('ix_user_preference_entry_entity_score', 'user_preference_entry', ['entity_type', 'entity_id', 'score', 'user_id'], unique=False)
+
+    # user_entity_stats로 점수 채우기 (analysis/repository.py의 _preference_score와 같은 공식)
+    op.execute(
+        """
+        INSERT INTO user_preference_entry (user_id, entity_type, entity_id, score, movie_cnt)
+        SELECT s.user_id, s.entity_type, s.entity_id,
+               CASE WHEN s.rating_cnt = 0 OR r.rating_avg IS NULL
+                    THEN 50 + 50 * (s.movie_cnt * 1.0 / (s.movie_cnt + 10))
+                    ELSE GREATEST(0, LEAST(100,
+                        50 + (s.rating_sum / s.rating_cnt - r.rating_avg) * 100 * SQRT(s.movie_cnt / LN(r.rating_num + 2))
+                        + 50 * (s.movie_cnt * 1.0 / (s.movie_cnt + 10))))
+               END,
+               s.movie_cnt
+        FROM user_entity_stats s LEFT JOIN user_rating r ON r.user_id = s.user_id
+        WHERE s.movie_cnt > 0
+        """
+    )
+
+    for column in DICT_COLUMNS:
+        op.drop_column('user_preference', column)
+
+
+def downgrade() -> None:
+    # 점수는 JSON으로 되돌리지 않음 (이전 버전은 다음 리뷰 변경 때 다시 계산)
+    for column in DICT_COLUMNS:
+        op.add_column('user_preference', sa.Column(column, sa.JSON(), nullable=True))
+    op.drop_index('ix_user_preference_entry_entity_score', table_name='user_preference_entry')
+    op.drop_index('ix_user_preference_entry_user_score', table_name='user_preference_entry')
+    op.drop_table('user_preference_entry')
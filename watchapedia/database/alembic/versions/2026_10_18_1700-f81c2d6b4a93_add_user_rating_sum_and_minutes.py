@@ -0,0 +1,41 @@
+"""add user_rating rating_sum and viewing_minutes
+
+Revision ID: f81c2d6b4a93
+Revises: e5b7f3a90c21
+Create Date: 2026-10-18 17:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f81c2d6b4a93'
+down_revision: Union[str, None] = 'e5b7f3a90c21'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('user_rating', sa.Column('rating_sum', sa.Float(), nullable=False, server_default='0'))
+    op.add_column('user_rating', sa.Column('viewing_minutes', sa.Integer(), nullable=False, server_default='0'))
+
+    # 기존 리뷰로 채우기. rating_dist는 tools/reconcile_user_ratings 로 검사/보정
+    op.execute(
+        """
+        UPDATE user_rating SET
+            rating_num = (SELECT COUNT(*) FROM review
+                          WHERE review.user_id = user_rating.user_id AND review.rating > 0),
+            rating_sum = COALESCE((SELECT SUM(review.rating) FROM review
+                                   WHERE review.user_id = user_rating.user_id AND review.rating > 0), 0),
+            viewing_minutes = COALESCE((SELECT SUM(movie.running_time) FROM review JOIN movie ON movie.id = review.movie_id
+                                        WHERE review.user_id = user_rating.user_id), 0)
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('user_rating', 'viewing_minutes')
+    op.drop_column('user_rating', 'rating_sum')
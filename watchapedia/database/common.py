@@ -1,5 +1,17 @@
+import unicodedata
 from sqlalchemy.orm import DeclarativeBase
 
 
 class Base(DeclarativeBase):
-    pass 
\ No newline at end of file
+    pass
+
+
+def collation_key(value: str | None) -> str | None:
+    """
+    MySQL의 기본 collation(utf8mb4_0900_ai_ci)처럼 대소문자와 악센트를 무시하고 비교하기 위한 key.
+    DB에서 같은 값으로 취급되는 문자열을 메모리에서도 같은 값으로 묶을 때 사용합니다.
+    """
+    if value is None:
+        return None
+    decomposed = unicodedata.normalize("NFKD", value)
+    return "".join(char for char in decomposed if not unicodedata.combining(char)).casefold()
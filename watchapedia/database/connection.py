@@ -1,21 +1,151 @@
-from typing import Generator, Any
+import threading
+import time
+from contextlib import contextmanager
+from typing import Annotated, Generator, AsyncGenerator, Any
+from fastapi import Depends
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import QueuePool
 
 from watchapedia.database.settings import DB_SETTINGS
+from watchapedia.database.routing import RoutingSession, use_primary
+
+
+class TimedQueuePool(QueuePool):
+    """
+    커넥션을 얻기까지 기다린 시간을 기록하는 QueuePool.
+
+    풀이 가득 차서 대기하는 시간(및 새 커넥션 생성 시간)이 누적됩니다.
+    """
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._stats_lock = threading.Lock()
+        self.checkout_count = 0
+        self.wait_time_total = 0.0
+        self.wait_time_max = 0.0
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._stats_lock:
+                self.checkout_count += 1
+                self.wait_time_total += elapsed
+                self.wait_time_max = max(self.wait_time_max, elapsed)
+
+
+def _pool_options() -> dict[str, Any]:
+    return {
+        "pool_size": DB_SETTINGS.pool_size,
+        "max_overflow": DB_SETTINGS.max_overflow,
+        "pool_timeout": DB_SETTINGS.pool_timeout,
+        "pool_recycle": DB_SETTINGS.pool_recycle,
+        "pool_pre_ping": True,
+    }
 
 
 class DatabaseManager:
     def __init__(self):
-        self.engine = create_engine(
-            DB_SETTINGS.url,
-            pool_recycle=28000,
-            pool_pre_ping=True,
+        self.engine = create_engine(DB_SETTINGS.url, poolclass=TimedQueuePool, **_pool_options())
+        self.replica_engines = [
+            create_engine(url, poolclass=TimedQueuePool, **_pool_options()) for url in DB_SETTINGS.replica_urls
+        ]
+        self.session_factory = sessionmaker(
+            class_=RoutingSession,
+            primary=self.engine,
+            replicas=self.replica_engines,
+            expire_on_commit=False
         )
-        self.session_factory = sessionmaker(bind=self.engine, expire_on_commit=False)
 
-def get_db_session() -> Generator[Session, Any, None]:
-    session = DatabaseManager().session_factory()
+    def pool_status(self) -> dict[str, int | float]:
+        pool = self.engine.pool
+        checkout_count = pool.checkout_count
+        return {
+            "pool_size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": max(pool.overflow(), 0),
+            "max_overflow": DB_SETTINGS.max_overflow,
+            "checkout_count": checkout_count,
+            "wait_time_avg_ms": round(pool.wait_time_total / checkout_count * 1000, 3) if checkout_count else 0.0,
+            "wait_time_max_ms": round(pool.wait_time_max * 1000, 3),
+        }
+
+    def dispose(self) -> None:
+        self.engine.dispose()
+        for engine in self.replica_engines:
+            engine.dispose()
+
+
+class AsyncDatabaseManager:
+    """
+    async 라우트용 엔진. 동기 엔진과 별도의 풀을 사용합니다.
+    """
+    def __init__(self):
+        self.engine = create_async_engine(DB_SETTINGS.async_url, **_pool_options())
+        self.replica_engines = [
+            create_async_engine(url, **_pool_options()) for url in DB_SETTINGS.async_replica_urls
+        ]
+        # 라우팅은 AsyncSession 내부의 동기 Session에서 이루어지므로 sync_engine을 넘깁니다.
+        self.session_factory = async_sessionmaker(
+            sync_session_class=RoutingSession,
+            primary=self.engine.sync_engine,
+            replicas=[engine.sync_engine for engine in self.replica_engines],
+            expire_on_commit=False
+        )
+
+    async def dispose(self) -> None:
+        await self.engine.dispose()
+        for engine in self.replica_engines:
+            await engine.dispose()
+
+
+# 워커 프로세스당 하나의 엔진(커넥션 풀)만 만들어 모든 요청이 공유합니다.
+_db_manager: DatabaseManager | None = None
+_db_manager_lock = threading.Lock()
+_async_db_manager: AsyncDatabaseManager | None = None
+
+def get_db_manager() -> DatabaseManager:
+    global _db_manager
+    if _db_manager is None:
+        with _db_manager_lock:
+            if _db_manager is None:
+                _db_manager = DatabaseManager()
+    return _db_manager
+
+def get_async_db_manager() -> AsyncDatabaseManager:
+    global _async_db_manager
+    if _async_db_manager is None:
+        with _db_manager_lock:
+            if _async_db_manager is None:
+                _async_db_manager = AsyncDatabaseManager()
+    return _async_db_manager
+
+def init_db() -> None:
+    # 앱 시작 시 호출. 첫 요청에서 엔진을 만드는 비용을 미리 치릅니다.
+    get_db_manager()
+    get_async_db_manager()
+
+async def dispose_db() -> None:
+    # 앱 종료 시 호출. 풀에 남아있는 커넥션을 모두 닫습니다.
+    global _db_manager, _async_db_manager
+    with _db_manager_lock:
+        db_manager, _db_manager = _db_manager, None
+        async_db_manager, _async_db_manager = _async_db_manager, None
+    if db_manager is not None:
+        db_manager.dispose()
+    if async_db_manager is not None:
+        await async_db_manager.dispose()
+
+@contextmanager
+def session_scope() -> Generator[Session, Any, None]:
+    """
+    블록 하나를 트랜잭션 하나로 사용하는 세션. 요청 밖(스트리밍 응답, 스크립트 등)에서 사용합니다.
+    """
+    session = get_db_manager().session_factory()
     try:
         yield session
         session.commit()
@@ -23,4 +153,26 @@ def get_db_session() -> Generator[Session, Any, None]:
         session.rollback()
         raise e
     finally:
-        session.close()
\ No newline at end of file
+        session.close()
+
+def get_db_session() -> Generator[Session, Any, None]:
+    with session_scope() as session:
+        yield session
+
+async def get_async_db_session() -> AsyncGenerator[AsyncSession, None]:
+    session = get_async_db_manager().session_factory()
+    try:
+        yield session
+        await session.commit()
+    except Exception as e:
+        await session.rollback()
+        raise e
+    finally:
+        await session.close()
+
+def get_primary_db_session(session: Annotated[Session, Depends(get_db_session)]) -> Session:
+    """
+    read-your-writes가 필요한 엔드포인트용 의존성. 요청 전체에서 primary만 사용합니다.
+    """
+    use_primary(session)
+    return session
@@ -0,0 +1,136 @@
+"""
+좋아요 수 같은 카운터 컬럼의 write-behind 버퍼.
+
+요청에서는 카운터 row를 직접 수정하지 않고 delta만 기록합니다. delta는 트랜잭션이 커밋된 뒤에만 버퍼에 합쳐지고,
+백그라운드 작업이 주기적으로 `UPDATE ... SET likes_count = likes_count + :delta` 를 batch로 실행합니다.
+인기 row에 대한 lock 경합과 read-modify-write로 인한 갱신 유실이 사라지는 대신,
+카운터는 최대 flush 주기만큼 늦게 반영됩니다. 어긋난 값은 tools/reconcile_counters 로 다시 계산합니다.
+"""
+import asyncio
+import logging
+import threading
+from collections import defaultdict
+from typing import Any, Callable
+from sqlalchemy import Engine, bindparam, delete, event, insert, update
+from sqlalchemy.orm import InstrumentedAttribute, Session, attributes
+
+logger = logging.getLogger(__name__)
+
+_SESSION_DELTAS_KEY = "counter_deltas"
+
+
+class CounterBuffer:
+    """
+    (카운터 컬럼, row id)별 delta를 모아두는 프로세스 내 버퍼.
+    """
+    def __init__(self) -> None:
+        self._deltas: defaultdict[tuple[InstrumentedAttribute, Any], int] = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def add(self, column: InstrumentedAttribute, row_id: Any, delta: int) -> None:
+        with self._lock:
+            self._deltas[(column, row_id)] += delta
+
+    def pending(self, column: InstrumentedAttribute, row_id: Any) -> int:
+        with self._lock:
+            return self._deltas.get((column, row_id), 0)
+
+    def drain(self) -> dict[tuple[InstrumentedAttribute, Any], int]:
+        with self._lock:
+            deltas, self._deltas = self._deltas, defaultdict(int)
+        return {key: delta for key, delta in deltas.items() if delta}
+
+    def flush(self, engine: Engine) -> int:
+        """
+        모인 delta를 컬럼별 executemany UPDATE 한 번으로 반영합니다. 실패하면 delta를 버퍼에 되돌립니다.
+        """
+        deltas = self.drain()
+        if not deltas:
+            return 0
+
+        by_column: defaultdict[InstrumentedAttribute, list[dict[str, Any]]] = defaultdict(list)
+        for (column, row_id), delta in deltas.items():
+            by_column[column].append({"row_id": row_id, "delta": delta})
+        try:
+            with engine.begin() as connection:
+                for column, params in by_column.items():
+                    table = column.class_.__table__
+                    stmt = (
+                        update(table)
+                        .where(table.c.id == bindparam("row_id"))
+                        .values({column.key: table.c[column.key] + bindparam("delta")})
+                    )
+                    connection.execute(stmt, params)
+        except Exception:
+            for (column, row_id), delta in deltas.items():
+                self.add(column, row_id, delta)
+            raise
+        return len(deltas)
+
+
+counter_buffer = CounterBuffer()
+
+
+def record_counter_delta(session: Session, column: InstrumentedAttribute, row_id: Any, delta: int) -> None:
+    # 커밋된 경우에만 버퍼에 반영되도록 세션에 보관 (롤백되면 버려짐)
+    session.info.setdefault(_SESSION_DELTAS_KEY, []).append((column, row_id, delta))
+
+
+@event.listens_for(Session, "after_commit")
+def _move_deltas_to_buffer(session: Session) -> None:
+    for column, row_id, delta in session.info.pop(_SESSION_DELTAS_KEY, []):
+        counter_buffer.add(column, row_id, delta)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_deltas(session: Session) -> None:
+    session.info.pop(_SESSION_DELTAS_KEY, None)
+
+
+def toggle_like(session: Session, target: Any, like_model: type, user_id: int, target_key: str) -> int:
+    """
+    (user_id, 대상) 좋아요를 토글하고 likes_count 변화량(+1, -1, 0)을 반환합니다.
+
+    유니크 제약이 걸린 좋아요 테이블에 DELETE 후 없으면 INSERT IGNORE 하므로 중복 요청이 와도 한 번만 반영됩니다.
+    반환한 delta는 write-behind로 반영되고, target 객체의 likes_count는 응답용으로만 갱신합니다.
+    """
+    table = like_model.__table__
+    key = {"user_id": user_id, target_key: target.id}
+    deleted = session.execute(
+        delete(table).where(table.c.user_id == user_id, table.c[target_key] == target.id)
+    ).rowcount
+    if deleted:
+        delta = -deleted
+    else:
+        inserted = session.execute(
+            insert(table).values(key).prefix_with("IGNORE", dialect="mysql").prefix_with("OR IGNORE", dialect="sqlite")
+        ).rowcount
+        delta = max(inserted, 0)
+
+    if delta:
+        column = type(target).likes_count
+        record_counter_delta(session, column, target.id, delta)
+        # 아직 반영되지 않은 delta까지 더한 값을 응답에 사용. UPDATE가 나가지 않도록 커밋된 값으로 설정
+        likes_count = target.likes_count + counter_buffer.pending(column, target.id) + delta
+        attributes.set_committed_value(target, "likes_count", max(likes_count, 0))
+    return delta
+
+
+async def _flush_counters(get_engine: Callable[[], Engine]) -> None:
+    try:
+        await asyncio.to_thread(counter_buffer.flush, get_engine())
+    except Exception:
+        # delta는 버퍼에 남아 있으므로 다음 주기에 다시 시도
+        logger.exception("Failed to flush counter deltas")
+
+
+async def run_counter_flusher(get_engine: Callable[[], Engine], interval: float) -> None:
+    """
+    interval초마다 버퍼를 flush 하는 백그라운드 작업. 취소되면 남은 delta를 마지막으로 flush 합니다.
+    """
+    try:
+        while True:
+            await asyncio.sleep(interval)
+            await _flush_counters(get_engine)
+    finally:
+        await _flush_counters(get_engine)
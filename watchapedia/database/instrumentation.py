@@ -0,0 +1,91 @@
+import logging
+import re
+import time
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from sqlalchemy import Engine, event
+
+from watchapedia.database.settings import DB_SETTINGS
+from watchapedia.settings import SETTINGS
+
+logger = logging.getLogger(__name__)
+
+# IN (...) 목록의 파라미터 개수가 달라도 같은 쿼리로 취급하기 위한 패턴
+_IN_LIST_PATTERN = re.compile(r"\(\s*(?:%\(\w+\)s|%s|\?)(?:\s*,\s*(?:%\(\w+\)s|%s|\?))*\s*\)")
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+@dataclass
+class QueryStats:
+    """
+    요청 하나에서 실행된 SQL 통계.
+    """
+    count: int = 0
+    duration: float = 0.0
+    statements: Counter = field(default_factory=Counter)
+
+
+# 요청 범위의 통계. 미들웨어 밖(스크립트, 백그라운드 작업 등)에서는 None
+_query_stats: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+def normalize_statement(statement: str) -> str:
+    statement = _IN_LIST_PATTERN.sub("(?)", statement)
+    return _WHITESPACE_PATTERN.sub(" ", statement).strip()
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _query_stats.get() is not None:
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _query_stats.get()
+    if stats is None or not conn.info.get("query_start_time"):
+        return
+    stats.count += 1
+    stats.duration += time.perf_counter() - conn.info["query_start_time"].pop()
+    if SETTINGS.is_local:
+        stats.statements[normalize_statement(statement)] += 1
+
+
+def _warn_repeated_statements(path: str, stats: QueryStats) -> None:
+    for statement, count in stats.statements.items():
+        if count > DB_SETTINGS.n_plus_one_threshold:
+            logger.warning("Possible N+1 on %s: statement ran %d times: %s", path, count, statement)
+
+
+class QueryStatsMiddleware:
+    """
+    요청마다 실행된 쿼리 수와 DB 시간을 Server-Timing, X-DB-Queries 응답 헤더로 내려줍니다.
+
+    local 환경에서는 같은 형태의 쿼리가 한 요청에서 반복 실행되면 N+1 의심 경고를 남깁니다.
+    """
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats()
+        token = _query_stats.set(stats)
+
+        async def send_with_stats(message) -> None:
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", f"db;dur={stats.duration * 1000:.1f}".encode()))
+                headers.append((b"x-db-queries", str(stats.count).encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_stats)
+        finally:
+            _query_stats.reset(token)
+            if SETTINGS.is_local:
+                _warn_repeated_statements(scope["path"], stats)
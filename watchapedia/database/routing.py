@@ -0,0 +1,42 @@
+import random
+from sqlalchemy import Delete, Engine, Insert, Select, Update
+from sqlalchemy.orm import Session
+
+# session.info에 이 키가 True로 설정되면 이후 모든 쿼리를 primary로 보냅니다.
+USE_PRIMARY = "use_primary"
+
+
+class RoutingSession(Session):
+    """
+    읽기(SELECT)는 replica로, 쓰기와 flush는 primary로 보내는 Session.
+
+    한 번이라도 쓰기가 일어나면 같은 세션(= 같은 요청)의 이후 읽기도 primary에서 수행하여
+    replica 복제 지연과 무관하게 자신이 쓴 데이터를 읽을 수 있도록 합니다. (read-your-writes)
+    """
+    def __init__(self, primary: Engine, replicas: list[Engine] | None = None, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.primary = primary
+        self.replicas = replicas or []
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if not self.replicas or self.info.get(USE_PRIMARY):
+            return self.primary
+
+        if self._flushing or isinstance(clause, (Insert, Update, Delete)):
+            self.info[USE_PRIMARY] = True
+            return self.primary
+
+        if isinstance(clause, Select) and clause._for_update_arg is None:
+            return random.choice(self.replicas)
+
+        # SELECT ... FOR UPDATE, text() 등 판단할 수 없는 쿼리는 primary로
+        return self.primary
+
+
+def use_primary(session: Session) -> None:
+    """
+    이 세션의 이후 쿼리를 모두 primary로 보냅니다.
+
+    쓰기 직후 다른 경로로 데이터를 다시 읽는 엔드포인트에서 사용합니다.
+    """
+    session.info[USE_PRIMARY] = True
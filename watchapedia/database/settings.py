@@ -1,20 +1,56 @@
 from pydantic_settings import BaseSettings, SettingsConfigDict
+from sqlalchemy.engine import make_url
 from watchapedia.settings import SETTINGS
 
 
 class DatabaseSettings(BaseSettings):
     dialect: str = ""
     driver: str = ""
+    async_driver: str = "aiomysql"
     host: str = ""
     port: int = 0
     user: str = ""
     password: str = ""
     database: str = ""
 
+    # 커넥션 풀 설정 (워커 프로세스당 하나의 풀을 사용)
+    pool_size: int = 10
+    max_overflow: int = 10
+    pool_timeout: int = 30
+    pool_recycle: int = 28000
+
+    # 읽기 전용 replica 접속 URL 목록 (예: DB_REPLICA_URLS='["mysql+pymysql://..."]')
+    # 비어 있으면 모든 쿼리가 primary로 갑니다.
+    replica_urls: list[str] = []
+
+    # local 환경에서 한 요청 안에 같은 형태의 쿼리가 이 횟수를 넘으면 N+1 의심 경고를 남깁니다.
+    n_plus_one_threshold: int = 10
+
+    # 좋아요 수 write-behind 버퍼를 DB에 반영하는 주기(초)
+    counter_flush_interval: float = 1.0
+
+    # 리뷰 변경 후 취향분석 재계산 큐를 비우는 주기(초). 이 시간 동안의 변경은 유저별로 한 번에 계산됩니다.
+    analysis_recompute_interval: float = 1.0
+
+    # 취향분석의 상위 % 계산에 쓰는 전체 유저 시청 시간/평균 별점 스냅샷을 다시 읽는 주기(초)
+    percentile_refresh_interval: float = 600.0
+
     @property
     def url(self) -> str:
         return f"{self.dialect}+{self.driver}://{self.user}:{self.password}@{self.host}:{self.port}/{self.database}"
 
+    @property
+    def async_url(self) -> str:
+        return f"{self.dialect}+{self.async_driver}://{self.user}:{self.password}@{self.host}:{self.port}/{self.database}"
+
+    @property
+    def async_replica_urls(self) -> list[str]:
+        urls = []
+        for url in map(make_url, self.replica_urls):
+            url = url.set(drivername=f"{url.get_backend_name()}+{self.async_driver}")
+            urls.append(url.render_as_string(hide_password=False))
+        return urls
+
     model_config = SettingsConfigDict(
         case_sensitive=False,
         env_prefix="DB_",
@@ -23,4 +59,4 @@ class DatabaseSettings(BaseSettings):
     )
 
 
-DB_SETTINGS = DatabaseSettings()
\ No newline at end of file
+DB_SETTINGS = DatabaseSettings()
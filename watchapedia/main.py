@@ -5,8 +5,37 @@ from fastapi.exception_handlers import request_validation_exception_handler
 from fastapi.requests import Request
 from watchapedia.common.errors import MissingRequiredFieldError
 from fastapi.middleware.cors import CORSMiddleware
+import asyncio
+from contextlib import asynccontextmanager
+from watchapedia.database.connection import init_db, dispose_db, get_db_manager
+from watchapedia.database.counters import run_counter_flusher
+from watchapedia.app.analysis.worker import run_analysis_worker
+from watchapedia.app.analysis.percentile import run_percentile_refresher
+from watchapedia.database.instrumentation import QueryStatsMiddleware
+from watchapedia.database.settings import DB_SETTINGS
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 워커 프로세스 시작 시 DB 엔진(커넥션 풀)을 만들고, 종료 시 정리합니다.
+    init_db()
+    # 좋아요 수 delta를 주기적으로 DB에 반영. 종료 시 남은 delta를 반영한 뒤 엔진을 정리합니다.
+    counter_flusher = asyncio.create_task(
+        run_counter_flusher(lambda: get_db_manager().engine, DB_SETTINGS.counter_flush_interval)
+    )
+    # 리뷰 변경으로 쌓인 취향분석 재계산을 유저별로 합쳐서 처리
+    analysis_worker = asyncio.create_task(run_analysis_worker(DB_SETTINGS.analysis_recompute_interval))
+    # 취향분석 상위 % 계산용 전체 유저 분포 스냅샷
+    percentile_refresher = asyncio.create_task(run_percentile_refresher(DB_SETTINGS.percentile_refresh_interval))
+    yield
+    for task in (percentile_refresher, analysis_worker, counter_flusher):
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+    await dispose_db()
+
+app = FastAPI(lifespan=lifespan)
 
 app.include_router(api_router, prefix="/api")
 
@@ -18,12 +47,15 @@ origins = [
     "http://localhost:8000"
 ]
 
+app.add_middleware(QueryStatsMiddleware)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=origins,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Server-Timing", "X-DB-Queries", "X-Next-Cursor"],
 )
 
 @app.exception_handler(RequestValidationError)
@@ -31,4 +63,8 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
     for error in exc.errors():
         if isinstance(error, dict) and error.get("type", None) == "missing":
             raise MissingRequiredFieldError()
-    return await request_validation_exception_handler(request, exc)
\ No newline at end of file
+    return await request_validation_exception_handler(request, exc)
+
+@app.get("/api/health/db", status_code=200, summary="DB 커넥션 풀 상태", include_in_schema=False)
+def db_pool_status() -> dict[str, int | float]:
+    return get_db_manager().pool_status()
@@ -0,0 +1,142 @@
+"""
+취향분석 선호도 갱신의 이전 방식(리뷰 전체에서 entity별 재계산)과 현재 방식(UserEntityStats 증감 반영)을 비교합니다.
+
+리뷰 N개를 가진 가상의 유저와 영화/인물/장르/국가를 한 트랜잭션 안에 만들고,
+같은 영화 하나의 별점 변경에 대해 두 방식의 실행 시간과 SQL 실행 횟수를 측정한 뒤 롤백합니다. (DB에 남지 않음)
+
+    python -m watchapedia.tools.benchmark_preference --reviews 2000 --repeat 5
+"""
+import argparse
+import random
+import time
+from datetime import datetime
+from typing import Any, Callable
+from sqlalchemy import event, func, or_, select
+from sqlalchemy.orm import Session
+
+import watchapedia.database  # noqa: F401 - 모든 모델 등록
+from watchapedia.database.connection import get_db_manager
+from watchapedia.database.routing import use_primary
+from watchapedia.app.user.models import User
+from watchapedia.app.movie.models import Movie, MovieParticipant
+from watchapedia.app.participant.models import Participant
+from watchapedia.app.genre.models import Genre, MovieGenre
+from watchapedia.app.country.models import Country, MovieCountry
+from watchapedia.app.review.models import Review
+from watchapedia.app.analysis.models import UserRating, UserPreference
+from watchapedia.app.analysis.repository import UserPreferenceRepository
+
+
+def seed(session: Session, reviews: int, participants: int, seed_value: int) -> tuple[int, list[int]]:
+    rng = random.Random(seed_value)
+    user = User(username="benchmark", login_id=f"benchmark_{time.time_ns()}", login_type="local")
+    user.user_rating = UserRating(rating_num=0)
+    user.user_preference = UserPreference()
+    genres = [Genre(name=f"genre{i}") for i in range(20)]
+    countries = [Country(name=f"country{i}") for i in range(30)]
+    people = [Participant(name=f"participant{i}", profile_url=None) for i in range(participants)]
+    movies = [Movie(title=f"movie{i}", original_title=f"movie{i}", year=2000 + i % 25, running_time=100) for i in range(reviews)]
+    session.add_all([user, *genres, *countries, *people, *movies])
+    session.flush()
+
+    for movie in movies:
+        cast = rng.sample(people, 6)
+        session.add(MovieParticipant(movie_id=movie.id, participant_id=cast[0].id, role="감독"))
+        for person, role in zip(cast[1:], ["주연", "주연", "조연", "조연", "단역"]):
+            session.add(MovieParticipant(movie_id=movie.id, participant_id=person.id, role=role))
+        for genre in rng.sample(genres, 2):
+            session.add(MovieGenre(movie_id=movie.id, genre_id=genre.id))
+        session.add(MovieCountry(movie_id=movie.id, country_id=rng.choice(countries).id))
+        session.add(Review(
+            user_id=user.id, movie_id=movie.id, rating=rng.randint(1, 10) / 2, likes_count=0,
+            created_at=datetime.now(), spoiler=False
+        ))
+    session.flush()
+    return user.id, [movie.id for movie in movies]
+
+
+def legacy_entity_ratings(session: Session, user_id: int, movie_id: int) -> tuple[dict, dict, dict, dict]:
+    # 이전 방식: 영화의 entity마다 count/avg 쿼리 한 번, 리뷰한 전체 영화 id를 IN 목록으로 전달
+    actor_role = or_(
+        MovieParticipant.role.like("%주연%"),
+        MovieParticipant.role.like("%조연%"),
+        MovieParticipant.role.like("%단역%")
+    )
+    review_movie_ids = list(session.scalars(select(Review.movie_id).where(Review.user_id == user_id)))
+    for _ in range(4):
+        session.scalar(select(UserPreference).where(UserPreference.user_id == user_id))
+
+    def ratings(entity_column, movie_id_column, entity_ids, count_condition=None) -> dict:
+        result = {}
+        for entity_id in entity_ids:
+            query = (
+                select(func.count(func.distinct(movie_id_column)), func.avg(Review.rating))
+                .select_from(Review)
+                .join(entity_column.class_, Review.movie_id == movie_id_column)
+                .where(entity_column == entity_id, Review.user_id == user_id, movie_id_column.in_(review_movie_ids))
+            )
+            if count_condition is not None:
+                query = query.where(count_condition)
+            result[entity_id] = tuple(session.execute(query).one())
+        return result
+
+    actor_ids = session.scalars(select(MovieParticipant.participant_id).where(MovieParticipant.movie_id == movie_id, actor_role)).all()
+    director_ids = session.scalars(select(MovieParticipant.participant_id).where(MovieParticipant.movie_id == movie_id, MovieParticipant.role == "감독")).all()
+    genre_ids = session.scalars(select(MovieGenre.genre_id).where(MovieGenre.movie_id == movie_id)).all()
+    country_ids = session.scalars(select(MovieCountry.country_id).where(MovieCountry.movie_id == movie_id)).all()
+    return (
+        ratings(MovieParticipant.participant_id, MovieParticipant.movie_id, actor_ids, actor_role),
+        ratings(MovieParticipant.participant_id, MovieParticipant.movie_id, director_ids, MovieParticipant.role.like("%감독%")),
+        ratings(MovieGenre.genre_id, MovieGenre.movie_id, genre_ids),
+        ratings(MovieCountry.country_id, MovieCountry.movie_id, country_ids),
+    )
+
+
+def measure(session: Session, call: Callable[[], Any], repeat: int) -> tuple[float, int]:
+    statements = 0
+
+    def count(*args) -> None:
+        nonlocal statements
+        statements += 1
+
+    engine = session.connection().engine
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        start = time.perf_counter()
+        for _ in range(repeat):
+            call()
+        elapsed = (time.perf_counter() - start) / repeat
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+    return elapsed, statements // repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="선호도 갱신 쿼리의 이전/현재 방식을 비교합니다.")
+    parser.add_argument("--reviews", type=int, default=2000, help="가상 유저의 리뷰(영화) 수")
+    parser.add_argument("--participants", type=int, default=3000, help="가상 인물 수")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    session = get_db_manager().session_factory()
+    use_primary(session)
+    try:
+        user_id, movie_ids = seed(session, args.reviews, args.participants, args.seed)
+        preference_repository = UserPreferenceRepository(session)
+        movie_id = movie_ids[len(movie_ids) // 2]
+
+        legacy_time, legacy_statements = measure(session, lambda: legacy_entity_ratings(session, user_id, movie_id), args.repeat)
+        delta_time, delta_statements = measure(
+            session, lambda: preference_repository.update_entity_stats(user_id, movie_id, old_rating=3.0, new_rating=4.0), args.repeat
+        )
+        print(f"reviews={args.reviews}")
+        print(f"legacy: {legacy_time * 1000:8.1f} ms, {legacy_statements} statements")
+        print(f"delta : {delta_time * 1000:8.1f} ms, {delta_statements} statements")
+    finally:
+        session.rollback()
+        session.close()
+
+
+if __name__ == "__main__":
+    main()
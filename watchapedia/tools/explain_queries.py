@@ -0,0 +1,148 @@
+"""
+리포지토리 조회 쿼리의 실행 계획(EXPLAIN)을 출력합니다.
+
+각 리포지토리 메서드를 실제로 호출하면서 실행되는 SELECT 문을 가로채고,
+같은 파라미터로 EXPLAIN을 실행해 인덱스를 타는지 확인할 수 있습니다.
+
+    python -m watchapedia.tools.explain_queries [--only review]
+"""
+import argparse
+from datetime import date
+from typing import Any, Callable
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+
+import watchapedia.database  # noqa: F401 - 모든 모델 등록
+from watchapedia.database.connection import get_db_manager
+from watchapedia.app.user.models import User
+from watchapedia.app.movie.models import Movie
+from watchapedia.app.review.models import Review
+from watchapedia.app.comment.models import Comment
+from watchapedia.app.collection.models import Collection
+from watchapedia.app.collection_comment.models import CollectionComment
+from watchapedia.app.participant.models import Participant
+from watchapedia.app.movie.repository import MovieRepository
+from watchapedia.app.review.repository import ReviewRepository, REVIEW_SORT_ORDERS
+from watchapedia.app.comment.repository import CommentRepository
+from watchapedia.app.collection.repository import CollectionRepository
+from watchapedia.app.collection_comment.repository import CollectionCommentRepository
+from watchapedia.app.participant.repository import ParticipantRepository
+from watchapedia.app.user.repository import UserRepository
+from watchapedia.app.genre.repository import GenreRepository
+from watchapedia.app.country.repository import CountryRepository
+from watchapedia.app.calendar.repository import CalendarRepository
+from watchapedia.app.analysis.repository import UserPreferenceRepository
+from watchapedia.common.pagination import Pagination
+
+
+def _first(session: Session, model) -> Any:
+    return session.scalar(select(model).order_by(model.id).limit(1))
+
+
+def build_cases(session: Session) -> list[tuple[str, Callable[[], Any]]]:
+    user = _first(session, User)
+    movie = _first(session, Movie)
+    review = _first(session, Review)
+    comment = _first(session, Comment)
+    collection = _first(session, Collection)
+    collection_comment = _first(session, CollectionComment)
+    participant = _first(session, Participant)
+    if None in (user, movie, review, comment, collection, collection_comment, participant):
+        raise SystemExit("각 테이블에 최소 한 개의 row가 있어야 합니다.")
+
+    movie_repository = MovieRepository(session)
+    review_repository = ReviewRepository(session)
+    comment_repository = CommentRepository(session)
+    collection_repository = CollectionRepository(session)
+    collection_comment_repository = CollectionCommentRepository(session)
+    participant_repository = ParticipantRepository(session)
+    user_repository = UserRepository(session)
+    genre_repository = GenreRepository(session)
+    country_repository = CountryRepository(session)
+    calendar_repository = CalendarRepository(session)
+    preference_repository = UserPreferenceRepository(session)
+
+    return [
+        ("movie.get_movie", lambda: movie_repository.get_movie(movie.title, movie.year, movie.running_time)),
+        ("movie.search_movie_list(chart)", lambda: list(movie_repository.search_movie_list(chart_type="box_office"))),
+        ("review.get_review_by_user_and_movie", lambda: review_repository.get_review_by_user_and_movie(user.id, movie.id)),
+        ("review.get_reviews_by_movie_id", lambda: review_repository.get_reviews_by_movie_id(movie.id)),
+        *[
+            (f"review.get_reviews_by_movie_id({sort})", lambda sort=sort: review_repository.get_reviews_by_movie_id(movie.id, Pagination(0, 20), sort))
+            for sort in REVIEW_SORT_ORDERS
+        ],
+        ("review.get_reviews_count_by_movie_id", lambda: review_repository.get_reviews_count_by_movie_id(movie.id)),
+        ("review.get_reviews_by_user_id", lambda: review_repository.get_reviews_by_user_id(user.id)),
+        ("review.like_info", lambda: review_repository.like_info(user.id, review)),
+        ("review.get_liked_review_ids", lambda: review_repository.get_liked_review_ids(user.id, [review.id])),
+        ("review.get_like_review_list", lambda: review_repository.get_like_review_list(user.id)),
+        ("review.get_view_dates_by_review_ids", lambda: review_repository.get_view_dates_by_review_ids([review.id])),
+        ("calendar.get_movie_id_by_date", lambda: calendar_repository.get_movie_id_by_date(user.id, date(2025, 1, 1), date(2025, 12, 31))),
+        ("calendar.get_daily_stats", lambda: calendar_repository.get_daily_stats(user.id, 2025)),
+        ("comment.get_comment_by_user_and_review", lambda: comment_repository.get_comment_by_user_and_review(user.id, review.id)),
+        ("comment.get_comments_by_review_id", lambda: comment_repository.get_comments_by_review_id(review.id)),
+        ("comment.get_comments_count_by_review_id", lambda: comment_repository.get_comments_count_by_review_id(review.id)),
+        ("comment.get_comments_counts_by_review_ids", lambda: comment_repository.get_comments_counts_by_review_ids([review.id])),
+        ("comment.like_info", lambda: comment_repository.like_info(user.id, comment)),
+        ("collection.like_info", lambda: collection_repository.like_info(user.id, collection)),
+        ("collection.get_collections_by_user_id", lambda: collection_repository.get_collections_by_user_id(user.id)),
+        ("collection_comment.get_comments", lambda: collection_comment_repository.get_comments(collection.id)),
+        ("collection_comment.like_info", lambda: collection_comment_repository.like_info(user.id, collection_comment)),
+        ("participant.get_participant", lambda: participant_repository.get_participant(participant.name, participant.profile_url)),
+        ("participant.like_info", lambda: participant_repository.like_info(user.id, participant)),
+        ("participant.get_participant_roles", lambda: participant_repository.get_participant_roles(participant.id)),
+        ("user.get_followers", lambda: user_repository.get_followers(user.id)),
+        ("user.get_followers_count", lambda: user_repository.get_followers_count(user.id)),
+        ("user.get_followings_count", lambda: user_repository.get_followings_count(user.id)),
+        ("user.is_blocked", lambda: user_repository.is_blocked(user.id, user.id)),
+        ("genre.get_genre_by_genre_name", lambda: genre_repository.get_genre_by_genre_name("드라마")),
+        ("country.get_country_by_country_name", lambda: country_repository.get_country_by_country_name("한국")),
+        ("analysis.get_preference_entries", lambda: preference_repository.get_preference_entries(user.id, "actor")),
+        ("analysis.get_top_fans", lambda: preference_repository.get_top_fans("director", participant.id, Pagination(0, 20))),
+    ]
+
+
+def explain(session: Session, name: str, call: Callable[[], Any]) -> None:
+    captured: list[tuple[str, Any]] = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            captured.append((statement, parameters))
+
+    connection = session.connection()
+    engine = connection.engine
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        call()
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+    prefix = "EXPLAIN QUERY PLAN " if engine.dialect.name == "sqlite" else "EXPLAIN "
+    print(f"== {name}")
+    for statement, parameters in captured:
+        print(statement.strip())
+        result = connection.exec_driver_sql(prefix + statement, parameters)
+        columns = list(result.keys())
+        for row in result:
+            print("   ", ", ".join(f"{column}={value}" for column, value in zip(columns, row)))
+    print()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="리포지토리 쿼리의 EXPLAIN 결과를 출력합니다.")
+    parser.add_argument("--only", help="이름이 이 문자열로 시작하는 쿼리만 출력 (예: review)")
+    args = parser.parse_args()
+
+    session = get_db_manager().session_factory()
+    try:
+        for name, call in build_cases(session):
+            if args.only and not name.startswith(args.only):
+                continue
+            explain(session, name, call)
+    finally:
+        session.rollback()
+        session.close()
+
+
+if __name__ == "__main__":
+    main()
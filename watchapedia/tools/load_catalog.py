@@ -0,0 +1,172 @@
+"""
+영화 카탈로그 덤프(CSV/JSONL)를 HTTP 계층을 거치지 않고 DB에 바로 적재합니다.
+
+디렉터리 안의 <테이블명>.csv 또는 <테이블명>.jsonl 파일을 FK 순서대로 읽어
+Core bulk insert(executemany)로 batch 단위 적재합니다. 덤프에 id가 포함되어 있으면 그대로 사용합니다.
+movie를 적재한 뒤에는 통계 row가 없는 영화마다 빈 movie_stats row를 만듭니다.
+
+    python -m watchapedia.tools.load_catalog ./dump --batch-size 5000 --workers 4 --no-fk-checks
+"""
+import argparse
+import csv
+import json
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Callable, Iterator
+from sqlalchemy import Column, Connection, Engine, Table, exists, literal, select, text
+
+import watchapedia.database  # noqa: F401 - 모든 모델 등록
+from watchapedia.database.common import Base
+from watchapedia.database.connection import get_db_manager
+from watchapedia.app.movie.models import Movie, MovieStats
+
+# FK 순서. 부모 테이블이 먼저 적재되어야 합니다.
+CATALOG_TABLES = [
+    "genre",
+    "country",
+    "participant",
+    "movie",
+    "movie_genre",
+    "movie_country",
+    "movie_participant",
+    "chart",
+]
+
+
+def _converter(column: Column) -> Callable[[Any], Any]:
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        python_type = str
+
+    def convert(value: Any) -> Any:
+        # CSV의 빈 칸은 NULL로 취급
+        if value is None or value == "":
+            return None
+        if not isinstance(value, str) or python_type is str:
+            return value
+        if python_type is bool:
+            return value.strip().lower() in ("1", "true", "t", "y", "yes")
+        if python_type is datetime:
+            return datetime.fromisoformat(value)
+        if python_type is date:
+            return date.fromisoformat(value)
+        if python_type in (dict, list):
+            return json.loads(value)
+        return python_type(value)
+
+    return convert
+
+
+def _find_dump(directory: Path, table_name: str) -> Path | None:
+    for suffix in (".jsonl", ".csv"):
+        path = directory / f"{table_name}{suffix}"
+        if path.exists():
+            return path
+    return None
+
+
+def _read_rows(path: Path) -> Iterator[dict[str, Any]]:
+    with path.open(encoding="utf-8", newline="") as f:
+        if path.suffix == ".csv":
+            yield from csv.DictReader(f)
+        else:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+
+def _read_batches(path: Path, table: Table, batch_size: int) -> Iterator[list[dict[str, Any]]]:
+    converters = {column.name: _converter(column) for column in table.columns}
+    batch = []
+    for row in _read_rows(path):
+        # 테이블에 없는 컬럼은 무시
+        batch.append({name: converters[name](value) for name, value in row.items() if name in converters})
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _set_fk_checks(connection: Connection, enabled: bool) -> None:
+    if connection.dialect.name == "mysql":
+        connection.execute(text(f"SET FOREIGN_KEY_CHECKS = {int(enabled)}"))
+
+
+def _insert_batch(engine: Engine, table: Table, batch: list[dict[str, Any]], fk_checks: bool) -> int:
+    with engine.begin() as connection:
+        if not fk_checks:
+            _set_fk_checks(connection, False)
+        connection.execute(table.insert(), batch)
+        if not fk_checks:
+            # 풀로 돌아가는 커넥션의 세션 변수 원복
+            _set_fk_checks(connection, True)
+    return len(batch)
+
+
+def load_table(
+    engine: Engine, executor: ThreadPoolExecutor, path: Path, table: Table, batch_size: int, workers: int, fk_checks: bool
+) -> int:
+    loaded = 0
+    pending: set[Future] = set()
+    for batch in _read_batches(path, table, batch_size):
+        # 파일 전체를 메모리에 올리지 않도록 진행 중인 batch 수를 제한
+        if len(pending) >= workers * 2:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            loaded += sum(future.result() for future in done)
+        pending.add(executor.submit(_insert_batch, engine, table, batch, fk_checks))
+    loaded += sum(future.result() for future in wait(pending).done)
+    return loaded
+
+
+def build_movie_stats(engine: Engine) -> int:
+    """
+    movie_stats row가 없는 영화에 리뷰 0개 기준의 통계 row를 INSERT ... SELECT 로 만듭니다.
+    덤프의 average_rating은 그대로 두고, 첫 리뷰부터는 리뷰 통계로 평균을 계산합니다.
+    """
+    missing_movie_ids = select(
+        Movie.id, literal(0.0), literal(0), literal(0), literal("{}")
+    ).where(~exists().where(MovieStats.movie_id == Movie.id))
+    with engine.begin() as connection:
+        return connection.execute(
+            MovieStats.__table__.insert().from_select(
+                ["movie_id", "rating_sum", "rating_count", "review_count", "rating_dist"], missing_movie_ids
+            )
+        ).rowcount
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="영화 카탈로그 덤프(CSV/JSONL)를 DB에 bulk insert 합니다.")
+    parser.add_argument("directory", type=Path, help="<테이블명>.csv / <테이블명>.jsonl 파일이 있는 디렉터리")
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument("--workers", type=int, default=1, help="테이블마다 batch를 병렬로 insert 할 worker 수")
+    parser.add_argument("--tables", nargs="+", choices=CATALOG_TABLES, default=CATALOG_TABLES)
+    parser.add_argument("--no-fk-checks", action="store_true", help="적재 중 FK 검사를 끕니다. (MySQL)")
+    args = parser.parse_args()
+
+    engine = get_db_manager().engine
+    with ThreadPoolExecutor(max_workers=args.workers) as executor:
+        for table_name in CATALOG_TABLES:
+            if table_name not in args.tables:
+                continue
+            path = _find_dump(args.directory, table_name)
+            if path is None:
+                print(f"{table_name}: 덤프 파일 없음, 건너뜀")
+                continue
+            start = time.perf_counter()
+            loaded = load_table(
+                engine, executor, path, Base.metadata.tables[table_name],
+                args.batch_size, args.workers, not args.no_fk_checks
+            )
+            print(f"{table_name}: {loaded} rows ({time.perf_counter() - start:.2f}s)")
+            if table_name == "movie":
+                start = time.perf_counter()
+                created = build_movie_stats(engine)
+                print(f"movie_stats: {created} rows ({time.perf_counter() - start:.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+리뷰 전체에서 유저별 선호도 집계(user_entity_stats), 별점 통계(user_rating)와 선호도 점수(user_preference_entry)를 다시 만듭니다.
+
+유저 한 명씩 짧은 트랜잭션으로 나누어 실행하므로 서비스 중에도 실행할 수 있습니다.
+같은 유저의 리뷰가 실행 도중 변경되면 해당 변경은 다음 재계산 때 반영됩니다.
+
+    python -m watchapedia.tools.rebuild_preferences --users 1 2 3
+"""
+import argparse
+from sqlalchemy import select
+
+import watchapedia.database  # noqa: F401 - 모든 모델 등록
+from watchapedia.database.connection import session_scope
+from watchapedia.database.routing import use_primary
+from watchapedia.app.user.models import User
+from watchapedia.app.analysis.repository import UserRatingRepository, UserPreferenceRepository
+from watchapedia.app.analysis.service import UserRatingService
+from watchapedia.app.analysis.worker import recompute_user_analysis
+
+
+def rebuild(user_id: int) -> None:
+    with session_scope() as session:
+        use_primary(session)
+        UserPreferenceRepository(session).rebuild_entity_stats(user_id)
+        UserRatingService(UserRatingRepository(session)).update_rating(user_id)
+        # 선호도 점수는 재계산 큐와 같은 방식으로 다시 계산
+        recompute_user_analysis(session, user_id)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="리뷰 기준으로 유저별 선호도 집계와 점수를 다시 만듭니다.")
+    parser.add_argument("--users", type=int, nargs="+", help="다시 만들 유저 id (생략하면 전체 유저)")
+    args = parser.parse_args()
+
+    user_ids = args.users
+    if user_ids is None:
+        with session_scope() as session:
+            user_ids = list(session.scalars(select(User.id).order_by(User.id)))
+    for user_id in user_ids:
+        rebuild(user_id)
+    print(f"{len(user_ids)} users rebuilt")
+
+
+if __name__ == "__main__":
+    main()
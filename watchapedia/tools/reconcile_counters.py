@@ -0,0 +1,62 @@
+"""
+좋아요 테이블에서 likes_count를 다시 계산해 어긋난 값을 바로잡습니다.
+
+id 구간(batch) 단위로 짧은 트랜잭션을 나누어 실행하므로 서비스 중에도 실행할 수 있습니다.
+서버의 write-behind 버퍼에 남아 있던 delta(최대 flush 주기만큼)는 이후에 더해지므로 트래픽이 적을 때 실행하세요.
+
+    python -m watchapedia.tools.reconcile_counters --tables review comment --dry-run
+"""
+import argparse
+from typing import Any
+from sqlalchemy import Engine, func, select, update
+
+import watchapedia.database  # noqa: F401 - 모든 모델 등록
+from watchapedia.database.connection import get_db_manager
+from watchapedia.app.review.models import Review, UserLikesReview
+from watchapedia.app.comment.models import Comment, UserLikesComment
+from watchapedia.app.collection.models import Collection, UserLikesCollection
+from watchapedia.app.collection_comment.models import CollectionComment, UserLikesCollectionComment
+from watchapedia.app.participant.models import Participant, UserLikesParticipant
+
+# 테이블명: (likes_count를 가진 모델, 좋아요 테이블의 대상 컬럼)
+LIKE_COUNTERS: dict[str, tuple[Any, Any]] = {
+    "review": (Review, UserLikesReview.review_id),
+    "comment": (Comment, UserLikesComment.comment_id),
+    "collection": (Collection, UserLikesCollection.collection_id),
+    "collection_comment": (CollectionComment, UserLikesCollectionComment.collection_comment_id),
+    "participant": (Participant, UserLikesParticipant.participant_id),
+}
+
+
+def reconcile(engine: Engine, model: Any, like_column: Any, batch_size: int, dry_run: bool) -> int:
+    actual_count = select(func.count()).where(like_column == model.id).scalar_subquery()
+    fixed = 0
+    with engine.connect() as connection:
+        max_id = connection.scalar(select(func.max(model.id))) or 0
+
+    for start in range(1, max_id + 1, batch_size):
+        condition = model.id.between(start, start + batch_size - 1) & (model.likes_count != actual_count)
+        with engine.begin() as connection:
+            if dry_run:
+                fixed += connection.scalar(select(func.count()).select_from(model).where(condition))
+            else:
+                fixed += connection.execute(update(model).where(condition).values(likes_count=actual_count)).rowcount
+    return fixed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="좋아요 테이블 기준으로 likes_count를 다시 계산합니다.")
+    parser.add_argument("--tables", nargs="+", choices=LIKE_COUNTERS, default=list(LIKE_COUNTERS))
+    parser.add_argument("--batch-size", type=int, default=10000, help="한 트랜잭션에서 검사할 id 구간 크기")
+    parser.add_argument("--dry-run", action="store_true", help="수정하지 않고 어긋난 row 수만 출력합니다.")
+    args = parser.parse_args()
+
+    engine = get_db_manager().engine
+    for table_name in args.tables:
+        model, like_column = LIKE_COUNTERS[table_name]
+        fixed = reconcile(engine, model, like_column, args.batch_size, args.dry_run)
+        print(f"{table_name}: {fixed} rows {'mismatched' if args.dry_run else 'fixed'}")
+
+
+if __name__ == "__main__":
+    main()
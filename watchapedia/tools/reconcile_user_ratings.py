@@ -0,0 +1,51 @@
+"""
+리뷰 전체에서 user_rating의 별점 수/합/분포와 시청 시간을 다시 계산해 어긋난 값을 바로잡습니다.
+
+user_rating은 리뷰 작성/수정/삭제 때 증감분으로만 갱신되므로, 영화 상영 시간이 바뀌거나 반영이 누락되면 값이 어긋날 수 있습니다.
+통계가 맞더라도 저장된 평균/최빈값/메시지가 현재 계산 결과와 다르면 (메시지 문구 변경 등) 함께 다시 계산합니다.
+user_id 구간(batch) 단위로 짧은 트랜잭션을 나누어 실행하므로 서비스 중에도 실행할 수 있습니다.
+트래픽이 적은 시간에 주기적으로 (cron 등) 실행하세요.
+
+    python -m watchapedia.tools.reconcile_user_ratings --batch-size 1000 --dry-run
+"""
+import argparse
+from sqlalchemy import func, select
+
+import watchapedia.database  # noqa: F401 - 모든 모델 등록
+from watchapedia.database.connection import session_scope
+from watchapedia.database.routing import use_primary
+from watchapedia.app.analysis.models import UserRating
+from watchapedia.app.analysis.repository import UserRatingRepository
+from watchapedia.app.analysis.service import UserRatingService
+
+
+def reconcile(batch_size: int, dry_run: bool) -> int:
+    with session_scope() as session:
+        max_user_id = session.scalar(select(func.max(UserRating.user_id))) or 0
+
+    fixed = 0
+    for start in range(1, max_user_id + 1, batch_size):
+        with session_scope() as session:
+            use_primary(session)
+            user_ids = list(session.scalars(
+                select(UserRating.user_id).where(UserRating.user_id.between(start, start + batch_size - 1))
+            ))
+            if user_ids:
+                fixed += UserRatingService(UserRatingRepository(session)).reconcile_rating_stats(user_ids, dry_run)
+            if dry_run:
+                session.rollback()
+    return fixed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="리뷰 기준으로 user_rating 통계를 다시 계산합니다.")
+    parser.add_argument("--batch-size", type=int, default=1000, help="한 트랜잭션에서 검사할 user_id 구간 크기")
+    parser.add_argument("--dry-run", action="store_true", help="수정하지 않고 어긋난 유저 수만 출력합니다.")
+    args = parser.parse_args()
+
+    fixed = reconcile(args.batch_size, args.dry_run)
+    print(f"user_rating: {fixed} rows {'mismatched' if args.dry_run else 'fixed'}")
+
+
+if __name__ == "__main__":
+    main()